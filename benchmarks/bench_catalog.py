@@ -0,0 +1,80 @@
+"""Benchmark server startup, list_tools latency and each profile's listing.
+
+Startup (importing the server and loading a profile's tools) is measured in
+fresh interpreters. list_tools is timed the way
+mcp answers it: the request handler, model_dump() of the result in the
+session, then the JSON-RPC message encoded by the stdio writer. Run:
+PROXMOX_HOST=x python benchmarks/bench_catalog.py [rounds]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from mcp.types import JSONRPCMessage, JSONRPCResponse, ListToolsRequest
+
+from proxmox_mcp import catalog, server
+
+STARTUP = (
+    "import time; t = time.perf_counter(); import proxmox_mcp.server as s; "
+    "s.load_tools({profile!r}); print(time.perf_counter() - t)"
+)
+
+
+def startup_time(profile: str, runs: int) -> float:
+    env = {**os.environ, "PROXMOX_HOST": os.environ.get("PROXMOX_HOST", "x")}
+    command = [sys.executable, "-c", STARTUP.format(profile=profile)]
+    samples = [
+        float(subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout)
+        for _ in range(runs)
+    ]
+    return statistics.median(samples)
+
+
+async def list_tools() -> int:
+    handler = server.app.request_handlers[ListToolsRequest]
+    result = await handler(ListToolsRequest(method="tools/list"))
+    dumped = result.model_dump(by_alias=True, mode="json", exclude_none=True)
+    message = JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id=1, result=dumped))
+    return len(message.model_dump_json(by_alias=True, exclude_none=True))
+
+
+async def bench(rounds: int) -> None:
+    size = await list_tools()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await list_tools()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"list_tools                 {elapsed * 1000:8.2f} ms/call {size / 1024:8.1f} KiB")
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'profile':<18} {'tools':>5} {'startup':>10} {'listing':>11}")
+    for profile in ("all", "readonly", "compute", "storage", "network", "admin", "qemu"):
+        server.load_tools(profile)
+        size = asyncio.run(list_tools())
+        print(
+            f"{profile:<18} {len(server.ALL_TOOLS):5} {startup_time(profile, 3) * 1000:7.1f} ms"
+            f" {size / 1024:7.1f} KiB"
+        )
+    server.load_tools("all")
+    modules = list(server.CATALOG)
+    start = time.perf_counter()
+    catalog.load(modules)
+    print(f"catalogue from artifact    {(time.perf_counter() - start) * 1000:8.2f} ms")
+    start = time.perf_counter()
+    catalog.build(modules)
+    print(
+        f"catalogue from modules     {(time.perf_counter() - start) * 1000:8.2f} ms (already imported)"
+    )
+    asyncio.run(bench(rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark cold start: spawn to MCP initialize response, and to the first tools/list.
+
+The server runs as a subprocess against a local listener that accepts
+connections and never answers, i.e. a Proxmox API that is slow or down.
+Run: python benchmarks/bench_cold_start.py [rounds] [checkout]
+(``checkout`` is another source tree to compare, e.g. a git worktree.)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def _stalled(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    await reader.read()
+    writer.close()
+
+
+def _message(**fields: object) -> bytes:
+    return json.dumps({"jsonrpc": "2.0", **fields}).encode() + b"\n"
+
+
+async def _response(process: asyncio.subprocess.Process, request_id: int) -> dict:
+    assert process.stdout is not None
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            raise RuntimeError("server exited before responding")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+AUTH = {
+    "password": {"PROXMOX_PASSWORD": "secret"},
+    "token": {"PROXMOX_TOKEN_NAME": "bench", "PROXMOX_TOKEN_VALUE": "secret"},
+}
+
+
+async def cold_start(tree: Path, port: int, auth: str) -> tuple[float, float]:
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith("PROXMOX_") or name == "PROXMOX_PROFILE"
+    }
+    env.update(
+        PYTHONPATH=str(tree),
+        PROXMOX_HOST="127.0.0.1",
+        PROXMOX_PORT=str(port),
+        PROXMOX_USER="root@pam",
+        PROXMOX_TIMEOUT="2",
+        PROXMOX_RETRIES="0",
+        **AUTH[auth],
+    )
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "proxmox_mcp.server",
+        cwd=tree,
+        env=env,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        limit=16 * 1024 * 1024,  # the tools/list response is one ~340 KB line
+    )
+    assert process.stdin is not None
+    try:
+        process.stdin.write(
+            _message(
+                id=1,
+                method="initialize",
+                params={
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "bench", "version": "0"},
+                },
+            )
+        )
+        await process.stdin.drain()
+        await asyncio.wait_for(_response(process, 1), 30)
+        initialized = time.perf_counter() - start
+        process.stdin.write(_message(method="notifications/initialized"))
+        process.stdin.write(_message(id=2, method="tools/list"))
+        await process.stdin.drain()
+        await asyncio.wait_for(_response(process, 2), 30)
+        listed = time.perf_counter() - start
+    finally:
+        process.kill()
+        await process.wait()
+    return initialized, listed
+
+
+async def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    trees = [ROOT] + [Path(arg).resolve() for arg in sys.argv[2:]]
+    listener = await asyncio.start_server(_stalled, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        print(f"{'tree':<32} {'auth':<9} {'initialize':>12} {'tools/list':>12}")
+        for tree in trees:
+            for auth in AUTH:
+                try:
+                    samples = [await cold_start(tree, port, auth) for _ in range(rounds)]
+                except RuntimeError as e:
+                    print(f"{str(tree):<32} {auth:<9} {e}")
+                    continue
+                initialized = statistics.median(s[0] for s in samples) * 1000
+                listed = statistics.median(s[1] for s in samples) * 1000
+                print(f"{str(tree):<32} {auth:<9} {initialized:>10.0f}ms {listed:>10.0f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
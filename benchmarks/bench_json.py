@@ -0,0 +1,87 @@
+"""Benchmark tool-result JSON handling: stdlib pretty (old path) vs the fast backend.
+
+Builds a synthetic /cluster/resources payload and times decode + encode for
+each mode, reporting payload size and how long a client takes to parse the
+result. Run: python benchmarks/bench_json.py [guests]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+
+from proxmox_mcp import jsonlib, shaping
+
+
+def cluster_resources(guests: int) -> bytes:
+    rows = []
+    for i in range(guests):
+        kind = "qemu" if i % 3 else "lxc"
+        rows.append(
+            {
+                "id": f"{kind}/{100 + i}",
+                "type": kind,
+                "vmid": 100 + i,
+                "name": f"guest-{i:05d}",
+                "node": f"pve{i % 24:02d}",
+                "status": "running" if i % 7 else "stopped",
+                "cpu": 0.0123 * (i % 50),
+                "maxcpu": 1 + i % 16,
+                "mem": 512 * 1024 * 1024 + i * 4096,
+                "maxmem": 4 * 1024**3,
+                "disk": 0,
+                "maxdisk": 32 * 1024**3,
+                "netin": i * 1000,
+                "netout": i * 900,
+                "diskread": i * 5000,
+                "diskwrite": i * 4000,
+                "uptime": 86400 + i,
+                "template": 0,
+                "tags": "prod;web" if i % 2 else "",
+            }
+        )
+    return json.dumps({"data": rows}).encode()
+
+
+def bench(label: str, body: bytes, decode, encode, rounds: int) -> None:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        text = encode(decode(body))
+    elapsed = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse(text)
+    parsed = (time.perf_counter() - start) / rounds
+    print(
+        f"{label:<28} {elapsed * 1000:8.2f} ms/call {len(text.encode()) / 1024:10.1f} KiB"
+        f" {parsed * 1000:8.2f} ms client parse"
+    )
+
+
+def parse(text: str) -> object:
+    # What a client does with the result; tsv is split into cells.
+    if text.startswith("{"):
+        return json.loads(text)
+    return [line.split("\t") for line in text.split("\n")]
+
+
+def render(output: str):
+    return lambda obj: asyncio.run(shaping.render(obj, output))
+
+
+def main() -> None:
+    guests = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    body = cluster_resources(guests)
+    rounds = 20
+    print(f"{guests} guests, raw body {len(body) / 1024:.1f} KiB, backend={jsonlib.BACKEND}")
+    bench("stdlib pretty (before)", body, json.loads, lambda o: json.dumps(o, indent=2), rounds)
+    bench("backend pretty", body, jsonlib.loads, lambda o: jsonlib.dumps(o, pretty=True), rounds)
+    bench("backend compact", body, jsonlib.loads, jsonlib.dumps, rounds)
+    bench("output=table", body, jsonlib.loads, render("table"), rounds)
+    bench("output=tsv", body, jsonlib.loads, render("tsv"), rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark per-call tool argument validation.
+
+Compares what mcp does for every call (jsonschema.validate against the
+advertised inputSchema), a jsonschema validator built once, and the
+validators generated by proxmox_mcp.validation. Run:
+PROXMOX_HOST=x python benchmarks/bench_validation.py [rounds]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from functools import partial
+
+import jsonschema
+
+from proxmox_mcp import server
+from proxmox_mcp.validation import compile_validator
+
+CALLS = {
+    "get_vm_status": {"node": "pve01", "vmid": 101},
+    "get_vm_config": {"node": "pve01", "vmid": "101", "current": True},
+    "create_vm": {
+        "node": "pve01",
+        "vmid": 250,
+        "name": "web-01",
+        "memory": 4096,
+        "cores": 4,
+        "sockets": 1,
+        "net0": "virtio,bridge=vmbr0",
+        "scsi0": "local-lvm:32",
+        "ostype": "l26",
+        "start": True,
+    },
+}
+
+
+def bench(label: str, fn, rounds: int) -> None:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"  {label:<26} {elapsed * 1e6:10.2f} us/call")
+
+
+def _fresh(validator, args: dict) -> dict:
+    return validator(dict(args))
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server.load_tools("all")
+    tools = {t.name: t for t in server.ALL_TOOLS}
+    schemas = list(server.TOOL_SCHEMAS.values())
+    start = time.perf_counter()
+    for schema in schemas:
+        compile_validator(schema)
+    elapsed = time.perf_counter() - start
+    print(
+        f"compile all {len(schemas)} validators: {elapsed * 1000:.1f} ms"
+        f" ({elapsed / len(schemas) * 1000:.2f} ms each, paid on a tool's first call)"
+    )
+    for name, args in CALLS.items():
+        schema = tools[name].inputSchema
+        print(f"{name} ({len(schema['properties'])} properties)")
+        typed = {**args, "vmid": int(args["vmid"])} if "vmid" in args else args
+        prebuilt = jsonschema.validators.validator_for(schema)(schema)
+        compiled = server.TOOL_VALIDATORS[name]
+        bench("jsonschema.validate", partial(jsonschema.validate, typed, schema), rounds // 20)
+        bench("jsonschema, prebuilt", partial(prebuilt.validate, typed), rounds)
+        # Copy the arguments each call so string values are coerced every time.
+        bench("compiled", partial(_fresh, compiled, args), rounds * 10)
+
+
+if __name__ == "__main__":
+    main()
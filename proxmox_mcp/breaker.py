@@ -0,0 +1,70 @@
+"""Circuit breaker so a sick node or endpoint fails fast instead of timing out every call."""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(Exception):
+    """Raised without touching the network while a breaker is open."""
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures.
+
+    After ``cooldown`` seconds it is half-open and lets a single probe
+    through; the probe's outcome closes it again or restarts the cooldown.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if time.monotonic() < self.opened_at + self.cooldown:
+            return OPEN
+        return HALF_OPEN
+
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        # Half-open: one probe at a time. A probe that never reported back
+        # (e.g. cancelled) stops blocking after another cooldown.
+        now = time.monotonic()
+        if self.probe_started is not None and now < self.probe_started + self.cooldown:
+            return False
+        self.probe_started = now
+        return True
+
+    def success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started = None
+
+    def failure(self) -> None:
+        self.failures += 1
+        self.probe_started = None
+        if self.opened_at is not None or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict[str, object]:
+        return {"state": self.state, "failures": self.failures}
@@ -0,0 +1,126 @@
+"""TTL + LRU cache for raw GET response bodies, bounded by total bytes."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+# (path regex, TTL seconds). First match wins; unmatched paths are not cached.
+DEFAULT_TTLS: list[tuple[str, float]] = [
+    (r"^/version$", 3600),
+    (r"^/cluster/firewall/macros$", 3600),
+    (r"^/cluster/acme/challenge-schema$", 3600),
+    (r"^/cluster/acme/(directories|plugins|tos)$", 600),
+    (r"^/nodes/[^/]+/capabilities/", 3600),
+    (r"^/nodes/[^/]+/version$", 600),
+    (r"^/access/(roles|domains)(/|$)", 300),
+    (r"^/access/(users|groups|acl)(/|$)", 30),
+    (r"^/(storage|pools|cluster/sdn|cluster/firewall/(groups|aliases|ipset))(/|$)", 30),
+    # No guest paths: a rollback, migration or clone changes the guest for as long
+    # as its task runs, long after the POST that started it evicted the cache.
+]
+
+# A guest's state hangs together: a snapshot rollback, migration or restore
+# changes its config and status, not just the snapshot list.
+_GUEST = re.compile(r"^/nodes/[^/]+/(qemu|lxc)/\d+(?=/|$)")
+
+
+def parse_ttls(spec: str) -> list[tuple[str, float]]:
+    """Parse ``"regex=seconds,regex=seconds"`` into TTL rules."""
+    rules = []
+    for item in spec.split(","):
+        pattern, sep, seconds = item.strip().rpartition("=")
+        if sep and pattern:
+            rules.append((pattern, float(seconds)))
+    return rules
+
+
+def cache_key(path: str, params: Optional[dict[str, Any]]) -> str:
+    if not params:
+        return path
+    return path + "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int, ttls: list[tuple[str, float]]) -> None:
+        self.max_bytes = max_bytes
+        self.rules = [(re.compile(p), ttl) for p, ttl in ttls]
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        # Bumped on every invalidation so a GET that raced a mutation is not stored.
+        self.generation = 0
+        # key -> (path, expires_at, body)
+        self._entries: OrderedDict[str, tuple[str, float, bytes]] = OrderedDict()
+
+    def ttl_for(self, path: str) -> float:
+        if self.max_bytes <= 0:
+            return 0
+        for pattern, ttl in self.rules:
+            if pattern.search(path):
+                return ttl
+        return 0
+
+    def get(self, path: str, params: Optional[dict[str, Any]]) -> Optional[bytes]:
+        key = cache_key(path, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[1] <= time.monotonic():
+            self._drop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(
+        self, path: str, params: Optional[dict[str, Any]], body: bytes, generation: int
+    ) -> None:
+        ttl = self.ttl_for(path)
+        if ttl <= 0 or len(body) > self.max_bytes or generation != self.generation:
+            return
+        key = cache_key(path, params)
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (path, time.monotonic() + ttl, body)
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, path: str) -> None:
+        """Evict everything a mutation of ``path`` may have changed.
+
+        That is the subtree under the mutated object's parent (so a PUT to
+        ``.../100/config`` also drops ``.../100/pending``) plus every exact
+        ancestor listing such as ``/nodes/x/qemu``. Anything under a guest
+        (``/nodes/x/qemu/100/...``) drops that guest's whole subtree.
+        """
+        self.generation += 1
+        parts = path.rstrip("/").split("/")
+        guest = _GUEST.match(path)
+        parent = guest.group(0) if guest else "/".join(parts[:-1]) or "/"
+        ancestors = {"/".join(parts[:i]) for i in range(2, len(parts))}
+        subtree = parent.rstrip("/") + "/"
+        for key, (p, _, _) in list(self._entries.items()):
+            if p == parent or p.startswith(subtree) or p in ancestors:
+                self._drop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _drop(self, key: str) -> None:
+        _, _, body = self._entries.pop(key)
+        self.size -= len(body)
@@ -0,0 +1,77 @@
+"""Tool catalogue: every tool module's definitions, read from a generated JSON artifact.
+
+``catalog.json`` ships inside the package and is regenerated from the tool
+modules with ``python -m proxmox_mcp.catalog``. Each module's entry carries
+its tool definitions, the names of its state-changing tools and a digest of
+the module's source, so an edited module whose entry was not regenerated is
+detected and read from the module itself instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+from . import jsonlib
+
+PATH = Path(__file__).with_name("catalog.json")
+TOOLS_DIR = Path(__file__).with_name("tools")
+
+
+def _digest(module: str) -> Optional[str]:
+    try:
+        return hashlib.sha256((TOOLS_DIR / f"{module}.py").read_bytes()).hexdigest()[:16]
+    except OSError:
+        return None
+
+
+def _from_module(module: str) -> dict[str, Any]:
+    mod = importlib.import_module(f"{__package__}.tools.{module}")
+    # Tools that change state; plain-function routes are all reads.
+    writes = [name for name, spec in mod.ROUTES.items() if getattr(spec, "method", "GET") != "GET"]
+    return {"digest": _digest(module), "tools": mod.TOOLS, "writes": writes}
+
+
+def load(modules: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Each module's ``tools`` definitions and ``writes`` tool names, from the
+    artifact wherever its entry is current."""
+    try:
+        stored = jsonlib.loads(PATH.read_bytes())
+    except (OSError, ValueError):
+        stored = {}
+    catalog: dict[str, dict[str, Any]] = {}
+    stale = []
+    for module in modules:
+        entry = stored.get(module)
+        if entry is None or entry["digest"] is None or entry["digest"] != _digest(module):
+            stale.append(module)
+            entry = _from_module(module)
+        catalog[module] = entry
+    if stale:
+        print(
+            f"⚠ Tool catalogue out of date for {', '.join(stale)};"
+            " regenerate it with: python -m proxmox_mcp.catalog",
+            file=sys.stderr,
+        )
+    return catalog
+
+
+def build(modules: Iterable[str]) -> dict[str, Any]:
+    return {module: _from_module(module) for module in modules}
+
+
+def main() -> None:
+    modules = sorted(p.stem for p in TOOLS_DIR.glob("*.py") if p.stem != "__init__")
+    catalog = build(modules)
+    PATH.write_text(json.dumps(catalog, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    count = sum(len(entry["tools"]) for entry in catalog.values())
+    print(f"✓ Wrote {count} tools from {len(catalog)} modules to {PATH}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import os
+import re
 import sys
-from typing import Any, Optional
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Optional, Union
 
 import httpx
 
+from . import jsonlib
+from .breaker import OPEN, CircuitBreaker, CircuitOpenError
+from .cache import DEFAULT_TTLS, ResponseCache, cache_key, parse_ttls
+from .endpoints import Endpoint, EndpointPool, parse_hosts
+from .limiter import INTERACTIVE, PRIORITY_WEIGHTS, AIMDLimiter
+from .retry import RetryPolicy, parse_statuses
+from .ticket_cache import TicketCache
+
 PROXMOX_HOST = os.getenv("PROXMOX_HOST", "")
 PROXMOX_PORT = os.getenv("PROXMOX_PORT", "8006")
 PROXMOX_USER = os.getenv("PROXMOX_USER", "")
@@ -15,10 +30,69 @@ PROXMOX_TOKEN_NAME = os.getenv("PROXMOX_TOKEN_NAME", "")
 PROXMOX_TOKEN_VALUE = os.getenv("PROXMOX_TOKEN_VALUE", "")
 PROXMOX_PASSWORD = os.getenv("PROXMOX_PASSWORD", "")
 PROXMOX_VERIFY_SSL = os.getenv("PROXMOX_VERIFY_SSL", "false").lower() == "true"
+PROXMOX_MAX_PARALLEL = int(os.getenv("PROXMOX_MAX_PARALLEL", "8"))
+PROXMOX_CACHE_MAX_BYTES = int(os.getenv("PROXMOX_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+PROXMOX_CACHE_TTLS = os.getenv("PROXMOX_CACHE_TTLS", "")
+# Streaming tools parse smaller bodies (by uncompressed Content-Length) in one go.
+PROXMOX_STREAM_BYTES = int(os.getenv("PROXMOX_STREAM_BYTES", str(1024 * 1024)))
+
+# Transport tuning. PROXMOX_TIMEOUT is the default for every phase.
+PROXMOX_HTTP2 = os.getenv("PROXMOX_HTTP2", "false").lower() == "true"
+PROXMOX_MAX_CONNECTIONS = int(os.getenv("PROXMOX_MAX_CONNECTIONS", "20"))
+PROXMOX_MAX_KEEPALIVE = int(os.getenv("PROXMOX_MAX_KEEPALIVE", "10"))
+PROXMOX_KEEPALIVE_EXPIRY = float(os.getenv("PROXMOX_KEEPALIVE_EXPIRY", "30"))
+PROXMOX_TIMEOUT = float(os.getenv("PROXMOX_TIMEOUT", "30"))
+PROXMOX_CONNECT_TIMEOUT = float(os.getenv("PROXMOX_CONNECT_TIMEOUT", str(PROXMOX_TIMEOUT)))
+PROXMOX_READ_TIMEOUT = float(os.getenv("PROXMOX_READ_TIMEOUT", str(PROXMOX_TIMEOUT)))
+PROXMOX_WRITE_TIMEOUT = float(os.getenv("PROXMOX_WRITE_TIMEOUT", str(PROXMOX_TIMEOUT)))
+PROXMOX_POOL_TIMEOUT = float(os.getenv("PROXMOX_POOL_TIMEOUT", str(PROXMOX_TIMEOUT)))
+PROXMOX_WARMUP_CONNECTIONS = int(os.getenv("PROXMOX_WARMUP_CONNECTIONS", "2"))
+
+# Send /nodes/{node}/... straight to that node's own API (addresses from /cluster/status).
+PROXMOX_DIRECT_NODE_ROUTING = os.getenv("PROXMOX_DIRECT_NODE_ROUTING", "false").lower() == "true"
+PROXMOX_NODE_MAP_TTL = float(os.getenv("PROXMOX_NODE_MAP_TTL", "300"))
+
+# PVE tickets live for two hours; renew well before that.
+PROXMOX_TICKET_REFRESH = float(os.getenv("PROXMOX_TICKET_REFRESH", "3600"))
+
+# Optional on-disk ticket cache for fast restarts (password auth only).
+PROXMOX_TICKET_CACHE = os.getenv("PROXMOX_TICKET_CACHE", "")
+PROXMOX_TICKET_CACHE_KEY = os.getenv("PROXMOX_TICKET_CACHE_KEY", "")
+
+# Retries: GETs on transient failures, mutations only if never sent, never 4xx.
+PROXMOX_RETRIES = int(os.getenv("PROXMOX_RETRIES", "3"))
+PROXMOX_RETRY_BACKOFF = float(os.getenv("PROXMOX_RETRY_BACKOFF", "0.2"))
+PROXMOX_RETRY_MAX_BACKOFF = float(os.getenv("PROXMOX_RETRY_MAX_BACKOFF", "5"))
+PROXMOX_RETRY_STATUSES = os.getenv("PROXMOX_RETRY_STATUSES", "502,503,504,596")
+
+# Circuit breakers per endpoint and per node: open after N consecutive
+# failures, then probe again after the cooldown.
+PROXMOX_BREAKER_THRESHOLD = int(os.getenv("PROXMOX_BREAKER_THRESHOLD", "3"))
+PROXMOX_BREAKER_COOLDOWN = float(os.getenv("PROXMOX_BREAKER_COOLDOWN", "30"))
+
+# Adaptive (AIMD) in-flight limit per endpoint, kept within these bounds.
+PROXMOX_CONCURRENCY_INITIAL = int(os.getenv("PROXMOX_CONCURRENCY_INITIAL", "8"))
+PROXMOX_CONCURRENCY_MIN = int(os.getenv("PROXMOX_CONCURRENCY_MIN", "2"))
+PROXMOX_CONCURRENCY_MAX = int(os.getenv("PROXMOX_CONCURRENCY_MAX", str(PROXMOX_MAX_CONNECTIONS)))
+
+NODE_PATH = re.compile(r"^/nodes/([^/]+)/")
+
+# Scheduling class for requests made in the current task; inherited by tasks it spawns.
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "proxmox_priority", default=INTERACTIVE
+)
+# pveproxy's answers when it cannot reach the node it proxies to.
+NODE_UNREACHABLE = (595, 596)
+# On a node-scoped path: the node behind the proxy may have hung.
+NODE_HANG = (httpx.ReadTimeout, httpx.WriteTimeout)
+
+
+class NodeHangError(httpx.TimeoutException):
+    """A node-scoped request timed out while its endpoint kept answering other paths."""
 
 
 def _validate_config() -> None:
-    if not PROXMOX_HOST or not PROXMOX_USER:
+    if not parse_hosts(PROXMOX_HOST, PROXMOX_PORT) or not PROXMOX_USER:
         print("Error: PROXMOX_HOST and PROXMOX_USER must be set", file=sys.stderr)
         sys.exit(1)
     use_token = PROXMOX_TOKEN_NAME and PROXMOX_TOKEN_VALUE
@@ -31,13 +105,113 @@ def _validate_config() -> None:
         sys.exit(1)
 
 
+def _http2_available() -> bool:
+    if not PROXMOX_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("⚠ PROXMOX_HTTP2 set but h2 is not installed; using HTTP/1.1", file=sys.stderr)
+        return False
+    return True
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker(PROXMOX_BREAKER_THRESHOLD, PROXMOX_BREAKER_COOLDOWN)
+
+
+def _endpoint(host: str, port: str) -> Endpoint:
+    return Endpoint(
+        host,
+        port,
+        _breaker(),
+        AIMDLimiter(PROXMOX_CONCURRENCY_INITIAL, PROXMOX_CONCURRENCY_MIN, PROXMOX_CONCURRENCY_MAX),
+    )
+
+
+async def _replay(body: bytes) -> AsyncIterator[bytes]:
+    yield body
+
+
+def _make_http_client() -> httpx.AsyncClient:
+    # HTTP/2 is negotiated via ALPN, so servers without it transparently get HTTP/1.1.
+    return httpx.AsyncClient(
+        verify=PROXMOX_VERIFY_SSL,
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=PROXMOX_MAX_CONNECTIONS,
+            max_keepalive_connections=PROXMOX_MAX_KEEPALIVE,
+            keepalive_expiry=PROXMOX_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=PROXMOX_CONNECT_TIMEOUT,
+            read=PROXMOX_READ_TIMEOUT,
+            write=PROXMOX_WRITE_TIMEOUT,
+            pool=PROXMOX_POOL_TIMEOUT,
+        ),
+    )
+
+
 class ProxmoxClient:
     def __init__(self) -> None:
-        self.base_url = f"https://{PROXMOX_HOST}:{PROXMOX_PORT}/api2/json"
-        self.client = httpx.AsyncClient(verify=PROXMOX_VERIFY_SSL, timeout=30.0)
+        self.endpoints = EndpointPool(
+            [_endpoint(host, port) for host, port in parse_hosts(PROXMOX_HOST, PROXMOX_PORT)]
+        )
+        # Built on first use: creating the SSL context takes ~150 ms, which
+        # would otherwise delay startup before the MCP handshake.
+        self._client: Optional[httpx.AsyncClient] = None
         self.ticket: Optional[str] = None
         self.csrf_token: Optional[str] = None
         self.token: Optional[str] = None
+        # User rules come first so they can override or disable (ttl 0) the defaults.
+        self.cache = ResponseCache(
+            PROXMOX_CACHE_MAX_BYTES, parse_ttls(PROXMOX_CACHE_TTLS) + DEFAULT_TTLS
+        )
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        self.retry = RetryPolicy(
+            PROXMOX_RETRIES,
+            PROXMOX_RETRY_BACKOFF,
+            PROXMOX_RETRY_MAX_BACKOFF,
+            parse_statuses(PROXMOX_RETRY_STATUSES),
+        )
+        # Direct node routing: node name -> its own endpoint and connection pool.
+        self._node_routes: dict[str, tuple[Endpoint, httpx.AsyncClient]] = {}
+        self._node_map_expires = 0.0
+        self._node_map_lock = asyncio.Lock()
+        self._node_breakers: dict[str, CircuitBreaker] = {}
+        self._auth_lock = asyncio.Lock()
+        self._ticket_issued = 0.0
+        self._refresher: Optional[asyncio.Task[None]] = None
+        self._authenticating: Optional[asyncio.Task[None]] = None
+        self.ticket_cache: Optional[TicketCache] = None
+        if PROXMOX_TICKET_CACHE:
+            self.ticket_cache = TicketCache(
+                PROXMOX_TICKET_CACHE,
+                f"{PROXMOX_USER}@{PROXMOX_HOST}",
+                PROXMOX_TICKET_CACHE_KEY,
+            )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = _make_http_client()
+        return self._client
+
+    @client.setter
+    def client(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    async def ensure_authenticated(self) -> None:
+        """Authenticate unless done already; concurrent callers share one attempt.
+
+        A failed attempt is not remembered, so the next call tries again.
+        """
+        if self.token or self.ticket:
+            return
+        task = self._authenticating
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._authenticating = asyncio.ensure_future(self.authenticate())
+        await asyncio.shield(task)
 
     async def authenticate(self) -> None:
         use_token = PROXMOX_TOKEN_NAME and PROXMOX_TOKEN_VALUE
@@ -45,15 +219,100 @@ class ProxmoxClient:
             self.token = f"PVEAPIToken={PROXMOX_USER}!{PROXMOX_TOKEN_NAME}={PROXMOX_TOKEN_VALUE}"
             print(f"✓ Token auth: {PROXMOX_USER}!{PROXMOX_TOKEN_NAME}", file=sys.stderr)
         else:
-            response = await self.client.post(
-                f"{self.base_url}/access/ticket",
-                data={"username": PROXMOX_USER, "password": PROXMOX_PASSWORD},
+            cached = self.ticket_cache.load() if self.ticket_cache else None
+            if cached:
+                # Not validated here: a revoked ticket gets a 401 on first use,
+                # which triggers a normal login.
+                self.ticket, self.csrf_token, age = cached
+                self._ticket_issued = time.monotonic() - age
+                print(f"✓ Ticket auth: {PROXMOX_USER} (cached)", file=sys.stderr)
+            else:
+                await self._login()
+                print(f"✓ Ticket auth: {PROXMOX_USER}", file=sys.stderr)
+            if self._refresher is None:
+                self._refresher = asyncio.create_task(self._refresh_ticket())
+
+    async def _login(self) -> None:
+        response = await self._send(
+            "POST",
+            "/access/ticket",
+            {"username": PROXMOX_USER, "password": PROXMOX_PASSWORD},
+        )
+        response.raise_for_status()
+        data = jsonlib.loads(response.content)["data"]
+        self.ticket = data["ticket"]
+        self.csrf_token = data["CSRFPreventionToken"]
+        self._ticket_issued = time.monotonic()
+        if self.ticket_cache:
+            self.ticket_cache.save(self.ticket, self.csrf_token)
+
+    async def _reauth(self, stale_ticket: Optional[str]) -> None:
+        """Get a new ticket unless someone already replaced ``stale_ticket``.
+
+        The lock makes a burst of 401s (or the refresher racing one) cost a
+        single login.
+        """
+        async with self._auth_lock:
+            if self.ticket == stale_ticket:
+                await self._login()
+
+    async def _refresh_ticket(self) -> None:
+        while True:
+            due = self._ticket_issued + PROXMOX_TICKET_REFRESH
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            try:
+                await self._reauth(self.ticket)
+            except Exception as e:
+                print(f"⚠ Ticket renewal failed, retrying in 60s: {e}", file=sys.stderr)
+                await asyncio.sleep(60)
+
+    @contextmanager
+    def priority(self, priority: str) -> Iterator[None]:
+        """Tag every request made inside the block (``interactive``, ``background`` or ``bulk``)."""
+        if priority not in PRIORITY_WEIGHTS:
+            raise ValueError(f"Unknown priority: {priority}")
+        token = _priority.set(priority)
+        try:
+            yield
+        finally:
+            _priority.reset(token)
+
+    async def warm_up(self, connections: Optional[int] = None) -> None:
+        """Open pooled connections ahead of the first tool call.
+
+        Fires concurrent ``/version`` requests at every endpoint straight at the
+        transport (no cache, coalescing or failover) so each one completes its
+        own TLS handshake and seeds the endpoint's latency estimate.
+        Failures are reported but not fatal.
+        """
+        count = PROXMOX_WARMUP_CONNECTIONS if connections is None else connections
+        if count <= 0:
+            return
+        headers = self._headers("GET")
+
+        async def probe(endpoint: Endpoint) -> httpx.Response:
+            started = time.monotonic()
+            try:
+                response = await self.client.get(f"{endpoint.base_url}/version", headers=headers)
+            except httpx.TransportError:
+                endpoint.record_failure()
+                raise
+            endpoint.record_success(time.monotonic() - started)
+            return response
+
+        for endpoint in self.endpoints.endpoints:
+            results = await asyncio.gather(
+                *(probe(endpoint) for _ in range(count)), return_exceptions=True
             )
-            response.raise_for_status()
-            data = response.json()["data"]
-            self.ticket = data["ticket"]
-            self.csrf_token = data["CSRFPreventionToken"]
-            print(f"✓ Ticket auth: {PROXMOX_USER}", file=sys.stderr)
+            failed = [r for r in results if isinstance(r, BaseException)]
+            if failed:
+                print(f"⚠ Warm-up of {endpoint.host} failed: {failed[0]}", file=sys.stderr)
+            else:
+                version = results[0].http_version  # type: ignore[union-attr]
+                print(
+                    f"✓ Warmed {count} connection(s) to {endpoint.host} ({version})",
+                    file=sys.stderr,
+                )
 
     def _headers(self, method: str) -> dict[str, str]:
         headers: dict[str, str] = {}
@@ -71,20 +330,284 @@ class ProxmoxClient:
         path: str,
         data: Optional[dict[str, Any]] = None,
     ) -> Any:
-        url = f"{self.base_url}{path}"
-        headers = self._headers(method)
-        if method == "GET":
-            response = await self.client.get(url, headers=headers, params=data)
-        elif method == "POST":
-            response = await self.client.post(url, headers=headers, data=data)
-        elif method == "PUT":
-            response = await self.client.put(url, headers=headers, data=data)
-        elif method == "DELETE":
-            response = await self.client.delete(url, headers=headers, params=data)
+        if method != "GET":
+            try:
+                response = await self._send(method, path, data)
+            finally:
+                # A failed or timed-out mutation may still have been applied.
+                self.cache.invalidate(path)
+                self._inflight.clear()
+            response.raise_for_status()
+            return jsonlib.loads(response.content)
+
+        cached = self.cache.get(path, data)
+        if cached is not None:
+            return jsonlib.loads(cached)
+        # Identical concurrent GETs share one upstream request. Waiters get the
+        # raw body and decode it themselves so no one can mutate another's result.
+        key = cache_key(path, data)
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._fetch(path, data))
+            self._inflight[key] = flight
+            flight.add_done_callback(partial(self._land, key))
+        return jsonlib.loads(await asyncio.shield(flight))
+
+    async def stream(
+        self, path: str, params: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """GET ``path`` and yield the items of its ``data`` array as they are parsed.
+
+        For very large listings: the raw body and the full decoded tree are
+        never held at once, so callers can filter or reshape rows as they
+        arrive. A body announced smaller than ``PROXMOX_STREAM_BYTES`` is
+        read and decoded whole instead, which is cheaper, and cached like
+        :meth:`request`. Streamed responses are not cached or shared between
+        concurrent callers, and a transport error mid-body is raised rather
+        than retried.
+        """
+        cached = self.cache.get(path, params)
+        if cached is not None:
+            async for item in jsonlib.iter_data(_replay(cached)):
+                yield item
+            return
+        generation = self.cache.generation
+        response = await self._send("GET", path, params, stream=True)
+        try:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            length = response.headers.get("content-length", "")
+            if (
+                length.isdigit()
+                and int(length) < PROXMOX_STREAM_BYTES
+                and "content-encoding" not in response.headers
+            ):
+                body = await response.aread()
+                self.cache.put(path, params, body, generation)
+                data = jsonlib.loads(body).get("data")
+                for item in data if isinstance(data, list) else () if data is None else (data,):
+                    yield item
+                return
+            async for item in jsonlib.iter_data(response.aiter_bytes()):
+                yield item
+        finally:
+            await response.aclose()
+
+    async def _fetch(self, path: str, params: Optional[dict[str, Any]]) -> bytes:
+        generation = self.cache.generation
+        response = await self._send("GET", path, params)
+        response.raise_for_status()
+        self.cache.put(path, params, response.content, generation)
+        return response.content
+
+    def _land(self, key: str, flight: asyncio.Future[bytes]) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not flight.cancelled():
+            flight.exception()  # retrieve it even if every waiter was cancelled
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[dict[str, Any]],
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request under the retry policy, authenticating first if needed.
+
+        A 401 with ticket auth triggers one re-login and resend, which does
+        not count as a retry. Node-scoped paths go through that node's
+        circuit breaker and fail fast while it is open; a node that hangs
+        while its endpoint keeps answering is not retried. With ``stream`` the
+        body is left unread and the caller must close the response.
+        """
+        if not (self.token or self.ticket) and path != "/access/ticket":
+            await self.ensure_authenticated()
+        match = NODE_PATH.match(path)
+        node = match.group(1) if match else None
+        breaker = self._node_breakers.setdefault(node, _breaker()) if node else None
+        attempt = 0
+        reauthed = False
+        while True:
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(
+                    f"Node {node} unavailable: {breaker.failures} consecutive failures "
+                    f"or timeouts, next probe in {breaker.retry_in():.0f}s"
+                )
+            ticket = self.ticket
+            outcome: Union[httpx.Response, Exception]
+            try:
+                outcome = await self._dispatch(method, path, data, stream)
+            except Exception as e:
+                outcome = e
+            if breaker is not None:
+                self._record_node_outcome(breaker, outcome)
+            if (
+                isinstance(outcome, httpx.Response)
+                and outcome.status_code == 401
+                and ticket
+                and not reauthed
+                and path != "/access/ticket"
+            ):
+                reauthed = True
+                await outcome.aclose()
+                await self._reauth(ticket)
+                continue
+            reason = self.retry.classify(method, outcome)
+            if isinstance(outcome, NodeHangError):
+                # Resending to a hung node only waits out another timeout; its
+                # breaker is what stops the next calls.
+                reason = None
+            if reason is None or attempt >= self.retry.retries:
+                if reason is not None:
+                    self.retry.record("exhausted", reason)
+                elif attempt and isinstance(outcome, httpx.Response) and not outcome.is_error:
+                    self.retry.record("recovered")
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+            if isinstance(outcome, httpx.Response):
+                await outcome.aclose()
+            attempt += 1
+            self.retry.record("retries", reason)
+            print(f"↻ Retry {attempt} for {method} {path} ({reason})", file=sys.stderr)
+            await asyncio.sleep(self.retry.delay(attempt))
+
+    @staticmethod
+    def _record_node_outcome(
+        breaker: CircuitBreaker, outcome: Union[httpx.Response, Exception]
+    ) -> None:
+        # Only pveproxy's "cannot reach node" and hangs pinned on the node count
+        # against it; anything else is the entry endpoint's problem.
+        if isinstance(outcome, httpx.Response):
+            if outcome.status_code in NODE_UNREACHABLE:
+                breaker.failure()
+            else:
+                breaker.success()
+        elif isinstance(outcome, NodeHangError):
+            breaker.failure()
+
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        data: Optional[dict[str, Any]],
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send to the best endpoint, failing over to the next on connection errors.
+
+        Reads fail over on any transport error. Mutations only fail over when
+        the connection was never established, so they cannot run twice.
+        Endpoints whose circuit is open are skipped, and every attempt waits
+        for a slot in the endpoint's adaptive concurrency limiter, scheduled
+        by the caller's priority class.
+        """
+        if method in ("GET", "DELETE"):
+            payload = {"params": data}
+        elif method in ("POST", "PUT"):
+            payload = {"data": data}
         else:
             raise ValueError(f"Unsupported method: {method}")
-        response.raise_for_status()
-        return response.json()
+        headers = self._headers(method)
+        match = NODE_PATH.match(path)
+        node = match.group(1) if match else ""
+        error: Optional[httpx.TransportError] = None
+        for endpoint, client in await self._route(path):
+            if not endpoint.breaker.allow():
+                continue
+            await endpoint.limiter.acquire(_priority.get())
+            started = time.monotonic()
+            latency: Optional[float] = None
+            overloaded = False
+            try:
+                request = client.build_request(
+                    method, f"{endpoint.base_url}{path}", headers=headers, **payload
+                )
+                response = await client.send(request, stream=stream)
+                latency = time.monotonic() - started
+                # A node the proxy cannot reach says nothing about the proxy's load;
+                # like hangs pinned on the node below, it is left to that node's breaker.
+                if not (node and response.status_code in NODE_UNREACHABLE):
+                    overloaded = response.status_code in self.retry.statuses
+            except httpx.PoolTimeout:
+                raise  # local pool exhaustion says nothing about the endpoint
+            except httpx.TransportError as e:
+                if (
+                    node
+                    and isinstance(e, NODE_HANG)
+                    and endpoint.answered_besides(node, started - PROXMOX_READ_TIMEOUT)
+                ):
+                    # The endpoint kept answering other paths meanwhile, so the
+                    # node behind it hung and another entry point would hang too.
+                    # The node's breaker takes the blame, not this endpoint's
+                    # breaker or concurrency limit.
+                    raise NodeHangError(f"Node {node} did not answer: {e}", request=request) from e
+                # Without that evidence a hang may be a saturated endpoint: charge
+                # it, signal overload to its limiter and fail over.
+                overloaded = isinstance(e, httpx.TimeoutException)
+                endpoint.record_failure()
+                if method != "GET" and not isinstance(
+                    e, (httpx.ConnectError, httpx.ConnectTimeout)
+                ):
+                    raise
+                error = e
+                continue
+            finally:
+                endpoint.limiter.release(latency, overloaded)
+            endpoint.record_success(latency, node)
+            return response
+        if error is None:
+            if not self.endpoints.endpoints:
+                raise ValueError("No Proxmox endpoint configured: set PROXMOX_HOST")
+            retry_in = min(ep.breaker.retry_in() for ep in self.endpoints.endpoints)
+            raise CircuitOpenError(
+                f"No Proxmox API endpoint available, next probe in {retry_in:.0f}s"
+            )
+        raise error
+
+    async def _route(self, path: str) -> list[tuple[Endpoint, httpx.AsyncClient]]:
+        """Endpoints to try for ``path``, in order.
+
+        With direct node routing, a node-scoped path goes to the owning node
+        first (skipping the entry node's internal proxy hop), then falls back
+        to the cluster endpoints.
+        """
+        chain = [(e, self.client) for e in self.endpoints.ordered()]
+        match = NODE_PATH.match(path) if PROXMOX_DIRECT_NODE_ROUTING else None
+        if match is None:
+            return chain
+        await self._refresh_node_map()
+        route = self._node_routes.get(match.group(1))
+        if route is None or route[0].breaker.state == OPEN:
+            return chain
+        return [route] + [r for r in chain if r[0] is not route[0]]
+
+    async def _refresh_node_map(self) -> None:
+        if time.monotonic() < self._node_map_expires:
+            return
+        async with self._node_map_lock:
+            if time.monotonic() < self._node_map_expires:
+                return
+            self._node_map_expires = time.monotonic() + PROXMOX_NODE_MAP_TTL
+            try:
+                response = await self._send("GET", "/cluster/status", None)
+                response.raise_for_status()
+                entries = jsonlib.loads(response.content)["data"]
+            except Exception as e:
+                print(f"⚠ Node address discovery failed: {e}", file=sys.stderr)
+                return
+            by_host = {e.host: e for e in self.endpoints.endpoints}
+            for entry in entries:
+                name, ip = entry.get("name"), entry.get("ip")
+                if entry.get("type") != "node" or not ip or name in self._node_routes:
+                    continue
+                if ip in by_host:
+                    # Already a configured endpoint: share its pool and health.
+                    self._node_routes[name] = (by_host[ip], self.client)
+                else:
+                    endpoint = _endpoint(ip, self.endpoints.endpoints[0].port)
+                    self._node_routes[name] = (endpoint, _make_http_client())
 
     async def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
         return await self.request("GET", path, params)
@@ -98,5 +621,99 @@ class ProxmoxClient:
     async def delete(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
         return await self.request("DELETE", path, params)
 
+    async def fan_out(
+        self,
+        keys: Iterable[str],
+        fetch: Callable[[str], Awaitable[Any]],
+        limit: Optional[int] = None,
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Run ``fetch(key)`` for every key with at most ``limit`` calls in flight.
+
+        Failures are collected per key instead of aborting the whole batch.
+        Returns ``(results, errors)`` keyed by the input keys.
+        """
+        semaphore = asyncio.Semaphore(max(1, limit or PROXMOX_MAX_PARALLEL))
+        results: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+
+        async def run(key: str) -> None:
+            async with semaphore:
+                try:
+                    results[key] = await fetch(key)
+                except Exception as e:
+                    errors[key] = str(e) or type(e).__name__
+
+        await asyncio.gather(*(run(k) for k in keys))
+        return results, errors
+
+    async def get_all_nodes(
+        self,
+        subpath: str,
+        params: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """GET ``/nodes/{node}{subpath}`` on every node concurrently and merge the ``data`` lists.
+
+        Each row is tagged with its ``node``. Offline or failing nodes do not
+        fail the call; they are reported under ``errors``.
+        """
+        nodes_r = await self.get("/nodes")
+        names: list[str] = []
+        errors: list[dict[str, str]] = []
+        for n in nodes_r["data"]:
+            if n.get("status") == "offline":
+                errors.append({"node": n["node"], "error": "node offline"})
+            else:
+                names.append(n["node"])
+
+        results, failed = await self.fan_out(
+            names, lambda n: self.get(f"/nodes/{n}{subpath}", params), limit
+        )
+        merged = []
+        for n in names:
+            if n in failed:
+                errors.append({"node": n, "error": failed[n]})
+                continue
+            for row in results[n].get("data") or []:
+                row["node"] = n
+                merged.append(row)
+
+        out: dict[str, Any] = {"data": merged}
+        if errors:
+            out["errors"] = errors
+        return out
+
+    async def get_cluster_guests(self, guest_type: str) -> dict[str, Any]:
+        """List every ``qemu`` or ``lxc`` guest cluster-wide from one ``/cluster/resources`` call.
+
+        Rows are reshaped to match ``/nodes/{node}/{guest_type}`` listings
+        (``maxcpu`` becomes ``cpus``, the resource ``id`` is dropped) and keep
+        their ``node``. Runtime-only fields such as ``pid`` or ``qmpstatus``
+        are not available here; use :meth:`get_all_nodes` when they matter.
+        """
+        guests = []
+        for r in (await self.get("/cluster/resources", {"type": "vm"})).get("data", []):
+            if r.get("type") != guest_type:
+                continue
+            row = {k: v for k, v in r.items() if k not in ("id", "maxcpu")}
+            if "maxcpu" in r:
+                row["cpus"] = r["maxcpu"]
+            guests.append(row)
+        return {"data": guests}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "endpoints": self.endpoints.stats(),
+            "nodes": {n: b.stats() for n, b in self._node_breakers.items()},
+            "cache": self.cache.stats(),
+            "retries": self.retry.stats(),
+        }
+
     async def close(self) -> None:
-        await self.client.aclose()
+        if self._refresher is not None:
+            self._refresher.cancel()
+        for _, client in self._node_routes.values():
+            if client is not self._client:
+                await client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
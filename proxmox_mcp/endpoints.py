@@ -0,0 +1,87 @@
+"""Cluster API endpoints with latency/health tracking for read routing and failover."""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from .breaker import CLOSED, OPEN, CircuitBreaker
+from .limiter import AIMDLimiter
+
+# Weight of the newest sample in the latency moving average.
+EWMA_ALPHA = 0.3
+
+
+def parse_hosts(spec: str, default_port: str) -> list[tuple[str, str]]:
+    """Parse ``"pve1,pve2:8443,https://pve3"`` into ``(host, port)`` pairs."""
+    hosts = []
+    for item in spec.split(","):
+        item = item.strip().removeprefix("https://").removeprefix("http://").rstrip("/")
+        if not item:
+            continue
+        host, sep, port = item.rpartition(":")
+        # Bare IPv6 literals and hosts without a port keep the default.
+        if not sep or "]" in port or not port.isdigit():
+            host, port = item, default_port
+        hosts.append((host, port))
+    return hosts
+
+
+class Endpoint:
+    def __init__(self, host: str, port: str, breaker: CircuitBreaker, limiter: AIMDLimiter) -> None:
+        self.host = host
+        self.port = port
+        self.base_url = f"https://{host}:{port}/api2/json"
+        self.latency: Optional[float] = None
+        self.breaker = breaker
+        self.limiter = limiter
+        # When a response last came back through this endpoint, per node
+        # ("" for everything outside /nodes/{node}/).
+        self.answered: dict[str, float] = {}
+
+    def record_success(self, elapsed: float, scope: str = "") -> None:
+        self.breaker.success()
+        self.answered[scope] = time.monotonic()
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += EWMA_ALPHA * (elapsed - self.latency)
+
+    def record_failure(self) -> None:
+        self.breaker.failure()
+
+    def answered_besides(self, node: str, since: float) -> bool:
+        """Whether paths outside ``node`` got a response through here since ``since``."""
+        return any(at >= since for scope, at in self.answered.items() if scope != node)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 1),
+            **self.breaker.stats(),
+            "concurrency": self.limiter.stats(),
+        }
+
+
+class EndpointPool:
+    # May be empty when PROXMOX_HOST is unset: the server module builds its
+    # client at import, and _validate_config() reports the missing host.
+    def __init__(self, endpoints: list[Endpoint]) -> None:
+        self.endpoints = endpoints
+
+    def ordered(self) -> list[Endpoint]:
+        """Endpoints worth trying, best first; open circuits are left out.
+
+        Healthy endpoints come fastest first, then recently failing ones, then
+        half-open ones due for a probe. Endpoints without a latency sample
+        sort first so each one gets probed.
+        """
+        candidates = [e for e in self.endpoints if e.breaker.state != OPEN]
+        candidates.sort(
+            key=lambda e: (e.breaker.state != CLOSED, e.breaker.failures > 0, e.latency or 0.0)
+        )
+        return candidates
+
+    def stats(self) -> list[dict[str, object]]:
+        return [e.stats() for e in self.endpoints]
@@ -0,0 +1,204 @@
+"""JSON backend (orjson when installed, stdlib json otherwise), loop-friendly encoding of
+big results and incremental parsing of big responses."""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import json
+import os
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, Union
+
+PROXMOX_JSON_BACKEND = os.getenv("PROXMOX_JSON_BACKEND", "auto").lower()
+# Results at least this large are encoded in slices, yielding to the event loop in between.
+PROXMOX_OFFLOAD_BYTES = int(os.getenv("PROXMOX_OFFLOAD_BYTES", str(256 * 1024)))
+SLICE_ITEMS = 500
+# Rows serialized to estimate the size of a list.
+SAMPLE_ROWS = 32
+_PLACEHOLDER = "__proxmox_data__"
+
+try:
+    if PROXMOX_JSON_BACKEND == "stdlib":
+        raise ImportError
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+BACKEND = "orjson" if orjson is not None else "stdlib"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize ``obj``; compact (no whitespace) unless ``pretty``."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def estimate_size(obj: Any) -> int:
+    """Cheap guess of a result's serialized size, from its top-level ``data``.
+
+    A list is sized from up to ``SAMPLE_ROWS`` evenly spaced rows.
+    """
+    data = obj.get("data") if isinstance(obj, dict) else obj
+    if isinstance(data, (str, bytes)):
+        return len(data)
+    if isinstance(data, list) and data:
+        sample = data[:: max(1, len(data) // SAMPLE_ROWS)][:SAMPLE_ROWS]
+        return len(dumps(sample)) * len(data) // len(sample)
+    if isinstance(data, dict):
+        return len(data) * 256
+    return 0
+
+
+async def dumps_async(obj: Any, pretty: bool = False) -> str:
+    """Like :func:`dumps`, but yields to the event loop while encoding big results.
+
+    A large top-level ``data`` list is encoded a slice at a time so other
+    tool calls keep being served; the output is identical to ``dumps``.
+    """
+    data = obj.get("data") if isinstance(obj, dict) else None
+    if not isinstance(data, list) or estimate_size(obj) < PROXMOX_OFFLOAD_BYTES:
+        return dumps(obj, pretty)
+    head, _, tail = dumps({**obj, "data": _PLACEHOLDER}, pretty).partition(f'"{_PLACEHOLDER}"')
+    sep = ",\n    " if pretty else ","
+    parts = [head, "[\n    " if pretty else "["]
+    for start in range(0, len(data), SLICE_ITEMS):
+        chunk = dumps(data[start : start + SLICE_ITEMS], pretty)
+        if start:
+            parts.append(sep)
+        if pretty:
+            # "[\n  item,\n  item\n]" -> items re-indented one level deeper.
+            parts.append(chunk[4:-2].replace("\n", "\n  "))
+        else:
+            parts.append(chunk[1:-1])
+        await asyncio.sleep(0)
+    parts += ["\n  ]" if pretty else "]", tail]
+    return "".join(parts)
+
+
+_scan = json.JSONDecoder().scan_once
+_whitespace = re.compile(r"[ \t\n\r]*").match
+_number_tail = re.compile(r"[0-9.eE+-]*\Z").match
+
+
+class _Reader:
+    """Text buffer over an async byte stream; consumed text is dropped on refill."""
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self._chunks = chunks.__aiter__()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+
+    async def fill(self) -> None:
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._utf8.decode(b"", final=True)  # raises on a truncated character
+            raise ValueError("Malformed JSON response: unexpected end of body") from None
+        self.text = self.text[self.pos :] + self._utf8.decode(chunk)
+        self.pos = 0
+
+    async def peek(self) -> str:
+        """Next non-whitespace character, left unconsumed."""
+        while True:
+            self.pos = _whitespace(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            await self.fill()
+
+    async def expect(self, chars: str) -> str:
+        char = await self.peek()
+        if char not in chars:
+            raise ValueError(f"Malformed JSON response: expected {chars!r}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def _scan(self) -> tuple[Any, int]:
+        """Parse the value at ``pos``; the end is -1 until what follows it is buffered too.
+
+        Requiring the next token, and for numbers more than number
+        characters up to the buffer's end, keeps a value cut at a chunk
+        boundary ("12" of "12.5") from being taken as complete.
+        """
+        text = self.text
+        pos = _whitespace(text, self.pos).end()
+        try:
+            value, end = _scan(text, pos)
+        except (StopIteration, json.JSONDecodeError):
+            return None, -1
+        if type(value) in (int, float) and _number_tail(text, end):
+            return None, -1
+        end = _whitespace(text, end).end()
+        return value, (end if end < len(text) else -1)
+
+    async def value(self) -> Any:
+        while True:
+            value, end = self._scan()
+            if end >= 0:
+                self.pos = end
+                return value
+            await self.fill()
+
+    def items(self) -> tuple[list[Any], bool]:
+        """Array items complete in the buffer, and whether the closing bracket was reached."""
+        items = []
+        while True:
+            value, end = self._scan()
+            if end < 0:
+                return items, False
+            separator = self.text[end]
+            if separator not in ",]":
+                raise ValueError(f"Malformed JSON response: expected ',]', got {separator!r}")
+            items.append(value)
+            self.pos = end + 1
+            if separator == "]":
+                return items, True
+
+
+async def iter_data(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield the items of a PVE response's top-level ``data`` array as they are parsed.
+
+    Only the undecoded remainder of the current chunk and the items parsed
+    from it are held at a time. A ``data`` that is not an array is yielded
+    as a single item; other top-level members are skipped.
+    """
+    reader = _Reader(chunks)
+    await reader.expect("{")
+    if await reader.peek() == "}":
+        return
+    while True:
+        key = await reader.value()
+        await reader.expect(":")
+        if key == "data" and await reader.peek() == "[":
+            reader.pos += 1
+            if await reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    items, done = reader.items()
+                    for item in items:
+                        yield item
+                    if done:
+                        break
+                    await reader.fill()
+        else:
+            value = await reader.value()
+            if key == "data" and value is not None:
+                yield value
+        if await reader.expect(",}") == "}":
+            return
@@ -0,0 +1,126 @@
+"""AIMD adaptive concurrency limiter with weighted-fair priority classes.
+
+The limiter finds the most in-flight requests pveproxy can take; when it is
+saturated, waiting requests are admitted by class so interactive reads are
+not starved by bulk automation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+# Multiplicative cut on errors/overload and on rising latency.
+ERROR_DECREASE = 0.5
+LATENCY_DECREASE = 0.9
+# Latency counts as rising once the short-term average exceeds the long-term one by this factor.
+LATENCY_TOLERANCE = 2.0
+SHORT_ALPHA = 0.3
+LONG_ALPHA = 0.02
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+BULK = "bulk"
+# Share of freed slots each class gets while all of them are waiting.
+PRIORITY_WEIGHTS = {INTERACTIVE: 8, BACKGROUND: 3, BULK: 1}
+# Slots only interactive requests may take, so they never queue behind a full pipe of bulk work.
+INTERACTIVE_RESERVE = 1
+
+
+class AIMDLimiter:
+    def __init__(self, initial: int, minimum: int, maximum: int) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.short: Optional[float] = None
+        self.long: Optional[float] = None
+        self._last_cut = 0.0
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {
+            c: deque() for c in PRIORITY_WEIGHTS
+        }
+        # Stride scheduling: each admission advances the class's pass by 1/weight;
+        # the waiting class with the lowest pass goes next.
+        self._pass = dict.fromkeys(PRIORITY_WEIGHTS, 0.0)
+        self._clock = 0.0
+
+    def _capacity(self, priority: str) -> int:
+        reserve = 0 if priority == INTERACTIVE or self.limit < 2 else INTERACTIVE_RESERVE
+        return int(self.limit) - reserve
+
+    async def acquire(self, priority: str = INTERACTIVE) -> None:
+        queue = self._waiters.get(priority)
+        if queue is None:
+            raise ValueError(f"Unknown priority: {priority}")
+        if not any(self._waiters.values()) and self.in_flight < self._capacity(priority):
+            self.in_flight += 1
+            return
+        if not queue:
+            # A class returning from idle does not get credit for the time it was away.
+            self._pass[priority] = max(self._pass[priority], self._clock)
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled.
+                self.in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, latency: Optional[float], overloaded: bool) -> None:
+        """Return a slot and adapt the limit.
+
+        ``overloaded`` marks errors that suggest the upstream is saturated.
+        ``latency`` is None when the request did not complete.
+        """
+        saturated = self.in_flight >= int(self.limit)
+        self.in_flight -= 1
+        if overloaded:
+            self._cut(ERROR_DECREASE)
+        elif latency is not None:
+            self.short = latency if self.short is None else self.short
+            self.long = latency if self.long is None else self.long
+            self.short += SHORT_ALPHA * (latency - self.short)
+            self.long += LONG_ALPHA * (latency - self.long)
+            if self.short > self.long * LATENCY_TOLERANCE:
+                self._cut(LATENCY_DECREASE)
+            elif saturated:
+                # About +1 per limit's worth of completions, i.e. per round trip.
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+        self._wake()
+
+    def _cut(self, factor: float) -> None:
+        # One cut per congestion episode: ignore further signals for about one round trip.
+        now = time.monotonic()
+        if now - self._last_cut < (self.short or 0.0):
+            return
+        self._last_cut = now
+        self.limit = max(float(self.minimum), self.limit * factor)
+
+    def _wake(self) -> None:
+        while True:
+            for queue in self._waiters.values():
+                while queue and queue[0].done():
+                    queue.popleft()  # cancelled while waiting
+            ready = [
+                c for c, q in self._waiters.items() if q and self.in_flight < self._capacity(c)
+            ]
+            if not ready:
+                return
+            priority = min(ready, key=lambda c: self._pass[c])
+            self._clock = self._pass[priority]
+            self._pass[priority] += 1 / PRIORITY_WEIGHTS[priority]
+            self.in_flight += 1
+            self._waiters[priority].popleft().set_result(None)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": {c: len(q) for c, q in self._waiters.items() if q},
+        }
@@ -0,0 +1,94 @@
+"""Cursor pagination over snapshots of large list results, bounded by TTL and total bytes."""
+
+from __future__ import annotations
+
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from . import jsonlib
+
+
+class Snapshot:
+    def __init__(
+        self, tool: str, rows: list[Any], page_size: int, total: int, size: int, expires: float
+    ) -> None:
+        self.tool = tool
+        self.rows = rows  # everything after the first page
+        self.page_size = page_size
+        self.total = total
+        self.size = size
+        self.expires = expires
+
+
+class SnapshotStore:
+    """Holds the rest of a paged result so later pages never refetch upstream.
+
+    Each access extends a snapshot's lifetime by ``ttl``; the least recently
+    used ones are dropped when the total exceeds ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._snapshots: OrderedDict[str, Snapshot] = OrderedDict()
+
+    def paginate(self, tool: str, result: Any, page_size: Optional[int]) -> Any:
+        """Cut ``result["data"]`` to its first page and snapshot the rest behind a cursor."""
+        if not page_size or not isinstance(result, dict):
+            return result
+        rows = result.get("data")
+        if not isinstance(rows, list) or len(rows) <= page_size:
+            return result
+        rest = rows[page_size:]
+        # A query with offset/limit already reported its matches before the cut.
+        total = result.get("total", len(rows))
+        page = {**result, "data": rows[:page_size], "total": total}
+        # Estimated: serializing the whole rest would block the loop on exactly
+        # the results paging is for.
+        size = jsonlib.estimate_size(rest)
+        if size > self.max_bytes:
+            page["truncated"] = True  # too big to hold; narrow it with query/fields
+            return page
+        self._expire()
+        snapshot_id = secrets.token_urlsafe(12)
+        self._snapshots[snapshot_id] = Snapshot(
+            tool, rest, page_size, total, size, time.monotonic() + self.ttl
+        )
+        self.size += size
+        while self.size > self.max_bytes:
+            self._drop(next(iter(self._snapshots)))
+        page["next_cursor"] = f"{snapshot_id}:0"
+        return page
+
+    def resume(self, tool: str, cursor: str) -> dict[str, Any]:
+        """Return the page a cursor points at, plus the next cursor while rows remain."""
+        snapshot_id, _, offset = cursor.partition(":")
+        self._expire()
+        snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is None or snapshot.tool != tool or not offset.isdigit():
+            raise ValueError(
+                "Unknown or expired cursor; call the tool again without a cursor for a fresh result"
+            )
+        self._snapshots.move_to_end(snapshot_id)
+        snapshot.expires = time.monotonic() + self.ttl
+        start = int(offset)
+        end = start + snapshot.page_size
+        page: dict[str, Any] = {"data": snapshot.rows[start:end], "total": snapshot.total}
+        if end < len(snapshot.rows):
+            page["next_cursor"] = f"{snapshot_id}:{end}"
+        return page
+
+    def stats(self) -> dict[str, int]:
+        return {"snapshots": len(self._snapshots), "bytes": self.size}
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for snapshot_id, snapshot in list(self._snapshots.items()):
+            if snapshot.expires <= now:
+                self._drop(snapshot_id)
+
+    def _drop(self, snapshot_id: str) -> None:
+        self.size -= self._snapshots.pop(snapshot_id).size
@@ -0,0 +1,60 @@
+"""Tool profiles: which tool modules the server imports and registers.
+
+A profile spec is a comma-separated mix of profile names and module names,
+e.g. ``compute``, ``storage,firewall`` or ``qemu,lxc``. ``readonly`` can be
+combined with any of them and drops every state-changing tool; on its own it
+means every module, read-only.
+"""
+
+from __future__ import annotations
+
+# Every tool module, in listing order.
+MODULES = (
+    "nodes",
+    "qemu",
+    "lxc",
+    "storage",
+    "cluster",
+    "access",
+    "firewall",
+    "disks",
+    "ceph",
+    "acme",
+    "sdn",
+    "notifications",
+    "pools",
+)
+
+# Each profile keeps nodes and cluster: node lookups and task status follow
+# almost every operation.
+PROFILES: dict[str, tuple[str, ...]] = {
+    "all": MODULES,
+    "compute": ("nodes", "cluster", "qemu", "lxc", "pools"),
+    "storage": ("nodes", "cluster", "storage", "disks", "ceph"),
+    "network": ("nodes", "cluster", "firewall", "sdn"),
+    "admin": ("nodes", "cluster", "access", "acme", "notifications", "pools"),
+}
+
+READONLY = "readonly"
+
+
+def resolve(spec: str) -> tuple[tuple[str, ...], bool]:
+    """Return the modules a profile spec selects, in listing order, and whether it is read-only."""
+    names = [name.strip().lower() for name in spec.split(",") if name.strip()]
+    readonly = READONLY in names
+    selected: set[str] = set()
+    for name in names:
+        if name == READONLY:
+            continue
+        if name in PROFILES:
+            selected.update(PROFILES[name])
+        elif name in MODULES:
+            selected.add(name)
+        else:
+            raise ValueError(
+                f"Unknown profile or tool module: {name} (profiles: "
+                f"{', '.join([*PROFILES, READONLY])}; modules: {', '.join(MODULES)})"
+            )
+    if not selected:
+        selected.update(MODULES)
+    return tuple(module for module in MODULES if module in selected), readonly
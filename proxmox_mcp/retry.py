@@ -0,0 +1,62 @@
+"""Retry policy: error classification, exponential backoff with full jitter, metrics."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from typing import Optional, Union
+
+import httpx
+
+# Errors raised before the request left this process; safe to resend any method.
+NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def parse_statuses(spec: str) -> frozenset[int]:
+    return frozenset(int(s) for s in spec.split(",") if s.strip())
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        retries: int,
+        backoff: float,
+        max_backoff: float,
+        statuses: frozenset[int],
+    ) -> None:
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # Only transient gateway/proxy statuses by default: PVE also answers
+        # plain 500 for deterministic errors such as "VM is locked".
+        self.statuses = statuses
+        self.metrics: Counter[str] = Counter()
+
+    def classify(self, method: str, outcome: Union[httpx.Response, BaseException]) -> Optional[str]:
+        """Return why ``outcome`` is worth retrying, or None if it is final.
+
+        GETs retry on transport errors and transient statuses. Mutations
+        only retry when they provably never reached the server. 4xx is
+        never retried.
+        """
+        if isinstance(outcome, httpx.Response):
+            if method == "GET" and outcome.status_code in self.statuses:
+                return f"http_{outcome.status_code}"
+            return None
+        if isinstance(outcome, NOT_SENT):
+            return type(outcome).__name__
+        if method == "GET" and isinstance(outcome, httpx.TransportError):
+            return type(outcome).__name__
+        return None
+
+    def delay(self, attempt: int) -> float:
+        """Full-jitter backoff for the given 1-based retry attempt."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def record(self, event: str, reason: str = "") -> None:
+        self.metrics[event] += 1
+        if reason:
+            self.metrics[f"{event}.{reason}"] += 1
+
+    def stats(self) -> dict[str, int]:
+        return dict(self.metrics)
@@ -0,0 +1,108 @@
+"""Declarative tool routes, compiled once into O(1) dispatch callables.
+
+Each tool module maps tool names to a :class:`Route` (one PVE API call
+built from the arguments) or, for tools with real logic, to a plain
+``async def tool(args, client)`` function.
+
+A module may also define ``PRIORITY``, mapping its heavy tools to a
+scheduling class of the endpoint concurrency limiters (``"background"``
+or ``"bulk"``, see limiter.py); every other tool runs as ``"interactive"``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import Any, Optional, Union
+from urllib.parse import quote
+
+from . import shaping
+from .client import ProxmoxClient
+
+Handler = Callable[[dict[str, Any], ProxmoxClient], Awaitable[Any]]
+
+# Forward every argument that is not a path parameter.
+ALL = "*"
+
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+class Route:
+    """``method`` on ``path`` (a template such as ``/nodes/{node}/qemu/{vmid}``).
+
+    ``params`` names the arguments sent as query string (GET, DELETE) or
+    form body (POST, PUT), or is :data:`ALL`. Arguments are passed through
+    as given unless ``rename`` maps them to another API name, or they are
+    ``flags``: sent as ``1`` when truthy and left out otherwise. Path
+    parameters listed in ``quoted`` are percent-encoded, for values such as
+    volume IDs or CIDRs that contain ``/``. A GET that can return very large
+    listings may set ``stream`` to parse the response with
+    :meth:`ProxmoxClient.stream` instead of buffering it, dropping and
+    trimming rows per the call's ``query.where`` and ``fields`` as they arrive.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        params: Union[str, Iterable[str]] = (),
+        rename: Optional[Mapping[str, str]] = None,
+        flags: Iterable[str] = (),
+        quoted: Iterable[str] = (),
+        stream: bool = False,
+    ) -> None:
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported method: {method}")
+        if stream and method != "GET":
+            raise ValueError(f"Only GET routes can stream, not {method}")
+        self.method = method
+        self.path = path
+        self.path_params = tuple(_PLACEHOLDER.findall(path))
+        self.params = params if params == ALL else tuple(params)
+        self.rename = dict(rename or {})
+        self.flags = frozenset(flags)
+        self.quoted = frozenset(quoted)
+        self.stream = stream
+
+    def compile(self) -> Handler:
+        method = self.method
+        template = self.path
+        path_params = self.path_params
+        quoted = self.quoted
+        send_all = self.params == ALL
+        picks = () if send_all else self.params
+        skip = frozenset(path_params)
+        rename = self.rename
+        flags = self.flags
+        plain = not rename and not flags
+        stream = self.stream
+
+        async def handler(args: dict[str, Any], client: ProxmoxClient) -> Any:
+            try:
+                values = {
+                    p: quote(str(args[p]), safe="") if p in quoted else args[p] for p in path_params
+                }
+            except KeyError as e:
+                raise ValueError(f"Missing required argument: {e.args[0]}") from None
+            if send_all:
+                data = {k: v for k, v in args.items() if k not in skip}
+            else:
+                data = {k: args[k] for k in picks if k in args}
+            if not plain:
+                data = {
+                    rename.get(k, k): (1 if k in flags else v)
+                    for k, v in data.items()
+                    if k not in flags or v
+                }
+            path = template.format_map(values)
+            if stream:
+                return {"data": await shaping.rows(client.stream(path, data or None))}
+            return await client.request(method, path, data or None)
+
+        return handler
+
+
+def compile_routes(routes: Mapping[str, Union[Route, Handler]]) -> dict[str, Handler]:
+    return {
+        name: spec.compile() if isinstance(spec, Route) else spec for name, spec in routes.items()
+    }
@@ -3,81 +3,206 @@
 Proxmox VE MCP Server — full API coverage
 
 Configuration (environment variables):
-    PROXMOX_HOST        Proxmox hostname or IP (required)
+    PROXMOX_HOST        Proxmox hostname or IP (required); comma-separate several
+                        cluster nodes ("pve1,pve2:8443") for latency-aware failover
     PROXMOX_PORT        API port (default: 8006)
     PROXMOX_USER        Username (e.g. root@pam) (required)
     PROXMOX_TOKEN_NAME  API token name (required if no password)
     PROXMOX_TOKEN_VALUE API token value (required if no password)
     PROXMOX_PASSWORD    Password (alternative to token auth)
     PROXMOX_VERIFY_SSL  Verify SSL certs (default: false)
+    PROXMOX_MAX_PARALLEL Max concurrent per-node requests for cluster-wide tools (default: 8)
+    PROXMOX_CACHE_MAX_BYTES GET response cache size in bytes, 0 disables (default: 32 MiB)
+    PROXMOX_CACHE_TTLS  Extra cache rules as "path-regex=seconds,..." (checked before defaults)
+    PROXMOX_HTTP2       Negotiate HTTP/2 when the server supports it; needs h2 (default: false)
+    PROXMOX_MAX_CONNECTIONS / PROXMOX_MAX_KEEPALIVE  Connection pool limits (default: 20 / 10)
+    PROXMOX_KEEPALIVE_EXPIRY  Idle keep-alive lifetime in seconds (default: 30)
+    PROXMOX_TIMEOUT     Default timeout in seconds for every phase (default: 30)
+    PROXMOX_CONNECT_TIMEOUT / _READ_TIMEOUT / _WRITE_TIMEOUT / _POOL_TIMEOUT  Per-phase overrides
+    PROXMOX_WARMUP_CONNECTIONS  Connections opened at startup, 0 disables (default: 2)
+    PROXMOX_DIRECT_NODE_ROUTING Send /nodes/{node}/... calls to that node's own API (default: false)
+    PROXMOX_NODE_MAP_TTL  Seconds between node address refreshes from /cluster/status (default: 300)
+    PROXMOX_TICKET_REFRESH Seconds between background ticket renewals, password auth (default: 3600)
+    PROXMOX_TICKET_CACHE  File to persist the auth ticket in across restarts (default: disabled)
+    PROXMOX_TICKET_CACHE_KEY Passphrase to encrypt that file; needs cryptography (optional)
+    PROXMOX_RETRIES     Retries for transient failures (default: 3)
+    PROXMOX_RETRY_BACKOFF / PROXMOX_RETRY_MAX_BACKOFF  Backoff base and cap in seconds (default: 0.2 / 5)
+    PROXMOX_RETRY_STATUSES  HTTP statuses retried for GETs (default: 502,503,504,596)
+    PROXMOX_BREAKER_THRESHOLD  Consecutive failures before a node/endpoint fails fast (default: 3)
+    PROXMOX_BREAKER_COOLDOWN   Seconds before a tripped node/endpoint is probed again (default: 30)
+    PROXMOX_PROFILE     Tools to serve: profiles all, compute, storage, network, admin,
+                        readonly and/or module names, comma-separated (default: all);
+                        the --profile option overrides it
+    PROXMOX_OUTPUT      Tool result encoding: pretty, compact, table or tsv (default: pretty)
+    PROXMOX_JSON_BACKEND  auto (orjson if installed) or stdlib (default: auto)
+    PROXMOX_PAGE_SIZE   Rows per page for list results without a page_size argument;
+                        0 disables default paging (default: 0)
+    PROXMOX_PAGE_CACHE_BYTES   Memory for the snapshots behind page cursors (default: 16 MiB)
+    PROXMOX_PAGE_TTL    Seconds an unused page cursor stays valid (default: 300)
+    PROXMOX_OFFLOAD_BYTES   Estimated result size from which output is encoded in slices,
+                        yielding to other requests in between (default: 262144)
+    PROXMOX_STREAM_BYTES  Response size from which large-listing tools parse the body
+                        incrementally as it arrives (default: 1048576)
+    PROXMOX_CONCURRENCY_INITIAL / _MIN / _MAX  Adaptive in-flight limit per endpoint
+                        (default: 8 / 2 / PROXMOX_MAX_CONNECTIONS)
 """
 
 from __future__ import annotations
 
+import argparse
 import asyncio
-import json
+import importlib
+import inspect
+import os
 import sys
-from typing import Any
+from types import ModuleType
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 from mcp.server import Server
-from mcp.types import TextContent, Tool
+from mcp.types import InitializedNotification, TextContent, Tool
 import mcp.server.stdio
 
-from .client import ProxmoxClient, _validate_config
-from .tools import (
-    acme,
-    access,
-    ceph,
-    cluster,
-    disks,
-    firewall,
-    lxc,
-    nodes,
-    notifications,
-    pools,
-    qemu,
-    sdn,
-    storage,
-)
-
+# Before the package modules: they read their settings from the environment at import.
 load_dotenv()
 
-# --- Build unified tool registry ---
+from . import catalog, jsonlib, profiles, shaping  # noqa: E402
+from .client import ProxmoxClient, _validate_config  # noqa: E402
+from .pagination import SnapshotStore  # noqa: E402
+from .routes import Handler, compile_routes  # noqa: E402
+from .validation import Validators  # noqa: E402
 
-MODULES = [
-    nodes,
-    qemu,
-    lxc,
-    storage,
-    cluster,
-    access,
-    firewall,
-    disks,
-    ceph,
-    acme,
-    sdn,
-    notifications,
-    pools,
-]
+# Default result encoding, see shaping.OUTPUTS. "compact" drops all indentation;
+# "table"/"tsv" also send each field name of list results only once.
+OUTPUT = os.getenv("PROXMOX_OUTPUT", "pretty").lower()
+if OUTPUT not in shaping.OUTPUTS:
+    OUTPUT = "pretty"
+PRETTY = OUTPUT == "pretty"
+# Rows per page for list results when the call gives no page_size; 0 returns everything.
+PROXMOX_PAGE_SIZE = int(os.getenv("PROXMOX_PAGE_SIZE", "0"))
+PROXMOX_PAGE_CACHE_BYTES = int(os.getenv("PROXMOX_PAGE_CACHE_BYTES", str(16 * 1024 * 1024)))
+PROXMOX_PAGE_TTL = float(os.getenv("PROXMOX_PAGE_TTL", "300"))
+# Tool modules to serve, see profiles.py; --profile overrides it.
+PROXMOX_PROFILE = os.getenv("PROXMOX_PROFILE", "all")
 
+# --- Build unified tool registry ---
+
+MODULES: dict[str, ModuleType] = {}  # tool modules imported so far
+CATALOG: dict[str, dict[str, Any]] = {}
 ALL_TOOLS: list[Tool] = []
-TOOL_MODULE: dict[str, Any] = {}
-
-for mod in MODULES:
-    for tool_def in mod.TOOLS:
-        t = Tool(
-            name=tool_def["name"],
-            description=tool_def["description"],
-            inputSchema=tool_def["inputSchema"],
+TOOL_MODULE: dict[str, str] = {}
+TOOL_HANDLERS: dict[str, Handler] = {}
+TOOL_SCHEMAS: dict[str, dict[str, Any]] = {}
+TOOL_PRIORITY: dict[str, str] = {}
+TOOL_VALIDATORS = Validators(TOOL_SCHEMAS)
+
+
+async def get_server_stats(args: dict[str, Any], client: ProxmoxClient) -> Any:
+    return {"data": {**client.stats(), "snapshots": snapshots.stats()}}
+
+
+# Served by the server itself, in every profile: they report on it, not the cluster.
+SERVER_TOOLS: dict[str, tuple[Tool, Handler]] = {
+    "get_server_stats": (
+        Tool(
+            name="get_server_stats",
+            description=(
+                "Get this MCP server's own metrics: retries, per-endpoint latency, "
+                "circuit breakers and concurrency limits, response cache and page snapshots"
+            ),
+            inputSchema={"type": "object", "properties": {}},
+        ),
+        get_server_stats,
+    ),
+}
+
+
+def load_tools(profile: str) -> None:
+    """Register the tools a profile selects (see profiles.py) from the catalogue.
+
+    Tool modules themselves are imported on the first call to one of their tools.
+    """
+    modules, readonly = profiles.resolve(profile)
+    for registry in (CATALOG, ALL_TOOLS, TOOL_MODULE, TOOL_HANDLERS, TOOL_SCHEMAS):
+        registry.clear()
+    TOOL_VALIDATORS.clear()
+    CATALOG.update(catalog.load(modules))
+    for module in modules:
+        entry = CATALOG[module]
+        writes = set(entry["writes"])
+        for tool_def in entry["tools"]:
+            name = tool_def["name"]
+            schema = tool_def["inputSchema"]
+            if name in writes:
+                if readonly:
+                    continue
+            else:
+                # Shaping only means something for results worth shaping; leaving it
+                # off state-changing tools keeps the listing (and model context) small.
+                schema = {
+                    **schema,
+                    "properties": {**schema.get("properties", {}), **shaping.SCHEMA},
+                }
+            ALL_TOOLS.append(
+                Tool(name=name, description=tool_def["description"], inputSchema=schema)
+            )
+            TOOL_MODULE[name] = module
+            TOOL_SCHEMAS[name] = tool_def["inputSchema"]
+    for name, (tool, handler) in SERVER_TOOLS.items():
+        ALL_TOOLS.append(tool)
+        TOOL_HANDLERS[name] = handler
+        TOOL_SCHEMAS[name] = tool.inputSchema
+
+
+def _handler(name: str) -> Handler:
+    handler = TOOL_HANDLERS.get(name)
+    if handler is not None:
+        return handler
+    module = TOOL_MODULE.get(name)
+    if module is None:
+        raise ValueError(f"Unknown tool: {name}")
+    mod = MODULES.get(module)
+    if mod is None:
+        mod = MODULES[module] = importlib.import_module(f"{__package__}.tools.{module}")
+        TOOL_PRIORITY.update(getattr(mod, "PRIORITY", {}))
+    handlers = compile_routes(mod.ROUTES)
+    defined = {tool_def["name"] for tool_def in CATALOG[module]["tools"]}
+    if defined != handlers.keys():
+        raise RuntimeError(
+            f"{mod.__name__}: tools without routes {sorted(defined - handlers.keys())}, "
+            f"routes without tools {sorted(handlers.keys() - defined)}"
         )
-        ALL_TOOLS.append(t)
-        TOOL_MODULE[tool_def["name"]] = mod
+    TOOL_HANDLERS.update(
+        (tool, handler) for tool, handler in handlers.items() if TOOL_MODULE.get(tool) == module
+    )
+    return TOOL_HANDLERS[name]
+
 
 # --- MCP server setup ---
 
 proxmox = ProxmoxClient()
+snapshots = SnapshotStore(PROXMOX_PAGE_CACHE_BYTES, PROXMOX_PAGE_TTL)
 app = Server("proxmox-mcp-server")
+_connecting: Optional[asyncio.Task[None]] = None
+
+
+async def _connect() -> None:
+    try:
+        await proxmox.ensure_authenticated()
+        await proxmox.warm_up()
+    except Exception as e:
+        print(f"⚠ Proxmox API not reachable yet, retrying on the first call: {e}", file=sys.stderr)
+
+
+async def _initialized(_: InitializedNotification) -> None:
+    # Authenticate and warm up only once the MCP handshake is done, so a slow
+    # API never delays it; a tool call arriving earlier authenticates itself.
+    global _connecting
+    if _connecting is None:
+        _connecting = asyncio.create_task(_connect())
+
+
+app.notification_handlers[InitializedNotification] = _initialized
 
 
 @app.list_tools()
@@ -85,29 +210,46 @@ async def list_tools() -> list[Tool]:
     return ALL_TOOLS
 
 
-@app.call_tool()
+# Arguments are checked by TOOL_VALIDATORS; the per-call jsonschema pass in newer
+# mcp releases re-checks the whole schema every time and rejects coercible values.
+_CALL_TOOL_OPTIONS = (
+    {"validate_input": False}
+    if "validate_input" in inspect.signature(Server.call_tool).parameters
+    else {}
+)
+
+
+@app.call_tool(**_CALL_TOOL_OPTIONS)
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     try:
-        mod = TOOL_MODULE.get(name)
-        if mod is None:
-            raise ValueError(f"Unknown tool: {name}")
-        result = await mod.handle(name, arguments or {}, proxmox)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        handler = _handler(name)
+        args, options = shaping.split_args(arguments or {})
+        if "cursor" in options:
+            result = snapshots.resume(name, options["cursor"])
+        else:
+            args = TOOL_VALIDATORS[name](args)
+            with (
+                proxmox.priority(TOOL_PRIORITY.get(name, "interactive")),
+                shaping.for_call(options),
+            ):
+                result = await handler(args, proxmox)
+            result = shaping.apply(result, options)
+            result = snapshots.paginate(name, result, options.get("page_size", PROXMOX_PAGE_SIZE))
+        text = await shaping.render(result, options.get("output", OUTPUT))
+        return [TextContent(type="text", text=text)]
     except Exception as e:
         error = {"error": str(e), "tool": name}
-        return [TextContent(type="text", text=json.dumps(error, indent=2))]
+        return [TextContent(type="text", text=jsonlib.dumps(error, pretty=PRETTY))]
 
 
-async def main() -> None:
+async def main(profile: str = PROXMOX_PROFILE) -> None:
     _validate_config()
+    load_tools(profile)
 
     print("=" * 60, file=sys.stderr)
     print("Proxmox VE MCP Server", file=sys.stderr)
-    print(f"Tools: {len(ALL_TOOLS)}", file=sys.stderr)
+    print(f"Tools: {len(ALL_TOOLS)} (profile: {profile})", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
-
-    await proxmox.authenticate()
-
     print(f"✓ Ready — {len(ALL_TOOLS)} tools available", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
 
@@ -120,8 +262,19 @@ async def main() -> None:
 
 
 def run() -> None:
+    parser = argparse.ArgumentParser(prog="proxmox-mcp-server", description="Proxmox VE MCP server")
+    parser.add_argument(
+        "--profile",
+        default=PROXMOX_PROFILE,
+        help=(
+            "Tools to serve: comma-separated profiles "
+            f"({', '.join([*profiles.PROFILES, profiles.READONLY])}) and/or tool modules "
+            f"({', '.join(profiles.MODULES)}); default: $PROXMOX_PROFILE or all"
+        ),
+    )
+    args = parser.parse_args()
     try:
-        asyncio.run(main())
+        asyncio.run(main(args.profile))
     except KeyboardInterrupt:
         print("\n✓ Server stopped", file=sys.stderr)
     except Exception as e:
@@ -0,0 +1,425 @@
+"""Server-side shaping of tool results before serialization.
+
+Every tool accepts these extra arguments; they are taken out before the
+tool module sees its arguments and applied to the ``data`` of its result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import re
+import time
+from collections import Counter
+from collections.abc import AsyncIterable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+from . import jsonlib
+
+# Merged into every tool's inputSchema by the registry.
+SCHEMA: dict[str, dict[str, Any]] = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": (
+            "Only return these fields of each result row; dotted paths select "
+            'nested fields (e.g. ["vmid", "name", "status"])'
+        ),
+    },
+    "query": {
+        "type": "object",
+        "description": (
+            "Filter, group, sort and page list results server-side; applied before fields"
+        ),
+        "properties": {
+            "where": {
+                "type": "array",
+                "description": (
+                    "Conditions that must all hold. ops: eq, ne, lt, le, gt, ge, in, "
+                    "contains, exists, within (epoch-seconds field no older than a "
+                    'duration such as "1h" or 3600)'
+                ),
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "field": {"type": "string"},
+                        "op": {"type": "string"},
+                        "value": {},
+                    },
+                    "required": ["field"],
+                },
+            },
+            "group_by": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Return one row per distinct value with a count",
+            },
+            "order_by": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": 'Sort fields, "-" prefix for descending (e.g. ["-mem"])',
+            },
+            "offset": {"type": "integer", "minimum": 0},
+            "limit": {"type": "integer", "minimum": 0},
+        },
+    },
+    "page_size": {
+        "type": "integer",
+        "minimum": 1,
+        "description": "Return list results in pages of this many rows, with a next_cursor",
+    },
+    "cursor": {
+        "type": "string",
+        "description": (
+            "next_cursor from a previous call: returns that page; other arguments "
+            "except output are ignored"
+        ),
+    },
+    "output": {
+        "type": "string",
+        "enum": ["pretty", "compact", "table", "tsv"],
+        "description": (
+            "Result encoding. table: list rows as {columns, data: [[...], ...]} with each "
+            "field name sent once; tsv: tab-separated text with a header line"
+        ),
+    },
+}
+
+OUTPUTS = ("pretty", "compact", "table", "tsv")
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+# Options of the tool call in progress, for streaming routes to reduce rows
+# as they arrive; see rows().
+_call_options: contextvars.ContextVar[Optional[dict[str, Any]]] = contextvars.ContextVar(
+    "shaping_call_options", default=None
+)
+
+
+def split_args(arguments: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Separate shaping options from the tool's own arguments.
+
+    Options are validated here, before the tool runs, so a malformed one
+    cannot fail a call after its side effects happened.
+    """
+    args = dict(arguments)
+    options: dict[str, Any] = {}
+    if "fields" in args:
+        options["fields"] = _field_tree(args.pop("fields"))
+    if "query" in args:
+        options["query"] = Query(args.pop("query"))
+    if "page_size" in args:
+        options["page_size"] = _positive(args.pop("page_size"), "page_size")
+    if "cursor" in args:
+        cursor = args.pop("cursor")
+        if not isinstance(cursor, str):
+            raise ValueError("cursor must be a string")
+        options["cursor"] = cursor
+    if "output" in args:
+        output = args.pop("output")
+        if output not in OUTPUTS:
+            raise ValueError(f"output must be one of: {', '.join(OUTPUTS)}")
+        options["output"] = output
+    return args, options
+
+
+def _positive(value: Any, name: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"{name} must be a positive integer")
+    return value
+
+
+@contextmanager
+def for_call(options: dict[str, Any]) -> Iterator[None]:
+    """Make ``options`` available to :func:`rows` for the duration of a tool call."""
+    token = _call_options.set(options)
+    try:
+        yield
+    finally:
+        _call_options.reset(token)
+
+
+async def rows(items: AsyncIterable[Any]) -> list[Any]:
+    """Collect streamed rows, applying the call's per-row shaping on the way.
+
+    Rows ``query.where`` rejects are dropped and ``fields`` is picked per
+    row (unless group_by or order_by still need the other fields), so a
+    large listing is never held whole. What was applied is recorded in the
+    options for :func:`apply` to skip.
+    """
+    options = _call_options.get()
+    query = options.get("query") if options else None
+    tree = options.get("fields") if options else None
+    match = query.matcher() if query is not None and query.where else None
+    if tree and query is not None and (query.group_by or query.order_by):
+        tree = None
+    out = []
+    async for item in items:
+        if match is None or match(item):
+            out.append(_pick(item, tree) if tree else item)
+    if options:
+        options["filtered"] = match is not None
+        options["picked"] = bool(tree)
+    return out
+
+
+def apply(result: Any, options: dict[str, Any]) -> Any:
+    query = options.get("query")
+    if query is not None and isinstance(result, dict) and isinstance(result.get("data"), list):
+        result = {**result, **query.run(result["data"], filtered=options.get("filtered", False))}
+    tree = options.get("fields")
+    if tree and not options.get("picked"):
+        result = _on_data(result, lambda data: _pick(data, tree))
+    return result
+
+
+def _on_data(result: Any, fn: Callable[[Any], Any]) -> Any:
+    # Tools return the PVE envelope {"data": ..., "errors"?: ...}; anything
+    # else is shaped as a whole.
+    if isinstance(result, dict) and "data" in result:
+        return {**result, "data": fn(result["data"])}
+    return fn(result)
+
+
+def _field_tree(fields: Any) -> dict[str, Any]:
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    if not isinstance(fields, list) or not all(isinstance(f, str) for f in fields):
+        raise ValueError("fields must be a list of field names")
+    # {"vmid": {}, "net": {"in": {}}}; an empty dict selects the whole field.
+    tree: dict[str, Any] = {}
+    for path in fields:
+        parts = [p for p in path.strip().split(".") if p]
+        if not parts:
+            continue
+        node = tree
+        for part in parts[:-1]:
+            if node.get(part) == {}:
+                break  # the whole field is already selected
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = {}
+    return tree
+
+
+def _pick(value: Any, tree: dict[str, Any]) -> Any:
+    """Keep only the fields in ``tree``; lists are projected element-wise.
+
+    Missing fields are left out rather than reported.
+    """
+    if isinstance(value, list):
+        return [_pick(v, tree) for v in value]
+    if not isinstance(value, dict):
+        return value
+    out = {}
+    for key, sub in tree.items():
+        if key in value:
+            out[key] = _pick(value[key], sub) if sub else value[key]
+    return out
+
+
+def _get(row: Any, path: list[str]) -> Any:
+    for part in path:
+        if not isinstance(row, dict):
+            return None
+        row = row.get(part)
+    return row
+
+
+def _path(field: Any) -> list[str]:
+    if not isinstance(field, str) or not field.strip():
+        raise ValueError(f"Invalid field: {field!r}")
+    return field.strip().split(".")
+
+
+def _duration(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str) and value[:-1].replace(".", "", 1).isdigit():
+        unit = DURATION_UNITS.get(value[-1])
+        if unit is not None:
+            return float(value[:-1]) * unit
+    if isinstance(value, str) and value.replace(".", "", 1).isdigit():
+        return float(value)
+    raise ValueError(f'Invalid duration: {value!r} (e.g. 3600, "90s", "15m", "1h", "7d")')
+
+
+def _compare(op: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    def test(actual: Any, expected: Any) -> bool:
+        try:
+            return op(actual, expected)
+        except TypeError:
+            return False  # e.g. a missing field compared with a number
+
+    return test
+
+
+def _contains(actual: Any, expected: Any) -> bool:
+    if isinstance(actual, str):
+        return str(expected).lower() in actual.lower()
+    if isinstance(actual, (list, dict)):
+        return expected in actual
+    return False
+
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda a, b: a == b,
+    "ne": lambda a, b: a != b,
+    "lt": _compare(lambda a, b: a < b),
+    "le": _compare(lambda a, b: a <= b),
+    "gt": _compare(lambda a, b: a > b),
+    "ge": _compare(lambda a, b: a >= b),
+    "in": lambda a, b: a in b,
+    "contains": _contains,
+    "exists": lambda a, b: (a is not None) == bool(b),
+    # Value is a duration; compared as ge against now minus that duration.
+    "within": _compare(lambda a, b: a >= b),
+}
+
+
+def _sort_key(value: Any, descending: bool) -> tuple[bool, int, Any]:
+    # Rows missing the field sort last either way; numbers and strings are
+    # ranked apart so mixed columns never compare across types.
+    missing = value is None
+    if isinstance(value, (int, float)):
+        rank, value = 0, value
+    elif isinstance(value, str):
+        rank = 1
+    else:
+        rank, value = 2, str(value)
+    return (missing != descending, rank, value if not missing else 0)
+
+
+class Query:
+    """A validated ``query`` argument: where, then group_by, order_by and offset/limit."""
+
+    def __init__(self, spec: Any) -> None:
+        if not isinstance(spec, dict):
+            raise ValueError("query must be an object")
+        unknown = set(spec) - set(SCHEMA["query"]["properties"])
+        if unknown:
+            raise ValueError(f"Unknown query keys: {', '.join(sorted(unknown))}")
+        self.where: list[tuple[list[str], str, Any]] = []
+        for cond in spec.get("where") or []:
+            if not isinstance(cond, dict):
+                raise ValueError("query.where entries must be objects")
+            op = cond.get("op", "eq")
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown query op: {op!r} (use {', '.join(OPERATORS)})")
+            value = cond.get("value", True if op == "exists" else None)
+            if op == "in" and not isinstance(value, list):
+                raise ValueError("query op 'in' needs a list value")
+            if op == "within":
+                value = _duration(value)
+            self.where.append((_path(cond.get("field")), op, value))
+        self.group_by = [_path(f) for f in spec.get("group_by") or []]
+        self.order_by: list[tuple[list[str], bool]] = []
+        for field in spec.get("order_by") or []:
+            descending = isinstance(field, str) and field.startswith("-")
+            self.order_by.append((_path(field[1:] if descending else field), descending))
+        self.offset = self._count(spec, "offset")
+        self.limit = self._count(spec, "limit")
+
+    @staticmethod
+    def _count(spec: dict[str, Any], key: str) -> Optional[int]:
+        value = spec.get(key)
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, int) or value < 0
+        ):
+            raise ValueError(f"query.{key} must be a non-negative integer")
+        return value
+
+    def matcher(self) -> Callable[[Any], bool]:
+        """Return a test of one row against every ``where`` condition, as of now."""
+        now = time.time()
+        conditions = [
+            (path, OPERATORS[op], now - value if op == "within" else value)
+            for path, op, value in self.where
+        ]
+        return lambda row: all(test(_get(row, path), value) for path, test, value in conditions)
+
+    def run(self, rows: list[Any], filtered: bool = False) -> dict[str, Any]:
+        """Return the reduced ``data``, plus ``total`` matches when paging.
+
+        ``filtered`` rows already passed ``where``.
+        """
+        if self.where and not filtered:
+            match = self.matcher()
+            rows = [r for r in rows if match(r)]
+        if self.group_by:
+            counts: Counter[tuple[Any, ...]] = Counter(
+                tuple(_hashable(_get(r, path)) for path in self.group_by) for r in rows
+            )
+            names = [".".join(path) for path in self.group_by]
+            rows = [
+                {**dict(zip(names, key, strict=True)), "count": n}
+                for key, n in counts.most_common()
+            ]
+        for path, descending in reversed(self.order_by):
+            rows.sort(key=lambda r: _sort_key(_get(r, path), descending), reverse=descending)
+        out: dict[str, Any] = {"data": rows}
+        if self.offset is not None or self.limit is not None:
+            start = self.offset or 0
+            end = None if self.limit is None else start + self.limit
+            out = {"data": rows[start:end], "total": len(rows)}
+        return out
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return jsonlib.dumps(value)
+    return value
+
+
+async def render(result: Any, output: str) -> str:
+    """Serialize a result; table and tsv only change results whose data is a list of objects."""
+    if output in ("table", "tsv"):
+        table = _table(result)
+        if table is not None:
+            columns, rows, extras = table
+            if output == "tsv":
+                return await _tsv(columns, rows, extras)
+            grid = [[row.get(c) for c in columns] for row in rows]
+            return await jsonlib.dumps_async({**extras, "columns": columns, "data": grid})
+        output = "compact"
+    return await jsonlib.dumps_async(result, pretty=output == "pretty")
+
+
+def _table(result: Any) -> Optional[tuple[list[str], list[dict[str, Any]], dict[str, Any]]]:
+    if not isinstance(result, dict) or not isinstance(result.get("data"), list):
+        return None
+    rows = result["data"]
+    if not all(isinstance(row, dict) for row in rows):
+        return None
+    # Union of keys in first-seen order; rows lacking a column get null.
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    extras = {k: v for k, v in result.items() if k != "data"}
+    return columns, rows, extras
+
+
+_needs_escape = re.compile(r"[\\\t\n\r]").search
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _tsv_cell(value: Any) -> str:
+    kind = type(value)
+    if kind is str:
+        return value.translate(_TSV_ESCAPES) if _needs_escape(value) else value
+    if kind is int or kind is float:
+        return str(value)
+    if value is None:
+        return ""
+    if kind is bool:
+        return "true" if value else "false"
+    return jsonlib.dumps(value).translate(_TSV_ESCAPES)
+
+
+async def _tsv(columns: list[str], rows: list[dict[str, Any]], extras: dict[str, Any]) -> str:
+    lines = [f"# {key}: {jsonlib.dumps(value)}" for key, value in extras.items()]
+    lines.append("\t".join(columns))
+    for start in range(0, len(rows), jsonlib.SLICE_ITEMS):
+        for row in rows[start : start + jsonlib.SLICE_ITEMS]:
+            lines.append("\t".join([_tsv_cell(row.get(c)) for c in columns]))
+        await asyncio.sleep(0)
+    return "\n".join(lines)
@@ -0,0 +1,109 @@
+"""On-disk cache of the PVE auth ticket so restarts can skip the login round trip."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import sys
+import time
+from typing import Any, Optional
+
+# Tickets are valid for two hours; do not reuse one that is about to expire.
+TICKET_LIFETIME = 7200.0
+REUSE_MARGIN = 300.0
+
+# Encrypted files start with a random salt for the key derivation.
+SALT_BYTES = 16
+
+
+def _fernet(passphrase: str, salt: bytes) -> Any:
+    try:
+        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+    except ImportError:
+        print(
+            "⚠ PROXMOX_TICKET_CACHE_KEY set but cryptography is not installed; "
+            "ticket cache disabled",
+            file=sys.stderr,
+        )
+        return None
+    key = Scrypt(salt=salt, length=32, n=2**14, r=8, p=1).derive(passphrase.encode())
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+class TicketCache:
+    def __init__(self, path: str, identity: str, passphrase: str = "") -> None:
+        self.path = os.path.expanduser(path)
+        # Binds a cached ticket to the user and hosts it was issued for.
+        self.identity = identity
+        self.passphrase = passphrase
+        # Derived keys by salt: Scrypt is deliberately slow, and a save
+        # after a load reuses the loaded file's salt.
+        self._fernets: dict[bytes, Any] = {}
+        self._salt: Optional[bytes] = None
+
+    def _cipher(self, salt: bytes) -> Any:
+        if salt not in self._fernets:
+            self._fernets[salt] = _fernet(self.passphrase, salt)
+        return self._fernets[salt]
+
+    def load(self) -> Optional[tuple[str, str, float]]:
+        """Return ``(ticket, csrf_token, age_seconds)`` if a reusable ticket is stored.
+
+        A missing, unreadable or malformed file counts as no cached ticket.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            if self.passphrase:
+                salt, raw = raw[:SALT_BYTES], raw[SALT_BYTES:]
+                fernet = self._cipher(salt)
+                if fernet is None:
+                    return None
+                raw = fernet.decrypt(raw)
+                self._salt = salt
+            entry = json.loads(raw)
+            ticket, csrf_token = entry["ticket"], entry["csrf_token"]
+            issued = entry["issued"]
+            if not (
+                isinstance(ticket, str)
+                and isinstance(csrf_token, str)
+                and type(issued) in (int, float)
+            ):
+                raise ValueError("unexpected contents")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠ Ignoring unreadable ticket cache {self.path}: {e!r}", file=sys.stderr)
+            return None
+        age = time.time() - issued
+        if entry.get("identity") != self.identity or not 0 <= age < TICKET_LIFETIME - REUSE_MARGIN:
+            return None
+        return ticket, csrf_token, age
+
+    def save(self, ticket: str, csrf_token: str) -> None:
+        entry = {
+            "identity": self.identity,
+            "ticket": ticket,
+            "csrf_token": csrf_token,
+            "issued": time.time(),
+        }
+        raw = json.dumps(entry).encode()
+        if self.passphrase:
+            if self._salt is None:
+                self._salt = os.urandom(SALT_BYTES)
+            fernet = self._cipher(self._salt)
+            if fernet is None:
+                return
+            raw = self._salt + fernet.encrypt(raw)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+            # Write the new file owner-only, then atomically replace the old one.
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠ Could not write ticket cache {self.path}: {e}", file=sys.stderr)
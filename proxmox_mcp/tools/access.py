@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
 OPT_BOOL = lambda desc: {"type": "boolean", "description": desc}  # noqa: E731
@@ -438,135 +436,38 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    if name == "list_users":
-        params = {k: args[k] for k in ("enabled", "full") if k in args}
-        return await client.get("/access/users", params or None)
-
-    elif name == "get_user":
-        return await client.get(f"/access/users/{args['userid']}")
-
-    elif name == "create_user":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/access/users", data)
-
-    elif name == "update_user":
-        userid = args["userid"]
-        data = {k: v for k, v in args.items() if k != "userid"}
-        return await client.put(f"/access/users/{userid}", data)
-
-    elif name == "delete_user":
-        return await client.delete(f"/access/users/{args['userid']}")
-
-    elif name == "change_user_password":
-        data = {k: v for k, v in args.items()}
-        return await client.put("/access/password", data)
-
-    elif name == "list_user_tokens":
-        return await client.get(f"/access/users/{args['userid']}/token")
-
-    elif name == "get_user_token":
-        return await client.get(f"/access/users/{args['userid']}/token/{args['tokenid']}")
-
-    elif name == "create_user_token":
-        userid = args["userid"]
-        tokenid = args["tokenid"]
-        data = {k: v for k, v in args.items() if k not in ("userid", "tokenid")}
-        return await client.post(f"/access/users/{userid}/token/{tokenid}", data or None)
-
-    elif name == "update_user_token":
-        userid = args["userid"]
-        tokenid = args["tokenid"]
-        data = {k: v for k, v in args.items() if k not in ("userid", "tokenid")}
-        return await client.put(f"/access/users/{userid}/token/{tokenid}", data)
-
-    elif name == "delete_user_token":
-        return await client.delete(f"/access/users/{args['userid']}/token/{args['tokenid']}")
-
-    elif name == "list_groups":
-        return await client.get("/access/groups")
-
-    elif name == "get_group":
-        return await client.get(f"/access/groups/{args['groupid']}")
-
-    elif name == "create_group":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/access/groups", data)
-
-    elif name == "update_group":
-        groupid = args["groupid"]
-        data = {k: v for k, v in args.items() if k != "groupid"}
-        return await client.put(f"/access/groups/{groupid}", data)
-
-    elif name == "delete_group":
-        return await client.delete(f"/access/groups/{args['groupid']}")
-
-    elif name == "list_roles":
-        return await client.get("/access/roles")
-
-    elif name == "get_role":
-        return await client.get(f"/access/roles/{args['roleid']}")
-
-    elif name == "create_role":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/access/roles", data)
-
-    elif name == "update_role":
-        roleid = args["roleid"]
-        data = {k: v for k, v in args.items() if k != "roleid"}
-        return await client.put(f"/access/roles/{roleid}", data)
-
-    elif name == "delete_role":
-        return await client.delete(f"/access/roles/{args['roleid']}")
-
-    elif name == "get_acl":
-        return await client.get("/access/acl")
-
-    elif name == "update_acl":
-        data = {k: v for k, v in args.items()}
-        return await client.put("/access/acl", data)
-
-    elif name == "list_auth_domains":
-        return await client.get("/access/domains")
-
-    elif name == "get_auth_domain":
-        return await client.get(f"/access/domains/{args['realm']}")
-
-    elif name == "create_auth_domain":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/access/domains", data)
-
-    elif name == "update_auth_domain":
-        realm = args["realm"]
-        data = {k: v for k, v in args.items() if k != "realm"}
-        return await client.put(f"/access/domains/{realm}", data)
-
-    elif name == "delete_auth_domain":
-        return await client.delete(f"/access/domains/{args['realm']}")
-
-    elif name == "sync_auth_domain":
-        realm = args["realm"]
-        data = {k: v for k, v in args.items() if k != "realm"}
-        return await client.post(f"/access/domains/{realm}/sync", data or None)
-
-    elif name == "list_tfa":
-        params = {k: args[k] for k in ("userid",) if k in args}
-        return await client.get("/access/tfa", params or None)
-
-    elif name == "get_user_tfa":
-        return await client.get(f"/access/tfa/{args['userid']}")
-
-    elif name == "add_tfa":
-        userid = args["userid"]
-        data = {k: v for k, v in args.items() if k != "userid"}
-        return await client.post(f"/access/tfa/{userid}", data)
-
-    elif name == "delete_tfa":
-        userid = args["userid"]
-        tfa_id = args["id"]
-        params = {}
-        if "password" in args:
-            params["password"] = args["password"]
-        return await client.delete(f"/access/tfa/{userid}/{tfa_id}", params or None)
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "list_users": Route("GET", "/access/users", ("enabled", "full")),
+    "get_user": Route("GET", "/access/users/{userid}"),
+    "create_user": Route("POST", "/access/users", ALL),
+    "update_user": Route("PUT", "/access/users/{userid}", ALL),
+    "delete_user": Route("DELETE", "/access/users/{userid}"),
+    "change_user_password": Route("PUT", "/access/password", ALL),
+    "list_user_tokens": Route("GET", "/access/users/{userid}/token"),
+    "get_user_token": Route("GET", "/access/users/{userid}/token/{tokenid}"),
+    "create_user_token": Route("POST", "/access/users/{userid}/token/{tokenid}", ALL),
+    "update_user_token": Route("PUT", "/access/users/{userid}/token/{tokenid}", ALL),
+    "delete_user_token": Route("DELETE", "/access/users/{userid}/token/{tokenid}"),
+    "list_groups": Route("GET", "/access/groups"),
+    "get_group": Route("GET", "/access/groups/{groupid}"),
+    "create_group": Route("POST", "/access/groups", ALL),
+    "update_group": Route("PUT", "/access/groups/{groupid}", ALL),
+    "delete_group": Route("DELETE", "/access/groups/{groupid}"),
+    "list_roles": Route("GET", "/access/roles"),
+    "get_role": Route("GET", "/access/roles/{roleid}"),
+    "create_role": Route("POST", "/access/roles", ALL),
+    "update_role": Route("PUT", "/access/roles/{roleid}", ALL),
+    "delete_role": Route("DELETE", "/access/roles/{roleid}"),
+    "get_acl": Route("GET", "/access/acl"),
+    "update_acl": Route("PUT", "/access/acl", ALL),
+    "list_auth_domains": Route("GET", "/access/domains"),
+    "get_auth_domain": Route("GET", "/access/domains/{realm}"),
+    "create_auth_domain": Route("POST", "/access/domains", ALL),
+    "update_auth_domain": Route("PUT", "/access/domains/{realm}", ALL),
+    "delete_auth_domain": Route("DELETE", "/access/domains/{realm}"),
+    "sync_auth_domain": Route("POST", "/access/domains/{realm}/sync", ALL),
+    "list_tfa": Route("GET", "/access/tfa", ("userid",)),
+    "get_user_tfa": Route("GET", "/access/tfa/{userid}"),
+    "add_tfa": Route("POST", "/access/tfa/{userid}", ALL),
+    "delete_tfa": Route("DELETE", "/access/tfa/{userid}/{id}", ("password",)),
+}
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
@@ -200,70 +198,26 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    if name == "list_acme_accounts":
-        return await client.get("/cluster/acme/account")
-
-    elif name == "get_acme_account":
-        return await client.get(f"/cluster/acme/account/{args['name']}")
-
-    elif name == "register_acme_account":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/acme/account", data)
-
-    elif name == "deregister_acme_account":
-        return await client.delete(f"/cluster/acme/account/{args['name']}")
-
-    elif name == "list_acme_plugins":
-        params = {k: args[k] for k in ("type",) if k in args}
-        return await client.get("/cluster/acme/plugins", params or None)
-
-    elif name == "get_acme_plugin":
-        return await client.get(f"/cluster/acme/plugins/{args['id']}")
-
-    elif name == "create_acme_plugin":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/acme/plugins", data)
-
-    elif name == "update_acme_plugin":
-        plugin_id = args["id"]
-        data = {k: v for k, v in args.items() if k != "id"}
-        return await client.put(f"/cluster/acme/plugins/{plugin_id}", data)
-
-    elif name == "delete_acme_plugin":
-        return await client.delete(f"/cluster/acme/plugins/{args['id']}")
-
-    elif name == "get_node_certificates":
-        return await client.get(f"/nodes/{args['node']}/certificates/info")
-
-    elif name == "order_node_acme_cert":
-        data = {}
-        if "force" in args:
-            data["force"] = args["force"]
-        return await client.post(f"/nodes/{args['node']}/certificates/acme/certificate", data or None)
-
-    elif name == "revoke_node_acme_cert":
-        return await client.delete(f"/nodes/{args['node']}/certificates/acme/certificate")
-
-    elif name == "upload_node_custom_cert":
-        node = args["node"]
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/certificates/custom", data)
-
-    elif name == "delete_node_custom_cert":
-        params = {}
-        if "restart" in args:
-            params["restart"] = args["restart"]
-        return await client.delete(f"/nodes/{args['node']}/certificates/custom", params or None)
-
-    elif name == "list_acme_directories":
-        return await client.get("/cluster/acme/directories")
-
-    elif name == "get_acme_tos":
-        params = {k: args[k] for k in ("directory",) if k in args}
-        return await client.get("/cluster/acme/tos", params or None)
-
-    elif name == "list_acme_challenge_schemas":
-        return await client.get("/cluster/acme/challenge-schema")
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "list_acme_accounts": Route("GET", "/cluster/acme/account"),
+    "get_acme_account": Route("GET", "/cluster/acme/account/{name}"),
+    "register_acme_account": Route("POST", "/cluster/acme/account", ALL),
+    "deregister_acme_account": Route("DELETE", "/cluster/acme/account/{name}"),
+    "list_acme_plugins": Route("GET", "/cluster/acme/plugins", ("type",)),
+    "get_acme_plugin": Route("GET", "/cluster/acme/plugins/{id}"),
+    "create_acme_plugin": Route("POST", "/cluster/acme/plugins", ALL),
+    "update_acme_plugin": Route("PUT", "/cluster/acme/plugins/{id}", ALL),
+    "delete_acme_plugin": Route("DELETE", "/cluster/acme/plugins/{id}"),
+    "get_node_certificates": Route("GET", "/nodes/{node}/certificates/info"),
+    "order_node_acme_cert": Route(
+        "POST", "/nodes/{node}/certificates/acme/certificate", ("force",)
+    ),
+    "revoke_node_acme_cert": Route("DELETE", "/nodes/{node}/certificates/acme/certificate"),
+    "upload_node_custom_cert": Route("POST", "/nodes/{node}/certificates/custom", ALL),
+    "delete_node_custom_cert": Route(
+        "DELETE", "/nodes/{node}/certificates/custom", ("restart",)
+    ),
+    "list_acme_directories": Route("GET", "/cluster/acme/directories"),
+    "get_acme_tos": Route("GET", "/cluster/acme/tos", ("directory",)),
+    "list_acme_challenge_schemas": Route("GET", "/cluster/acme/challenge-schema"),
+}
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
@@ -408,128 +406,42 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    node = args.get("node", "")
-
-    if name == "get_ceph_status":
-        return await client.get(f"/nodes/{node}/ceph/status")
-
-    elif name == "get_cluster_ceph_status":
-        return await client.get("/cluster/ceph/status")
-
-    elif name == "get_ceph_crush":
-        return await client.get(f"/nodes/{node}/ceph/crush")
-
-    elif name == "get_ceph_log":
-        params = {k: args[k] for k in ("limit",) if k in args}
-        return await client.get(f"/nodes/{node}/ceph/log", params or None)
-
-    elif name == "get_ceph_config":
-        return await client.get(f"/nodes/{node}/ceph/cfg/raw")
-
-    elif name == "get_ceph_config_db":
-        return await client.get(f"/nodes/{node}/ceph/cfg/db")
-
-    elif name == "list_ceph_osds":
-        return await client.get(f"/nodes/{node}/ceph/osd")
-
-    elif name == "create_ceph_osd":
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/ceph/osd", data)
-
-    elif name == "delete_ceph_osd":
-        params = {k: args[k] for k in ("cleanup", "destroy") if k in args}
-        return await client.delete(f"/nodes/{node}/ceph/osd/{args['osdid']}", params or None)
-
-    elif name == "set_ceph_osd_in":
-        return await client.post(f"/nodes/{node}/ceph/osd/{args['osdid']}/in")
-
-    elif name == "set_ceph_osd_out":
-        return await client.post(f"/nodes/{node}/ceph/osd/{args['osdid']}/out")
-
-    elif name == "list_ceph_mons":
-        return await client.get(f"/nodes/{node}/ceph/mon")
-
-    elif name == "create_ceph_mon":
-        data = {k: v for k, v in args.items() if k not in ("node",)}
-        return await client.post(f"/nodes/{node}/ceph/mon", data or None)
-
-    elif name == "delete_ceph_mon":
-        return await client.delete(f"/nodes/{node}/ceph/mon/{args['monid']}")
-
-    elif name == "list_ceph_mgrs":
-        return await client.get(f"/nodes/{node}/ceph/mgr")
-
-    elif name == "create_ceph_mgr":
-        data = {k: v for k, v in args.items() if k not in ("node",)}
-        return await client.post(f"/nodes/{node}/ceph/mgr", data or None)
-
-    elif name == "delete_ceph_mgr":
-        return await client.delete(f"/nodes/{node}/ceph/mgr/{args['id']}")
-
-    elif name == "list_ceph_mds":
-        return await client.get(f"/nodes/{node}/ceph/mds")
-
-    elif name == "create_ceph_mds":
-        data = {k: v for k, v in args.items() if k not in ("node",)}
-        return await client.post(f"/nodes/{node}/ceph/mds", data or None)
-
-    elif name == "delete_ceph_mds":
-        return await client.delete(f"/nodes/{node}/ceph/mds/{args['name']}")
-
-    elif name == "list_ceph_pools":
-        return await client.get(f"/nodes/{node}/ceph/pool")
-
-    elif name == "get_ceph_pool":
-        return await client.get(f"/nodes/{node}/ceph/pool/{args['name']}")
-
-    elif name == "create_ceph_pool":
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/ceph/pool", data)
-
-    elif name == "update_ceph_pool":
-        pool_name = args["name"]
-        data = {k: v for k, v in args.items() if k not in ("node", "name")}
-        return await client.put(f"/nodes/{node}/ceph/pool/{pool_name}", data)
-
-    elif name == "delete_ceph_pool":
-        params = {k: args[k] for k in ("force", "remove_storages", "remove_ecprofile") if k in args}
-        return await client.delete(f"/nodes/{node}/ceph/pool/{args['name']}", params or None)
-
-    elif name == "list_ceph_fs":
-        return await client.get(f"/nodes/{node}/ceph/fs")
-
-    elif name == "create_ceph_fs":
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/ceph/fs", data or None)
-
-    elif name == "start_ceph":
-        data = {}
-        if "service" in args:
-            data["service"] = args["service"]
-        return await client.post(f"/nodes/{node}/ceph/start", data or None)
-
-    elif name == "stop_ceph":
-        data = {}
-        if "service" in args:
-            data["service"] = args["service"]
-        return await client.post(f"/nodes/{node}/ceph/stop", data or None)
-
-    elif name == "restart_ceph":
-        data = {}
-        if "service" in args:
-            data["service"] = args["service"]
-        return await client.post(f"/nodes/{node}/ceph/restart", data or None)
-
-    elif name == "get_cluster_ceph_metadata":
-        params = {k: args[k] for k in ("type",) if k in args}
-        return await client.get("/cluster/ceph/metadata", params or None)
-
-    elif name == "get_cluster_ceph_flags":
-        return await client.get("/cluster/ceph/flags")
-
-    elif name == "set_cluster_ceph_flags":
-        data = {k: v for k, v in args.items()}
-        return await client.put("/cluster/ceph/flags", data)
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "get_ceph_status": Route("GET", "/nodes/{node}/ceph/status"),
+    "get_cluster_ceph_status": Route("GET", "/cluster/ceph/status"),
+    "get_ceph_crush": Route("GET", "/nodes/{node}/ceph/crush"),
+    "get_ceph_log": Route("GET", "/nodes/{node}/ceph/log", ("limit",)),
+    "get_ceph_config": Route("GET", "/nodes/{node}/ceph/cfg/raw"),
+    "get_ceph_config_db": Route("GET", "/nodes/{node}/ceph/cfg/db"),
+    "list_ceph_osds": Route("GET", "/nodes/{node}/ceph/osd"),
+    "create_ceph_osd": Route("POST", "/nodes/{node}/ceph/osd", ALL),
+    "delete_ceph_osd": Route("DELETE", "/nodes/{node}/ceph/osd/{osdid}", ("cleanup", "destroy")),
+    "set_ceph_osd_in": Route("POST", "/nodes/{node}/ceph/osd/{osdid}/in"),
+    "set_ceph_osd_out": Route("POST", "/nodes/{node}/ceph/osd/{osdid}/out"),
+    "list_ceph_mons": Route("GET", "/nodes/{node}/ceph/mon"),
+    "create_ceph_mon": Route("POST", "/nodes/{node}/ceph/mon", ALL),
+    "delete_ceph_mon": Route("DELETE", "/nodes/{node}/ceph/mon/{monid}"),
+    "list_ceph_mgrs": Route("GET", "/nodes/{node}/ceph/mgr"),
+    "create_ceph_mgr": Route("POST", "/nodes/{node}/ceph/mgr", ALL),
+    "delete_ceph_mgr": Route("DELETE", "/nodes/{node}/ceph/mgr/{id}"),
+    "list_ceph_mds": Route("GET", "/nodes/{node}/ceph/mds"),
+    "create_ceph_mds": Route("POST", "/nodes/{node}/ceph/mds", ALL),
+    "delete_ceph_mds": Route("DELETE", "/nodes/{node}/ceph/mds/{name}"),
+    "list_ceph_pools": Route("GET", "/nodes/{node}/ceph/pool"),
+    "get_ceph_pool": Route("GET", "/nodes/{node}/ceph/pool/{name}"),
+    "create_ceph_pool": Route("POST", "/nodes/{node}/ceph/pool", ALL),
+    "update_ceph_pool": Route("PUT", "/nodes/{node}/ceph/pool/{name}", ALL),
+    "delete_ceph_pool": Route(
+        "DELETE",
+        "/nodes/{node}/ceph/pool/{name}",
+        ("force", "remove_storages", "remove_ecprofile"),
+    ),
+    "list_ceph_fs": Route("GET", "/nodes/{node}/ceph/fs"),
+    "create_ceph_fs": Route("POST", "/nodes/{node}/ceph/fs", ALL),
+    "start_ceph": Route("POST", "/nodes/{node}/ceph/start", ("service",)),
+    "stop_ceph": Route("POST", "/nodes/{node}/ceph/stop", ("service",)),
+    "restart_ceph": Route("POST", "/nodes/{node}/ceph/restart", ("service",)),
+    "get_cluster_ceph_metadata": Route("GET", "/cluster/ceph/metadata", ("type",)),
+    "get_cluster_ceph_flags": Route("GET", "/cluster/ceph/flags"),
+    "set_cluster_ceph_flags": Route("PUT", "/cluster/ceph/flags", ALL),
+}
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 OPT_INT = lambda desc: {"type": "integer", "description": desc}  # noqa: E731
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
@@ -461,151 +459,74 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    if name == "get_cluster_status":
-        return await client.get("/cluster/status")
-
-    elif name == "get_cluster_resources":
-        params = {k: args[k] for k in ("type",) if k in args}
-        return await client.get("/cluster/resources", params or None)
-
-    elif name == "get_cluster_version":
-        return await client.get("/version")
-
-    elif name == "get_cluster_nextid":
-        params = {k: args[k] for k in ("vmid",) if k in args}
-        return await client.get("/cluster/nextid", params or None)
-
-    elif name == "get_cluster_options":
-        return await client.get("/cluster/options")
-
-    elif name == "set_cluster_options":
-        data = {k: v for k, v in args.items()}
-        return await client.put("/cluster/options", data)
-
-    elif name == "get_cluster_log":
-        params = {k: args[k] for k in ("max",) if k in args}
-        return await client.get("/cluster/log", params or None)
-
-    elif name == "list_cluster_tasks":
-        return await client.get("/cluster/tasks")
-
-    elif name == "list_node_tasks":
-        node = args["node"]
-        params = {k: args[k] for k in ("limit", "start", "source", "statusfilter", "typefilter", "userfilter", "vmid", "since", "until") if k in args}
-        return await client.get(f"/nodes/{node}/tasks", params or None)
-
-    elif name == "get_task_status":
-        return await client.get(f"/nodes/{args['node']}/tasks/{args['upid']}/status")
-
-    elif name == "get_task_log":
-        params = {k: args[k] for k in ("limit", "start", "download") if k in args}
-        return await client.get(f"/nodes/{args['node']}/tasks/{args['upid']}/log", params or None)
-
-    elif name == "stop_task":
-        return await client.delete(f"/nodes/{args['node']}/tasks/{args['upid']}")
-
-    elif name == "list_ha_resources":
-        params = {k: args[k] for k in ("type",) if k in args}
-        return await client.get("/cluster/ha/resources", params or None)
-
-    elif name == "get_ha_resource":
-        return await client.get(f"/cluster/ha/resources/{args['sid']}")
-
-    elif name == "add_ha_resource":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/ha/resources", data)
-
-    elif name == "update_ha_resource":
-        sid = args["sid"]
-        data = {k: v for k, v in args.items() if k != "sid"}
-        return await client.put(f"/cluster/ha/resources/{sid}", data)
-
-    elif name == "delete_ha_resource":
-        return await client.delete(f"/cluster/ha/resources/{args['sid']}")
-
-    elif name == "list_ha_groups":
-        return await client.get("/cluster/ha/groups")
-
-    elif name == "get_ha_status":
-        return await client.get("/cluster/ha/status/current")
-
-    elif name == "list_replication_jobs":
-        params = {k: args[k] for k in ("guest",) if k in args}
-        return await client.get("/cluster/replication", params or None)
-
-    elif name == "get_replication_job":
-        return await client.get(f"/cluster/replication/{args['id']}")
-
-    elif name == "create_replication_job":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/replication", data)
-
-    elif name == "update_replication_job":
-        job_id = args["id"]
-        data = {k: v for k, v in args.items() if k != "id"}
-        return await client.put(f"/cluster/replication/{job_id}", data)
-
-    elif name == "delete_replication_job":
-        params = {k: args[k] for k in ("force", "keep") if k in args}
-        return await client.delete(f"/cluster/replication/{args['id']}", params or None)
-
-    elif name == "list_backup_jobs":
-        return await client.get("/cluster/backup")
-
-    elif name == "get_backup_job":
-        return await client.get(f"/cluster/backup/{args['id']}")
-
-    elif name == "create_backup_job":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/backup", data)
-
-    elif name == "update_backup_job":
-        job_id = args["id"]
-        data = {k: v for k, v in args.items() if k != "id"}
-        return await client.put(f"/cluster/backup/{job_id}", data)
-
-    elif name == "delete_backup_job":
-        return await client.delete(f"/cluster/backup/{args['id']}")
-
-    elif name == "bulk_start_guests":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/bulk-action/guest/start", data or None)
-
-    elif name == "bulk_shutdown_guests":
-        data = {}
-        if "vms" in args:
-            data["vms"] = args["vms"]
-        if "force_stop" in args:
-            data["force-stop"] = args["force_stop"]
-        return await client.post("/cluster/bulk-action/guest/shutdown", data or None)
-
-    elif name == "bulk_migrate_guests":
-        data = {"target": args["target"]}
-        if "vms" in args:
-            data["vms"] = args["vms"]
-        if "maxworkers" in args:
-            data["maxworkers"] = args["maxworkers"]
-        if "with_local_disks" in args:
-            data["with-local-disks"] = args["with_local_disks"]
-        return await client.post("/cluster/bulk-action/guest/migrate", data)
-
-    elif name == "list_metrics_servers":
-        return await client.get("/cluster/metrics/server")
-
-    elif name == "create_metrics_server":
-        server_id = args["id"]
-        data = {k: v for k, v in args.items() if k != "id"}
-        return await client.post(f"/cluster/metrics/server/{server_id}", data)
-
-    elif name == "delete_metrics_server":
-        return await client.delete(f"/cluster/metrics/server/{args['id']}")
-
-    elif name == "list_realm_sync_jobs":
-        return await client.get("/cluster/jobs/realm-sync")
-
-    elif name == "analyze_schedule":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/jobs/schedule-analyze", data)
-
-    raise ValueError(f"Unknown tool: {name}")
+PRIORITY = {
+    "bulk_start_guests": "bulk",
+    "bulk_shutdown_guests": "bulk",
+    "bulk_migrate_guests": "bulk",
+    "list_cluster_tasks": "background",
+}
+
+
+ROUTES = {
+    "get_cluster_status": Route("GET", "/cluster/status"),
+    "get_cluster_resources": Route("GET", "/cluster/resources", ("type",), stream=True),
+    "get_cluster_version": Route("GET", "/version"),
+    "get_cluster_nextid": Route("GET", "/cluster/nextid", ("vmid",)),
+    "get_cluster_options": Route("GET", "/cluster/options"),
+    "set_cluster_options": Route("PUT", "/cluster/options", ALL),
+    "get_cluster_log": Route("GET", "/cluster/log", ("max",)),
+    "list_cluster_tasks": Route("GET", "/cluster/tasks", stream=True),
+    "list_node_tasks": Route(
+        "GET",
+        "/nodes/{node}/tasks",
+        (
+            "limit",
+            "start",
+            "source",
+            "statusfilter",
+            "typefilter",
+            "userfilter",
+            "vmid",
+            "since",
+            "until",
+        ),
+    ),
+    "get_task_status": Route("GET", "/nodes/{node}/tasks/{upid}/status"),
+    "get_task_log": Route("GET", "/nodes/{node}/tasks/{upid}/log", ("limit", "start", "download")),
+    "stop_task": Route("DELETE", "/nodes/{node}/tasks/{upid}"),
+    "list_ha_resources": Route("GET", "/cluster/ha/resources", ("type",)),
+    "get_ha_resource": Route("GET", "/cluster/ha/resources/{sid}"),
+    "add_ha_resource": Route("POST", "/cluster/ha/resources", ALL),
+    "update_ha_resource": Route("PUT", "/cluster/ha/resources/{sid}", ALL),
+    "delete_ha_resource": Route("DELETE", "/cluster/ha/resources/{sid}"),
+    "list_ha_groups": Route("GET", "/cluster/ha/groups"),
+    "get_ha_status": Route("GET", "/cluster/ha/status/current"),
+    "list_replication_jobs": Route("GET", "/cluster/replication", ("guest",)),
+    "get_replication_job": Route("GET", "/cluster/replication/{id}"),
+    "create_replication_job": Route("POST", "/cluster/replication", ALL),
+    "update_replication_job": Route("PUT", "/cluster/replication/{id}", ALL),
+    "delete_replication_job": Route("DELETE", "/cluster/replication/{id}", ("force", "keep")),
+    "list_backup_jobs": Route("GET", "/cluster/backup"),
+    "get_backup_job": Route("GET", "/cluster/backup/{id}"),
+    "create_backup_job": Route("POST", "/cluster/backup", ALL),
+    "update_backup_job": Route("PUT", "/cluster/backup/{id}", ALL),
+    "delete_backup_job": Route("DELETE", "/cluster/backup/{id}"),
+    "bulk_start_guests": Route("POST", "/cluster/bulk-action/guest/start", ALL),
+    "bulk_shutdown_guests": Route(
+        "POST",
+        "/cluster/bulk-action/guest/shutdown",
+        ("vms", "force_stop"),
+        rename={"force_stop": "force-stop"},
+    ),
+    "bulk_migrate_guests": Route(
+        "POST",
+        "/cluster/bulk-action/guest/migrate",
+        ("target", "vms", "maxworkers", "with_local_disks"),
+        rename={"with_local_disks": "with-local-disks"},
+    ),
+    "list_metrics_servers": Route("GET", "/cluster/metrics/server"),
+    "create_metrics_server": Route("POST", "/cluster/metrics/server/{id}", ALL),
+    "delete_metrics_server": Route("DELETE", "/cluster/metrics/server/{id}"),
+    "list_realm_sync_jobs": Route("GET", "/cluster/jobs/realm-sync"),
+    "analyze_schedule": Route("POST", "/cluster/jobs/schedule-analyze", ALL),
+}
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
@@ -242,79 +240,38 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    node = args.get("node", "")
-
-    if name == "list_node_disks":
-        params = {k: args[k] for k in ("include-partitions", "skipsmart", "type") if k in args}
-        return await client.get(f"/nodes/{node}/disks/list", params or None)
-
-    elif name == "get_disk_smart":
-        params: dict[str, Any] = {"disk": args["disk"]}
-        if "healthonly" in args:
-            params["healthonly"] = args["healthonly"]
-        return await client.get(f"/nodes/{node}/disks/smart", params)
-
-    elif name == "wipe_disk":
-        return await client.put(f"/nodes/{node}/disks/wipedisk", {"disk": args["disk"]})
-
-    elif name == "init_disk_gpt":
-        data = {"disk": args["disk"]}
-        if "uuid" in args:
-            data["uuid"] = args["uuid"]
-        return await client.post(f"/nodes/{node}/disks/initgpt", data)
-
-    elif name == "list_lvm_groups":
-        return await client.get(f"/nodes/{node}/disks/lvm")
-
-    elif name == "create_lvm_group":
-        data = {"name": args["name"], "device": args["device"]}
-        if "add_storage" in args:
-            data["add_storage"] = args["add_storage"]
-        return await client.post(f"/nodes/{node}/disks/lvm", data)
-
-    elif name == "delete_lvm_group":
-        params = {k: args[k] for k in ("cleanup-config", "cleanup-disks") if k in args}
-        return await client.delete(f"/nodes/{node}/disks/lvm/{args['name']}", params or None)
-
-    elif name == "list_lvmthin_pools":
-        params = {k: args[k] for k in ("vg",) if k in args}
-        return await client.get(f"/nodes/{node}/disks/lvmthin", params or None)
-
-    elif name == "create_lvmthin_pool":
-        data = {"name": args["name"], "device": args["device"]}
-        if "add_storage" in args:
-            data["add_storage"] = args["add_storage"]
-        return await client.post(f"/nodes/{node}/disks/lvmthin", data)
-
-    elif name == "delete_lvmthin_pool":
-        params = {k: args[k] for k in ("cleanup-config", "cleanup-disks") if k in args}
-        params["volume-group"] = args["volume-group"]
-        return await client.delete(f"/nodes/{node}/disks/lvmthin/{args['name']}", params)
-
-    elif name == "list_zfs_pools":
-        return await client.get(f"/nodes/{node}/disks/zfs")
-
-    elif name == "get_zfs_pool":
-        return await client.get(f"/nodes/{node}/disks/zfs/{args['name']}")
-
-    elif name == "create_zfs_pool":
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/disks/zfs", data)
-
-    elif name == "delete_zfs_pool":
-        params = {k: args[k] for k in ("cleanup-config", "cleanup-disks", "force") if k in args}
-        return await client.delete(f"/nodes/{node}/disks/zfs/{args['name']}", params or None)
-
-    elif name == "list_directory_storage":
-        return await client.get(f"/nodes/{node}/disks/directory")
-
-    elif name == "create_directory_storage":
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/disks/directory", data)
-
-    elif name == "delete_directory_storage":
-        params = {k: args[k] for k in ("cleanup-config", "cleanup-disks") if k in args}
-        return await client.delete(f"/nodes/{node}/disks/directory/{args['name']}", params or None)
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "list_node_disks": Route(
+        "GET", "/nodes/{node}/disks/list", ("include-partitions", "skipsmart", "type")
+    ),
+    "get_disk_smart": Route("GET", "/nodes/{node}/disks/smart", ("disk", "healthonly")),
+    "wipe_disk": Route("PUT", "/nodes/{node}/disks/wipedisk", ("disk",)),
+    "init_disk_gpt": Route("POST", "/nodes/{node}/disks/initgpt", ("disk", "uuid")),
+    "list_lvm_groups": Route("GET", "/nodes/{node}/disks/lvm"),
+    "create_lvm_group": Route(
+        "POST", "/nodes/{node}/disks/lvm", ("name", "device", "add_storage")
+    ),
+    "delete_lvm_group": Route(
+        "DELETE", "/nodes/{node}/disks/lvm/{name}", ("cleanup-config", "cleanup-disks")
+    ),
+    "list_lvmthin_pools": Route("GET", "/nodes/{node}/disks/lvmthin", ("vg",)),
+    "create_lvmthin_pool": Route(
+        "POST", "/nodes/{node}/disks/lvmthin", ("name", "device", "add_storage")
+    ),
+    "delete_lvmthin_pool": Route(
+        "DELETE",
+        "/nodes/{node}/disks/lvmthin/{name}",
+        ("cleanup-config", "cleanup-disks", "volume-group"),
+    ),
+    "list_zfs_pools": Route("GET", "/nodes/{node}/disks/zfs"),
+    "get_zfs_pool": Route("GET", "/nodes/{node}/disks/zfs/{name}"),
+    "create_zfs_pool": Route("POST", "/nodes/{node}/disks/zfs", ALL),
+    "delete_zfs_pool": Route(
+        "DELETE", "/nodes/{node}/disks/zfs/{name}", ("cleanup-config", "cleanup-disks", "force")
+    ),
+    "list_directory_storage": Route("GET", "/nodes/{node}/disks/directory"),
+    "create_directory_storage": Route("POST", "/nodes/{node}/disks/directory", ALL),
+    "delete_directory_storage": Route(
+        "DELETE", "/nodes/{node}/disks/directory/{name}", ("cleanup-config", "cleanup-disks")
+    ),
+}
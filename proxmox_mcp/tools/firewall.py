@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
 OPT_INT = lambda desc: {"type": "integer", "description": desc}  # noqa: E731
@@ -406,127 +404,46 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    if name == "list_cluster_firewall_rules":
-        return await client.get("/cluster/firewall/rules")
-
-    elif name == "add_cluster_firewall_rule":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/firewall/rules", data)
-
-    elif name == "update_cluster_firewall_rule":
-        pos = args["pos"]
-        data = {k: v for k, v in args.items() if k != "pos"}
-        return await client.put(f"/cluster/firewall/rules/{pos}", data)
-
-    elif name == "delete_cluster_firewall_rule":
-        params = {k: args[k] for k in ("digest",) if k in args}
-        return await client.delete(f"/cluster/firewall/rules/{args['pos']}", params or None)
-
-    elif name == "get_cluster_firewall_options":
-        return await client.get("/cluster/firewall/options")
-
-    elif name == "set_cluster_firewall_options":
-        data = {k: v for k, v in args.items()}
-        return await client.put("/cluster/firewall/options", data)
-
-    elif name == "list_firewall_groups":
-        return await client.get("/cluster/firewall/groups")
-
-    elif name == "create_firewall_group":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/firewall/groups", data)
-
-    elif name == "delete_firewall_group":
-        return await client.delete(f"/cluster/firewall/groups/{args['group']}")
-
-    elif name == "list_firewall_group_rules":
-        return await client.get(f"/cluster/firewall/groups/{args['group']}")
-
-    elif name == "add_firewall_group_rule":
-        group = args["group"]
-        data = {k: v for k, v in args.items() if k != "group"}
-        return await client.post(f"/cluster/firewall/groups/{group}", data)
-
-    elif name == "delete_firewall_group_rule":
-        params = {k: args[k] for k in ("digest",) if k in args}
-        return await client.delete(f"/cluster/firewall/groups/{args['group']}/{args['pos']}", params or None)
-
-    elif name == "list_firewall_aliases":
-        return await client.get("/cluster/firewall/aliases")
-
-    elif name == "create_firewall_alias":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/firewall/aliases", data)
-
-    elif name == "update_firewall_alias":
-        name_val = args["name"]
-        data = {k: v for k, v in args.items() if k != "name"}
-        return await client.put(f"/cluster/firewall/aliases/{name_val}", data)
-
-    elif name == "delete_firewall_alias":
-        params = {k: args[k] for k in ("digest",) if k in args}
-        return await client.delete(f"/cluster/firewall/aliases/{args['name']}", params or None)
-
-    elif name == "list_firewall_ipsets":
-        return await client.get("/cluster/firewall/ipset")
-
-    elif name == "create_firewall_ipset":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/firewall/ipset", data)
-
-    elif name == "delete_firewall_ipset":
-        params = {k: args[k] for k in ("force",) if k in args}
-        return await client.delete(f"/cluster/firewall/ipset/{args['name']}", params or None)
-
-    elif name == "list_firewall_ipset_entries":
-        return await client.get(f"/cluster/firewall/ipset/{args['name']}")
-
-    elif name == "add_firewall_ipset_entry":
-        ipset_name = args["name"]
-        data = {k: v for k, v in args.items() if k != "name"}
-        return await client.post(f"/cluster/firewall/ipset/{ipset_name}", data)
-
-    elif name == "delete_firewall_ipset_entry":
-        from urllib.parse import quote
-        cidr = quote(args["cidr"], safe="")
-        params = {k: args[k] for k in ("digest",) if k in args}
-        return await client.delete(f"/cluster/firewall/ipset/{args['name']}/{cidr}", params or None)
-
-    elif name == "list_node_firewall_rules":
-        return await client.get(f"/nodes/{args['node']}/firewall/rules")
-
-    elif name == "add_node_firewall_rule":
-        node = args["node"]
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/firewall/rules", data)
-
-    elif name == "delete_node_firewall_rule":
-        params = {k: args[k] for k in ("digest",) if k in args}
-        return await client.delete(f"/nodes/{args['node']}/firewall/rules/{args['pos']}", params or None)
-
-    elif name == "get_node_firewall_options":
-        return await client.get(f"/nodes/{args['node']}/firewall/options")
-
-    elif name == "set_node_firewall_options":
-        node = args["node"]
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.put(f"/nodes/{node}/firewall/options", data)
-
-    elif name == "get_node_firewall_log":
-        node = args["node"]
-        params = {k: args[k] for k in ("limit", "start", "since", "until") if k in args}
-        return await client.get(f"/nodes/{node}/firewall/log", params or None)
-
-    elif name == "get_cluster_firewall_log":
-        params = {k: args[k] for k in ("limit", "start", "since", "until") if k in args}
-        return await client.get("/cluster/firewall/log", params or None)
-
-    elif name == "list_firewall_macros":
-        return await client.get("/cluster/firewall/macros")
-
-    elif name == "list_firewall_refs":
-        params = {k: args[k] for k in ("type",) if k in args}
-        return await client.get("/cluster/firewall/refs", params or None)
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "list_cluster_firewall_rules": Route("GET", "/cluster/firewall/rules"),
+    "add_cluster_firewall_rule": Route("POST", "/cluster/firewall/rules", ALL),
+    "update_cluster_firewall_rule": Route("PUT", "/cluster/firewall/rules/{pos}", ALL),
+    "delete_cluster_firewall_rule": Route("DELETE", "/cluster/firewall/rules/{pos}", ("digest",)),
+    "get_cluster_firewall_options": Route("GET", "/cluster/firewall/options"),
+    "set_cluster_firewall_options": Route("PUT", "/cluster/firewall/options", ALL),
+    "list_firewall_groups": Route("GET", "/cluster/firewall/groups"),
+    "create_firewall_group": Route("POST", "/cluster/firewall/groups", ALL),
+    "delete_firewall_group": Route("DELETE", "/cluster/firewall/groups/{group}"),
+    "list_firewall_group_rules": Route("GET", "/cluster/firewall/groups/{group}"),
+    "add_firewall_group_rule": Route("POST", "/cluster/firewall/groups/{group}", ALL),
+    "delete_firewall_group_rule": Route(
+        "DELETE", "/cluster/firewall/groups/{group}/{pos}", ("digest",)
+    ),
+    "list_firewall_aliases": Route("GET", "/cluster/firewall/aliases"),
+    "create_firewall_alias": Route("POST", "/cluster/firewall/aliases", ALL),
+    "update_firewall_alias": Route("PUT", "/cluster/firewall/aliases/{name}", ALL),
+    "delete_firewall_alias": Route("DELETE", "/cluster/firewall/aliases/{name}", ("digest",)),
+    "list_firewall_ipsets": Route("GET", "/cluster/firewall/ipset"),
+    "create_firewall_ipset": Route("POST", "/cluster/firewall/ipset", ALL),
+    "delete_firewall_ipset": Route("DELETE", "/cluster/firewall/ipset/{name}", ("force",)),
+    "list_firewall_ipset_entries": Route("GET", "/cluster/firewall/ipset/{name}"),
+    "add_firewall_ipset_entry": Route("POST", "/cluster/firewall/ipset/{name}", ALL),
+    "delete_firewall_ipset_entry": Route(
+        "DELETE", "/cluster/firewall/ipset/{name}/{cidr}", ("digest",), quoted=("cidr",)
+    ),
+    "list_node_firewall_rules": Route("GET", "/nodes/{node}/firewall/rules"),
+    "add_node_firewall_rule": Route("POST", "/nodes/{node}/firewall/rules", ALL),
+    "delete_node_firewall_rule": Route(
+        "DELETE", "/nodes/{node}/firewall/rules/{pos}", ("digest",)
+    ),
+    "get_node_firewall_options": Route("GET", "/nodes/{node}/firewall/options"),
+    "set_node_firewall_options": Route("PUT", "/nodes/{node}/firewall/options", ALL),
+    "get_node_firewall_log": Route(
+        "GET", "/nodes/{node}/firewall/log", ("limit", "start", "since", "until")
+    ),
+    "get_cluster_firewall_log": Route(
+        "GET", "/cluster/firewall/log", ("limit", "start", "since", "until")
+    ),
+    "list_firewall_macros": Route("GET", "/cluster/firewall/macros"),
+    "list_firewall_refs": Route("GET", "/cluster/firewall/refs", ("type",)),
+}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 VMID = {"type": "integer", "description": "Container ID"}
@@ -16,11 +17,16 @@ OPT_BOOL = lambda desc: {"type": "boolean", "description": desc}  # noqa: E731
 TOOLS = [
     {
         "name": "list_containers",
-        "description": "List all LXC containers on a node.",
+        "description": "List all LXC containers on a node or cluster-wide.",
         "inputSchema": {
             "type": "object",
-            "properties": {"node": NODE},
-            "required": ["node"],
+            "properties": {
+                "node": {**NODE, "description": "Node name (optional — omit for cluster-wide)"},
+                "full": OPT_BOOL(
+                    "Cluster-wide only: query every node for runtime fields "
+                    "instead of the single /cluster/resources inventory"
+                ),
+            },
         },
     },
     {
@@ -425,129 +431,65 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    node = args.get("node", "")
-    vmid = args.get("vmid", "")
-    base = f"/nodes/{node}/lxc"
-    ct = f"{base}/{vmid}"
-
-    if name == "list_containers":
-        return await client.get(base)
-
-    elif name == "get_container_status":
-        return await client.get(f"{ct}/status/current")
-
-    elif name == "get_container_config":
-        params: dict[str, Any] = {}
-        if args.get("current"):
-            params["current"] = 1
-        if "snapshot" in args:
-            params["snapshot"] = args["snapshot"]
-        return await client.get(f"{ct}/config", params or None)
-
-    elif name == "set_container_config":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.put(f"{ct}/config", data)
-
-    elif name == "get_container_pending":
-        return await client.get(f"{ct}/pending")
-
-    elif name == "start_container":
-        data = {k: args[k] for k in ("skiplock", "debug") if k in args}
-        return await client.post(f"{ct}/status/start", data or None)
-
-    elif name == "stop_container":
-        data = {k: args[k] for k in ("skiplock", "overrule-shutdown") if k in args}
-        return await client.post(f"{ct}/status/stop", data or None)
-
-    elif name == "shutdown_container":
-        data = {k: args[k] for k in ("timeout", "forceStop", "skiplock") if k in args}
-        return await client.post(f"{ct}/status/shutdown", data or None)
-
-    elif name == "reboot_container":
-        data = {k: args[k] for k in ("timeout",) if k in args}
-        return await client.post(f"{ct}/status/reboot", data or None)
-
-    elif name == "suspend_container":
-        return await client.post(f"{ct}/status/suspend")
-
-    elif name == "resume_container":
-        return await client.post(f"{ct}/status/resume")
-
-    elif name == "create_container":
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(base, data)
-
-    elif name == "clone_container":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{ct}/clone", data)
-
-    elif name == "delete_container":
-        params = {k: args[k] for k in ("purge", "destroy-unreferenced-disks", "force") if k in args}
-        return await client.delete(ct, params or None)
-
-    elif name == "resize_container_disk":
-        data = {"disk": args["disk"], "size": args["size"]}
-        if "digest" in args:
-            data["digest"] = args["digest"]
-        return await client.put(f"{ct}/resize", data)
-
-    elif name == "move_container_disk":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{ct}/move_volume", data)
-
-    elif name == "migrate_container":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{ct}/migrate", data)
-
-    elif name == "list_container_snapshots":
-        return await client.get(f"{ct}/snapshot")
-
-    elif name == "create_container_snapshot":
-        data = {"snapname": args["snapname"]}
-        if "description" in args:
-            data["description"] = args["description"]
-        return await client.post(f"{ct}/snapshot", data)
-
-    elif name == "rollback_container_snapshot":
-        data = {}
-        if "start" in args:
-            data["start"] = args["start"]
-        return await client.post(f"{ct}/snapshot/{args['snapname']}/rollback", data or None)
-
-    elif name == "delete_container_snapshot":
-        params = {}
-        if "force" in args:
-            params["force"] = args["force"]
-        return await client.delete(f"{ct}/snapshot/{args['snapname']}", params or None)
-
-    elif name == "get_container_firewall_rules":
-        return await client.get(f"{ct}/firewall/rules")
-
-    elif name == "add_container_firewall_rule":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{ct}/firewall/rules", data)
-
-    elif name == "delete_container_firewall_rule":
-        params = {}
-        if "digest" in args:
-            params["digest"] = args["digest"]
-        return await client.delete(f"{ct}/firewall/rules/{args['pos']}", params or None)
-
-    elif name == "get_container_firewall_options":
-        return await client.get(f"{ct}/firewall/options")
-
-    elif name == "set_container_firewall_options":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.put(f"{ct}/firewall/options", data)
-
-    elif name == "get_container_rrddata":
-        params = {"timeframe": args["timeframe"]}
-        if "cf" in args:
-            params["cf"] = args["cf"]
-        return await client.get(f"{ct}/rrddata", params)
-
-    elif name == "convert_container_to_template":
-        return await client.post(f"{ct}/template")
-
-    raise ValueError(f"Unknown tool: {name}")
+PRIORITY = {
+    "clone_container": "bulk",
+    "migrate_container": "bulk",
+    "create_container_snapshot": "bulk",
+    "rollback_container_snapshot": "bulk",
+    "delete_container_snapshot": "bulk",
+    "move_container_disk": "bulk",
+}
+
+
+async def list_containers(args: dict[str, Any], client: ProxmoxClient) -> Any:
+    if args.get("node"):
+        return await client.get(f"/nodes/{args['node']}/lxc")
+    if args.get("full"):
+        return await client.get_all_nodes("/lxc")
+    return await client.get_cluster_guests("lxc")
+
+
+CT = "/nodes/{node}/lxc/{vmid}"
+
+ROUTES = {
+    "list_containers": list_containers,
+    "get_container_status": Route("GET", f"{CT}/status/current"),
+    "get_container_config": Route(
+        "GET", f"{CT}/config", ("current", "snapshot"), flags=("current",)
+    ),
+    "set_container_config": Route("PUT", f"{CT}/config", ALL),
+    "get_container_pending": Route("GET", f"{CT}/pending"),
+    "start_container": Route("POST", f"{CT}/status/start", ("skiplock", "debug")),
+    "stop_container": Route("POST", f"{CT}/status/stop", ("skiplock", "overrule-shutdown")),
+    "shutdown_container": Route(
+        "POST", f"{CT}/status/shutdown", ("timeout", "forceStop", "skiplock")
+    ),
+    "reboot_container": Route("POST", f"{CT}/status/reboot", ("timeout",)),
+    "suspend_container": Route("POST", f"{CT}/status/suspend"),
+    "resume_container": Route("POST", f"{CT}/status/resume"),
+    "create_container": Route("POST", "/nodes/{node}/lxc", ALL),
+    "clone_container": Route("POST", f"{CT}/clone", ALL),
+    "delete_container": Route(
+        "DELETE", CT, ("purge", "destroy-unreferenced-disks", "force")
+    ),
+    "resize_container_disk": Route("PUT", f"{CT}/resize", ("disk", "size", "digest")),
+    "move_container_disk": Route("POST", f"{CT}/move_volume", ALL),
+    "migrate_container": Route("POST", f"{CT}/migrate", ALL),
+    "list_container_snapshots": Route("GET", f"{CT}/snapshot"),
+    "create_container_snapshot": Route(
+        "POST", f"{CT}/snapshot", ("snapname", "description")
+    ),
+    "rollback_container_snapshot": Route(
+        "POST", f"{CT}/snapshot/{{snapname}}/rollback", ("start",)
+    ),
+    "delete_container_snapshot": Route("DELETE", f"{CT}/snapshot/{{snapname}}", ("force",)),
+    "get_container_firewall_rules": Route("GET", f"{CT}/firewall/rules"),
+    "add_container_firewall_rule": Route("POST", f"{CT}/firewall/rules", ALL),
+    "delete_container_firewall_rule": Route(
+        "DELETE", f"{CT}/firewall/rules/{{pos}}", ("digest",)
+    ),
+    "get_container_firewall_options": Route("GET", f"{CT}/firewall/options"),
+    "set_container_firewall_options": Route("PUT", f"{CT}/firewall/options", ALL),
+    "get_container_rrddata": Route("GET", f"{CT}/rrddata", ("timeframe", "cf")),
+    "convert_container_to_template": Route("POST", f"{CT}/template"),
+}
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 OPT_INT = lambda desc: {"type": "integer", "description": desc}  # noqa: E731
@@ -435,153 +433,66 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    node = args.get("node", "")
-
-    if name == "list_nodes":
-        return await client.get("/nodes")
-
-    elif name == "get_node_status":
-        return await client.get(f"/nodes/{node}/status")
-
-    elif name == "get_node_config":
-        return await client.get(f"/nodes/{node}/config")
-
-    elif name == "get_node_version":
-        return await client.get(f"/nodes/{node}/version")
-
-    elif name == "get_node_time":
-        return await client.get(f"/nodes/{node}/time")
-
-    elif name == "set_node_time":
-        return await client.put(f"/nodes/{node}/time", {"timezone": args["timezone"]})
-
-    elif name == "get_node_dns":
-        return await client.get(f"/nodes/{node}/dns")
-
-    elif name == "set_node_dns":
-        data = {k: args[k] for k in ("search", "dns1", "dns2", "dns3") if k in args}
-        return await client.put(f"/nodes/{node}/dns", data)
-
-    elif name == "get_node_hosts":
-        return await client.get(f"/nodes/{node}/hosts")
-
-    elif name == "set_node_hosts":
-        data = {"data": args["data"]}
-        if "digest" in args:
-            data["digest"] = args["digest"]
-        return await client.post(f"/nodes/{node}/hosts", data)
-
-    elif name == "get_node_network":
-        params = {}
-        if "type" in args:
-            params["type"] = args["type"]
-        return await client.get(f"/nodes/{node}/network", params or None)
-
-    elif name == "get_node_network_interface":
-        return await client.get(f"/nodes/{node}/network/{args['iface']}")
-
-    elif name == "apply_node_network":
-        return await client.put(f"/nodes/{node}/network")
-
-    elif name == "revert_node_network":
-        return await client.delete(f"/nodes/{node}/network")
-
-    elif name == "get_node_netstat":
-        return await client.get(f"/nodes/{node}/netstat")
-
-    elif name == "list_node_services":
-        return await client.get(f"/nodes/{node}/services")
-
-    elif name == "get_node_service_state":
-        return await client.get(f"/nodes/{node}/services/{args['service']}/state")
-
-    elif name == "start_node_service":
-        return await client.post(f"/nodes/{node}/services/{args['service']}/start")
-
-    elif name == "stop_node_service":
-        return await client.post(f"/nodes/{node}/services/{args['service']}/stop")
-
-    elif name == "restart_node_service":
-        return await client.post(f"/nodes/{node}/services/{args['service']}/restart")
-
-    elif name == "reload_node_service":
-        return await client.post(f"/nodes/{node}/services/{args['service']}/reload")
-
-    elif name == "get_node_syslog":
-        params = {k: args[k] for k in ("limit", "start", "since", "until", "service") if k in args}
-        return await client.get(f"/nodes/{node}/syslog", params or None)
-
-    elif name == "get_node_journal":
-        params = {k: args[k] for k in ("limit", "startcursor", "endcursor", "since", "until", "lastentries") if k in args}
-        return await client.get(f"/nodes/{node}/journal", params or None)
-
-    elif name == "get_node_report":
-        return await client.get(f"/nodes/{node}/report")
-
-    elif name == "get_node_subscription":
-        return await client.get(f"/nodes/{node}/subscription")
-
-    elif name == "get_node_apt_update":
-        return await client.get(f"/nodes/{node}/apt/update")
-
-    elif name == "get_node_apt_changelog":
-        params = {"name": args["name"]}
-        if "version" in args:
-            params["version"] = args["version"]
-        return await client.get(f"/nodes/{node}/apt/changelog", params)
-
-    elif name == "get_node_hardware":
-        return await client.get(f"/nodes/{node}/hardware")
-
-    elif name == "get_node_rrd":
-        params = {"ds": args["ds"], "timeframe": args["timeframe"]}
-        if "cf" in args:
-            params["cf"] = args["cf"]
-        return await client.get(f"/nodes/{node}/rrd", params)
-
-    elif name == "get_node_rrddata":
-        params = {"timeframe": args["timeframe"]}
-        if "cf" in args:
-            params["cf"] = args["cf"]
-        return await client.get(f"/nodes/{node}/rrddata", params)
-
-    elif name == "node_shutdown":
-        return await client.post(f"/nodes/{node}/status", {"command": args["command"]})
-
-    elif name == "node_startall":
-        data: dict[str, Any] = {}
-        if "vms" in args:
-            data["vms"] = args["vms"]
-        if "force" in args:
-            data["force"] = args["force"]
-        return await client.post(f"/nodes/{node}/startall", data or None)
-
-    elif name == "node_stopall":
-        data = {}
-        if "vms" in args:
-            data["vms"] = args["vms"]
-        if "force_stop" in args:
-            data["force-stop"] = args["force_stop"]
-        return await client.post(f"/nodes/{node}/stopall", data or None)
-
-    elif name == "node_migrateall":
-        data = {"target": args["target"]}
-        for k in ("maxworkers", "vms", "with_local_disks"):
-            if k in args:
-                data[k.replace("_", "-")] = args[k]
-        return await client.post(f"/nodes/{node}/migrateall", data)
-
-    elif name == "get_node_aplinfo":
-        return await client.get(f"/nodes/{node}/aplinfo")
-
-    elif name == "get_node_capabilities_qemu":
-        return await client.get(f"/nodes/{node}/capabilities/qemu")
-
-    elif name == "get_node_scan":
-        return await client.get(f"/nodes/{node}/scan/{args['type']}")
-
-    elif name == "wakeonlan":
-        return await client.post(f"/nodes/{node}/wakeonlan")
-
-    raise ValueError(f"Unknown tool: {name}")
+PRIORITY = {
+    "node_startall": "bulk",
+    "node_stopall": "bulk",
+    "node_migrateall": "bulk",
+    "get_node_report": "background",
+}
+
+
+N = "/nodes/{node}"
+
+ROUTES = {
+    "list_nodes": Route("GET", "/nodes"),
+    "get_node_status": Route("GET", f"{N}/status"),
+    "get_node_config": Route("GET", f"{N}/config"),
+    "get_node_version": Route("GET", f"{N}/version"),
+    "get_node_time": Route("GET", f"{N}/time"),
+    "set_node_time": Route("PUT", f"{N}/time", ("timezone",)),
+    "get_node_dns": Route("GET", f"{N}/dns"),
+    "set_node_dns": Route("PUT", f"{N}/dns", ("search", "dns1", "dns2", "dns3")),
+    "get_node_hosts": Route("GET", f"{N}/hosts"),
+    "set_node_hosts": Route("POST", f"{N}/hosts", ("data", "digest")),
+    "get_node_network": Route("GET", f"{N}/network", ("type",)),
+    "get_node_network_interface": Route("GET", f"{N}/network/{{iface}}"),
+    "apply_node_network": Route("PUT", f"{N}/network"),
+    "revert_node_network": Route("DELETE", f"{N}/network"),
+    "get_node_netstat": Route("GET", f"{N}/netstat"),
+    "list_node_services": Route("GET", f"{N}/services"),
+    "get_node_service_state": Route("GET", f"{N}/services/{{service}}/state"),
+    "start_node_service": Route("POST", f"{N}/services/{{service}}/start"),
+    "stop_node_service": Route("POST", f"{N}/services/{{service}}/stop"),
+    "restart_node_service": Route("POST", f"{N}/services/{{service}}/restart"),
+    "reload_node_service": Route("POST", f"{N}/services/{{service}}/reload"),
+    "get_node_syslog": Route(
+        "GET", f"{N}/syslog", ("limit", "start", "since", "until", "service")
+    ),
+    "get_node_journal": Route(
+        "GET",
+        f"{N}/journal",
+        ("limit", "startcursor", "endcursor", "since", "until", "lastentries"),
+    ),
+    "get_node_report": Route("GET", f"{N}/report"),
+    "get_node_subscription": Route("GET", f"{N}/subscription"),
+    "get_node_apt_update": Route("GET", f"{N}/apt/update"),
+    "get_node_apt_changelog": Route("GET", f"{N}/apt/changelog", ("name", "version")),
+    "get_node_hardware": Route("GET", f"{N}/hardware"),
+    "get_node_rrd": Route("GET", f"{N}/rrd", ("ds", "timeframe", "cf")),
+    "get_node_rrddata": Route("GET", f"{N}/rrddata", ("timeframe", "cf")),
+    "node_shutdown": Route("POST", f"{N}/status", ("command",)),
+    "node_startall": Route("POST", f"{N}/startall", ("vms", "force")),
+    "node_stopall": Route(
+        "POST", f"{N}/stopall", ("vms", "force_stop"), rename={"force_stop": "force-stop"}
+    ),
+    "node_migrateall": Route(
+        "POST",
+        f"{N}/migrateall",
+        ("target", "maxworkers", "vms", "with_local_disks"),
+        rename={"with_local_disks": "with-local-disks"},
+    ),
+    "get_node_aplinfo": Route("GET", f"{N}/aplinfo"),
+    "get_node_capabilities_qemu": Route("GET", f"{N}/capabilities/qemu"),
+    "get_node_scan": Route("GET", f"{N}/scan/{{type}}"),
+    "wakeonlan": Route("POST", f"{N}/wakeonlan"),
+}
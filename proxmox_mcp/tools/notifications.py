@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
 OPT_INT = lambda desc: {"type": "integer", "description": desc}  # noqa: E731
@@ -272,87 +270,30 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    base = "/cluster/notifications"
-
-    if name == "list_notification_targets":
-        return await client.get(f"{base}/targets")
-
-    elif name == "list_gotify_endpoints":
-        return await client.get(f"{base}/endpoints/gotify")
-
-    elif name == "get_gotify_endpoint":
-        return await client.get(f"{base}/endpoints/gotify/{args['name']}")
-
-    elif name == "create_gotify_endpoint":
-        data = {k: v for k, v in args.items()}
-        return await client.post(f"{base}/endpoints/gotify", data)
-
-    elif name == "update_gotify_endpoint":
-        ep_name = args["name"]
-        data = {k: v for k, v in args.items() if k != "name"}
-        return await client.put(f"{base}/endpoints/gotify/{ep_name}", data)
-
-    elif name == "delete_gotify_endpoint":
-        return await client.delete(f"{base}/endpoints/gotify/{args['name']}")
-
-    elif name == "list_sendmail_endpoints":
-        return await client.get(f"{base}/endpoints/sendmail")
-
-    elif name == "get_sendmail_endpoint":
-        return await client.get(f"{base}/endpoints/sendmail/{args['name']}")
-
-    elif name == "create_sendmail_endpoint":
-        data = {k: v for k, v in args.items()}
-        return await client.post(f"{base}/endpoints/sendmail", data)
-
-    elif name == "update_sendmail_endpoint":
-        ep_name = args["name"]
-        data = {k: v for k, v in args.items() if k != "name"}
-        return await client.put(f"{base}/endpoints/sendmail/{ep_name}", data)
-
-    elif name == "delete_sendmail_endpoint":
-        return await client.delete(f"{base}/endpoints/sendmail/{args['name']}")
-
-    elif name == "list_smtp_endpoints":
-        return await client.get(f"{base}/endpoints/smtp")
-
-    elif name == "create_smtp_endpoint":
-        data = {k: v for k, v in args.items()}
-        return await client.post(f"{base}/endpoints/smtp", data)
-
-    elif name == "delete_smtp_endpoint":
-        return await client.delete(f"{base}/endpoints/smtp/{args['name']}")
-
-    elif name == "list_webhook_endpoints":
-        return await client.get(f"{base}/endpoints/webhook")
-
-    elif name == "create_webhook_endpoint":
-        data = {k: v for k, v in args.items()}
-        return await client.post(f"{base}/endpoints/webhook", data)
-
-    elif name == "delete_webhook_endpoint":
-        return await client.delete(f"{base}/endpoints/webhook/{args['name']}")
-
-    elif name == "list_notification_matchers":
-        return await client.get(f"{base}/matchers")
-
-    elif name == "get_notification_matcher":
-        return await client.get(f"{base}/matchers/{args['name']}")
-
-    elif name == "create_notification_matcher":
-        data = {k: v for k, v in args.items()}
-        return await client.post(f"{base}/matchers", data)
-
-    elif name == "update_notification_matcher":
-        matcher_name = args["name"]
-        data = {k: v for k, v in args.items() if k != "name"}
-        return await client.put(f"{base}/matchers/{matcher_name}", data)
-
-    elif name == "delete_notification_matcher":
-        return await client.delete(f"{base}/matchers/{args['name']}")
-
-    elif name == "list_notification_matcher_fields":
-        return await client.get(f"{base}/matcher-fields")
-
-    raise ValueError(f"Unknown tool: {name}")
+BASE = "/cluster/notifications"
+
+ROUTES = {
+    "list_notification_targets": Route("GET", f"{BASE}/targets"),
+    "list_gotify_endpoints": Route("GET", f"{BASE}/endpoints/gotify"),
+    "get_gotify_endpoint": Route("GET", f"{BASE}/endpoints/gotify/{{name}}"),
+    "create_gotify_endpoint": Route("POST", f"{BASE}/endpoints/gotify", ALL),
+    "update_gotify_endpoint": Route("PUT", f"{BASE}/endpoints/gotify/{{name}}", ALL),
+    "delete_gotify_endpoint": Route("DELETE", f"{BASE}/endpoints/gotify/{{name}}"),
+    "list_sendmail_endpoints": Route("GET", f"{BASE}/endpoints/sendmail"),
+    "get_sendmail_endpoint": Route("GET", f"{BASE}/endpoints/sendmail/{{name}}"),
+    "create_sendmail_endpoint": Route("POST", f"{BASE}/endpoints/sendmail", ALL),
+    "update_sendmail_endpoint": Route("PUT", f"{BASE}/endpoints/sendmail/{{name}}", ALL),
+    "delete_sendmail_endpoint": Route("DELETE", f"{BASE}/endpoints/sendmail/{{name}}"),
+    "list_smtp_endpoints": Route("GET", f"{BASE}/endpoints/smtp"),
+    "create_smtp_endpoint": Route("POST", f"{BASE}/endpoints/smtp", ALL),
+    "delete_smtp_endpoint": Route("DELETE", f"{BASE}/endpoints/smtp/{{name}}"),
+    "list_webhook_endpoints": Route("GET", f"{BASE}/endpoints/webhook"),
+    "create_webhook_endpoint": Route("POST", f"{BASE}/endpoints/webhook", ALL),
+    "delete_webhook_endpoint": Route("DELETE", f"{BASE}/endpoints/webhook/{{name}}"),
+    "list_notification_matchers": Route("GET", f"{BASE}/matchers"),
+    "get_notification_matcher": Route("GET", f"{BASE}/matchers/{{name}}"),
+    "create_notification_matcher": Route("POST", f"{BASE}/matchers", ALL),
+    "update_notification_matcher": Route("PUT", f"{BASE}/matchers/{{name}}", ALL),
+    "delete_notification_matcher": Route("DELETE", f"{BASE}/matchers/{{name}}"),
+    "list_notification_matcher_fields": Route("GET", f"{BASE}/matcher-fields"),
+}
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
 OPT_BOOL = lambda desc: {"type": "boolean", "description": desc}  # noqa: E731
@@ -70,24 +68,10 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    if name == "list_pools":
-        return await client.get("/pools")
-
-    elif name == "get_pool":
-        params = {k: args[k] for k in ("type",) if k in args}
-        return await client.get(f"/pools/{args['poolid']}", params or None)
-
-    elif name == "create_pool":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/pools", data)
-
-    elif name == "update_pool":
-        poolid = args["poolid"]
-        data = {k: v for k, v in args.items() if k != "poolid"}
-        return await client.put(f"/pools/{poolid}", data)
-
-    elif name == "delete_pool":
-        return await client.delete(f"/pools/{args['poolid']}")
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "list_pools": Route("GET", "/pools"),
+    "get_pool": Route("GET", "/pools/{poolid}", ("type",)),
+    "create_pool": Route("POST", "/pools", ALL),
+    "update_pool": Route("PUT", "/pools/{poolid}", ALL),
+    "delete_pool": Route("DELETE", "/pools/{poolid}"),
+}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 VMID = {"type": "integer", "description": "VM ID"}
@@ -22,6 +23,10 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "node": {**NODE, "description": "Node name (optional — omit for cluster-wide)"},
+                "full": OPT_BOOL(
+                    "Cluster-wide only: query every node for runtime fields (pid, qmpstatus, ...) "
+                    "instead of the single /cluster/resources inventory"
+                ),
             },
         },
     },
@@ -673,217 +678,77 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    node = args.get("node", "")
-    vmid = args.get("vmid", "")
-    base = f"/nodes/{node}/qemu"
-    vm = f"{base}/{vmid}"
-
-    if name == "list_vms":
-        if node:
-            return await client.get(f"/nodes/{node}/qemu")
-        nodes_r = await client.get("/nodes")
-        all_vms = []
-        for n in nodes_r["data"]:
-            vms = await client.get(f"/nodes/{n['node']}/qemu")
-            for v in vms["data"]:
-                v["node"] = n["node"]
-                all_vms.append(v)
-        return {"data": all_vms}
-
-    elif name == "get_vm_status":
-        return await client.get(f"{vm}/status/current")
-
-    elif name == "get_vm_config":
-        params: dict[str, Any] = {}
-        if args.get("current"):
-            params["current"] = 1
-        if "snapshot" in args:
-            params["snapshot"] = args["snapshot"]
-        return await client.get(f"{vm}/config", params or None)
-
-    elif name == "set_vm_config":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.put(f"{vm}/config", data)
-
-    elif name == "get_vm_pending":
-        return await client.get(f"{vm}/pending")
-
-    elif name == "start_vm":
-        data = {k: args[k] for k in ("skiplock", "timeout") if k in args}
-        return await client.post(f"{vm}/status/start", data or None)
-
-    elif name == "stop_vm":
-        data = {k: args[k] for k in ("timeout", "skiplock", "keepActive") if k in args}
-        return await client.post(f"{vm}/status/stop", data or None)
-
-    elif name == "shutdown_vm":
-        data = {k: args[k] for k in ("timeout", "forceStop", "skiplock") if k in args}
-        return await client.post(f"{vm}/status/shutdown", data or None)
-
-    elif name == "reboot_vm":
-        data = {k: args[k] for k in ("timeout",) if k in args}
-        return await client.post(f"{vm}/status/reboot", data or None)
-
-    elif name == "reset_vm":
-        data = {k: args[k] for k in ("skiplock",) if k in args}
-        return await client.post(f"{vm}/status/reset", data or None)
-
-    elif name == "suspend_vm":
-        data = {k: args[k] for k in ("skiplock", "todisk", "statestorage") if k in args}
-        return await client.post(f"{vm}/status/suspend", data or None)
-
-    elif name == "resume_vm":
-        data = {k: args[k] for k in ("skiplock", "nocheck") if k in args}
-        return await client.post(f"{vm}/status/resume", data or None)
-
-    elif name == "create_vm":
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(base, data)
-
-    elif name == "clone_vm":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{vm}/clone", data)
-
-    elif name == "delete_vm":
-        params = {k: args[k] for k in ("destroy-unreferenced-disks", "purge", "skiplock") if k in args}
-        return await client.delete(vm, params or None)
-
-    elif name == "convert_vm_to_template":
-        data = {}
-        if "disk" in args:
-            data["disk"] = args["disk"]
-        return await client.post(f"{vm}/template", data or None)
-
-    elif name == "list_vm_snapshots":
-        return await client.get(f"{vm}/snapshot")
-
-    elif name == "create_vm_snapshot":
-        data = {"snapname": args["snapname"]}
-        for k in ("description", "vmstate"):
-            if k in args:
-                data[k] = args[k]
-        return await client.post(f"{vm}/snapshot", data)
-
-    elif name == "get_vm_snapshot_config":
-        return await client.get(f"{vm}/snapshot/{args['snapname']}/config")
-
-    elif name == "rollback_vm_snapshot":
-        data = {}
-        if "start" in args:
-            data["start"] = args["start"]
-        return await client.post(f"{vm}/snapshot/{args['snapname']}/rollback", data or None)
-
-    elif name == "delete_vm_snapshot":
-        params = {}
-        if "force" in args:
-            params["force"] = args["force"]
-        return await client.delete(f"{vm}/snapshot/{args['snapname']}", params or None)
-
-    elif name == "migrate_vm":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{vm}/migrate", data)
-
-    elif name == "get_vm_migrate_preconditions":
-        return await client.get(f"{vm}/migrate", {"target": args["target"]})
-
-    elif name == "resize_vm_disk":
-        data = {"disk": args["disk"], "size": args["size"]}
-        for k in ("skiplock", "digest"):
-            if k in args:
-                data[k] = args[k]
-        return await client.put(f"{vm}/resize", data)
-
-    elif name == "move_vm_disk":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{vm}/move_disk", data)
-
-    elif name == "unlink_vm_disk":
-        data = {"idlist": args["idlist"]}
-        if "force" in args:
-            data["force"] = args["force"]
-        return await client.put(f"{vm}/unlink", data)
-
-    elif name == "import_vm_disk":
-        data = {"source": args["source"], "storage": args["storage"]}
-        if "format" in args:
-            data["format"] = args["format"]
-        return await client.post(f"{vm}/importdisk", data)
-
-    elif name == "get_vm_firewall_rules":
-        return await client.get(f"{vm}/firewall/rules")
-
-    elif name == "add_vm_firewall_rule":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.post(f"{vm}/firewall/rules", data)
-
-    elif name == "delete_vm_firewall_rule":
-        params = {}
-        if "digest" in args:
-            params["digest"] = args["digest"]
-        return await client.delete(f"{vm}/firewall/rules/{args['pos']}", params or None)
-
-    elif name == "get_vm_firewall_options":
-        return await client.get(f"{vm}/firewall/options")
-
-    elif name == "set_vm_firewall_options":
-        data = {k: v for k, v in args.items() if k not in ("node", "vmid")}
-        return await client.put(f"{vm}/firewall/options", data)
-
-    elif name == "get_vm_firewall_log":
-        params = {k: args[k] for k in ("limit", "start") if k in args}
-        return await client.get(f"{vm}/firewall/log", params or None)
-
-    elif name == "get_vm_rrddata":
-        params = {"timeframe": args["timeframe"]}
-        if "cf" in args:
-            params["cf"] = args["cf"]
-        return await client.get(f"{vm}/rrddata", params)
-
-    elif name == "vm_agent_exec":
-        data = {"command": args["command"]}
-        if "input-data" in args:
-            data["input-data"] = args["input-data"]
-        return await client.post(f"{vm}/agent/exec", data)
-
-    elif name == "vm_agent_get_fsinfo":
-        return await client.get(f"{vm}/agent/get-fsinfo")
-
-    elif name == "vm_agent_get_network_interfaces":
-        return await client.get(f"{vm}/agent/network-get-interfaces")
-
-    elif name == "vm_agent_get_osinfo":
-        return await client.get(f"{vm}/agent/get-osinfo")
-
-    elif name == "vm_agent_ping":
-        return await client.post(f"{vm}/agent/ping")
-
-    elif name == "vm_agent_set_user_password":
-        data = {"username": args["username"], "password": args["password"]}
-        if "crypted" in args:
-            data["crypted"] = args["crypted"]
-        return await client.post(f"{vm}/agent/set-user-password", data)
-
-    elif name == "get_vm_feature":
-        params = {"feature": args["feature"]}
-        if "snapname" in args:
-            params["snapname"] = args["snapname"]
-        return await client.get(f"{vm}/feature", params)
-
-    elif name == "get_vm_vnc_proxy":
-        data = {k: args[k] for k in ("websocket", "generate-password") if k in args}
-        return await client.post(f"{vm}/vncproxy", data or None)
-
-    elif name == "get_vm_spice_proxy":
-        data = {}
-        if "proxy" in args:
-            data["proxy"] = args["proxy"]
-        return await client.post(f"{vm}/spiceproxy", data or None)
-
-    elif name == "get_vm_cloudinit":
-        return await client.get(f"{vm}/cloudinit/dump", {"type": args["type"]})
-
-    elif name == "regenerate_vm_cloudinit":
-        return await client.put(f"{vm}/cloudinit")
-
-    raise ValueError(f"Unknown tool: {name}")
+PRIORITY = {
+    "clone_vm": "bulk",
+    "migrate_vm": "bulk",
+    "create_vm_snapshot": "bulk",
+    "rollback_vm_snapshot": "bulk",
+    "delete_vm_snapshot": "bulk",
+    "move_vm_disk": "bulk",
+    "import_vm_disk": "bulk",
+}
+
+
+async def list_vms(args: dict[str, Any], client: ProxmoxClient) -> Any:
+    if args.get("node"):
+        return await client.get(f"/nodes/{args['node']}/qemu")
+    if args.get("full"):
+        return await client.get_all_nodes("/qemu")
+    return await client.get_cluster_guests("qemu")
+
+
+VM = "/nodes/{node}/qemu/{vmid}"
+
+ROUTES = {
+    "list_vms": list_vms,
+    "get_vm_status": Route("GET", f"{VM}/status/current"),
+    "get_vm_config": Route("GET", f"{VM}/config", ("current", "snapshot"), flags=("current",)),
+    "set_vm_config": Route("PUT", f"{VM}/config", ALL),
+    "get_vm_pending": Route("GET", f"{VM}/pending"),
+    "start_vm": Route("POST", f"{VM}/status/start", ("skiplock", "timeout")),
+    "stop_vm": Route("POST", f"{VM}/status/stop", ("timeout", "skiplock", "keepActive")),
+    "shutdown_vm": Route("POST", f"{VM}/status/shutdown", ("timeout", "forceStop", "skiplock")),
+    "reboot_vm": Route("POST", f"{VM}/status/reboot", ("timeout",)),
+    "reset_vm": Route("POST", f"{VM}/status/reset", ("skiplock",)),
+    "suspend_vm": Route(
+        "POST", f"{VM}/status/suspend", ("skiplock", "todisk", "statestorage")
+    ),
+    "resume_vm": Route("POST", f"{VM}/status/resume", ("skiplock", "nocheck")),
+    "create_vm": Route("POST", "/nodes/{node}/qemu", ALL),
+    "clone_vm": Route("POST", f"{VM}/clone", ALL),
+    "delete_vm": Route("DELETE", VM, ("destroy-unreferenced-disks", "purge", "skiplock")),
+    "convert_vm_to_template": Route("POST", f"{VM}/template", ("disk",)),
+    "list_vm_snapshots": Route("GET", f"{VM}/snapshot"),
+    "create_vm_snapshot": Route(
+        "POST", f"{VM}/snapshot", ("snapname", "description", "vmstate")
+    ),
+    "get_vm_snapshot_config": Route("GET", f"{VM}/snapshot/{{snapname}}/config"),
+    "rollback_vm_snapshot": Route("POST", f"{VM}/snapshot/{{snapname}}/rollback", ("start",)),
+    "delete_vm_snapshot": Route("DELETE", f"{VM}/snapshot/{{snapname}}", ("force",)),
+    "migrate_vm": Route("POST", f"{VM}/migrate", ALL),
+    "get_vm_migrate_preconditions": Route("GET", f"{VM}/migrate", ("target",)),
+    "resize_vm_disk": Route("PUT", f"{VM}/resize", ("disk", "size", "skiplock", "digest")),
+    "move_vm_disk": Route("POST", f"{VM}/move_disk", ALL),
+    "unlink_vm_disk": Route("PUT", f"{VM}/unlink", ("idlist", "force")),
+    "import_vm_disk": Route("POST", f"{VM}/importdisk", ("source", "storage", "format")),
+    "get_vm_firewall_rules": Route("GET", f"{VM}/firewall/rules"),
+    "add_vm_firewall_rule": Route("POST", f"{VM}/firewall/rules", ALL),
+    "delete_vm_firewall_rule": Route("DELETE", f"{VM}/firewall/rules/{{pos}}", ("digest",)),
+    "get_vm_firewall_options": Route("GET", f"{VM}/firewall/options"),
+    "set_vm_firewall_options": Route("PUT", f"{VM}/firewall/options", ALL),
+    "get_vm_firewall_log": Route("GET", f"{VM}/firewall/log", ("limit", "start")),
+    "get_vm_rrddata": Route("GET", f"{VM}/rrddata", ("timeframe", "cf")),
+    "vm_agent_exec": Route("POST", f"{VM}/agent/exec", ("command", "input-data")),
+    "vm_agent_get_fsinfo": Route("GET", f"{VM}/agent/get-fsinfo"),
+    "vm_agent_get_network_interfaces": Route("GET", f"{VM}/agent/network-get-interfaces"),
+    "vm_agent_get_osinfo": Route("GET", f"{VM}/agent/get-osinfo"),
+    "vm_agent_ping": Route("POST", f"{VM}/agent/ping"),
+    "vm_agent_set_user_password": Route(
+        "POST", f"{VM}/agent/set-user-password", ("username", "password", "crypted")
+    ),
+    "get_vm_feature": Route("GET", f"{VM}/feature", ("feature", "snapname")),
+    "get_vm_vnc_proxy": Route("POST", f"{VM}/vncproxy", ("websocket", "generate-password")),
+    "get_vm_spice_proxy": Route("POST", f"{VM}/spiceproxy", ("proxy",)),
+    "get_vm_cloudinit": Route("GET", f"{VM}/cloudinit/dump", ("type",)),
+    "regenerate_vm_cloudinit": Route("PUT", f"{VM}/cloudinit"),
+}
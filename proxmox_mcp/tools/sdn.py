@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 OPT_STR = lambda desc: {"type": "string", "description": desc}  # noqa: E731
@@ -230,68 +228,23 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    if name == "apply_sdn":
-        return await client.put("/cluster/sdn")
-
-    elif name == "list_sdn_zones":
-        params = {k: args[k] for k in ("pending", "running", "type") if k in args}
-        return await client.get("/cluster/sdn/zones", params or None)
-
-    elif name == "get_sdn_zone":
-        params = {k: args[k] for k in ("pending", "running") if k in args}
-        return await client.get(f"/cluster/sdn/zones/{args['zone']}", params or None)
-
-    elif name == "create_sdn_zone":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/sdn/zones", data)
-
-    elif name == "update_sdn_zone":
-        zone = args["zone"]
-        data = {k: v for k, v in args.items() if k != "zone"}
-        return await client.put(f"/cluster/sdn/zones/{zone}", data)
-
-    elif name == "delete_sdn_zone":
-        return await client.delete(f"/cluster/sdn/zones/{args['zone']}")
-
-    elif name == "list_sdn_vnets":
-        params = {k: args[k] for k in ("pending", "running") if k in args}
-        return await client.get("/cluster/sdn/vnets", params or None)
-
-    elif name == "get_sdn_vnet":
-        params = {k: args[k] for k in ("pending", "running") if k in args}
-        return await client.get(f"/cluster/sdn/vnets/{args['vnet']}", params or None)
-
-    elif name == "create_sdn_vnet":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/cluster/sdn/vnets", data)
-
-    elif name == "update_sdn_vnet":
-        vnet = args["vnet"]
-        data = {k: v for k, v in args.items() if k != "vnet"}
-        return await client.put(f"/cluster/sdn/vnets/{vnet}", data)
-
-    elif name == "delete_sdn_vnet":
-        return await client.delete(f"/cluster/sdn/vnets/{args['vnet']}")
-
-    elif name == "list_sdn_subnets":
-        params = {k: args[k] for k in ("pending", "running") if k in args}
-        return await client.get(f"/cluster/sdn/vnets/{args['vnet']}/subnets", params or None)
-
-    elif name == "create_sdn_subnet":
-        vnet = args["vnet"]
-        data = {k: v for k, v in args.items() if k != "vnet"}
-        return await client.post(f"/cluster/sdn/vnets/{vnet}/subnets", data)
-
-    elif name == "delete_sdn_subnet":
-        from urllib.parse import quote
-        subnet = quote(args["subnet"], safe="")
-        return await client.delete(f"/cluster/sdn/vnets/{args['vnet']}/subnets/{subnet}")
-
-    elif name == "list_node_sdn_zones":
-        return await client.get(f"/nodes/{args['node']}/sdn/zones")
-
-    elif name == "list_node_sdn_vnets":
-        return await client.get(f"/nodes/{args['node']}/sdn/vnets")
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "apply_sdn": Route("PUT", "/cluster/sdn"),
+    "list_sdn_zones": Route("GET", "/cluster/sdn/zones", ("pending", "running", "type")),
+    "get_sdn_zone": Route("GET", "/cluster/sdn/zones/{zone}", ("pending", "running")),
+    "create_sdn_zone": Route("POST", "/cluster/sdn/zones", ALL),
+    "update_sdn_zone": Route("PUT", "/cluster/sdn/zones/{zone}", ALL),
+    "delete_sdn_zone": Route("DELETE", "/cluster/sdn/zones/{zone}"),
+    "list_sdn_vnets": Route("GET", "/cluster/sdn/vnets", ("pending", "running")),
+    "get_sdn_vnet": Route("GET", "/cluster/sdn/vnets/{vnet}", ("pending", "running")),
+    "create_sdn_vnet": Route("POST", "/cluster/sdn/vnets", ALL),
+    "update_sdn_vnet": Route("PUT", "/cluster/sdn/vnets/{vnet}", ALL),
+    "delete_sdn_vnet": Route("DELETE", "/cluster/sdn/vnets/{vnet}"),
+    "list_sdn_subnets": Route("GET", "/cluster/sdn/vnets/{vnet}/subnets", ("pending", "running")),
+    "create_sdn_subnet": Route("POST", "/cluster/sdn/vnets/{vnet}/subnets", ALL),
+    "delete_sdn_subnet": Route(
+        "DELETE", "/cluster/sdn/vnets/{vnet}/subnets/{subnet}", quoted=("subnet",)
+    ),
+    "list_node_sdn_zones": Route("GET", "/nodes/{node}/sdn/zones"),
+    "list_node_sdn_vnets": Route("GET", "/nodes/{node}/sdn/vnets"),
+}
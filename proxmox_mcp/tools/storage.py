@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..client import ProxmoxClient
+from ..routes import ALL, Route
 
 NODE = {"type": "string", "description": "Node name (e.g. pve01)"}
 OPT_INT = lambda desc: {"type": "integer", "description": desc}  # noqa: E731
@@ -252,75 +253,44 @@ TOOLS = [
 ]
 
 
-async def handle(name: str, args: dict[str, Any], client: ProxmoxClient) -> Any:
-    if name == "list_storage":
-        node = args.get("node")
-        if node:
-            params = {k: args[k] for k in ("type",) if k in args}
-            return await client.get(f"/nodes/{node}/storage", params or None)
-        params = {k: args[k] for k in ("type", "enabled") if k in args}
-        return await client.get("/storage", params or None)
+PRIORITY = {
+    "backup_vm": "bulk",
+    "restore_vm_backup": "bulk",
+    "restore_container_backup": "bulk",
+    "copy_storage_volume": "bulk",
+    "download_url_to_storage": "bulk",
+}
 
-    elif name == "get_storage_config":
-        return await client.get(f"/storage/{args['storage']}")
 
-    elif name == "create_storage":
-        data = {k: v for k, v in args.items()}
-        return await client.post("/storage", data)
+_list_node_storage = Route("GET", "/nodes/{node}/storage", ("type",)).compile()
+_list_cluster_storage = Route("GET", "/storage", ("type", "enabled")).compile()
 
-    elif name == "update_storage":
-        storage = args["storage"]
-        data = {k: v for k, v in args.items() if k != "storage"}
-        return await client.put(f"/storage/{storage}", data)
 
-    elif name == "delete_storage":
-        return await client.delete(f"/storage/{args['storage']}")
+async def list_storage(args: dict[str, Any], client: ProxmoxClient) -> Any:
+    if args.get("node"):
+        return await _list_node_storage(args, client)
+    return await _list_cluster_storage(args, client)
 
-    elif name == "get_node_storage_status":
-        return await client.get(f"/nodes/{args['node']}/storage/{args['storage']}/status")
 
-    elif name == "list_storage_content":
-        params = {k: args[k] for k in ("content", "vmid") if k in args}
-        return await client.get(f"/nodes/{args['node']}/storage/{args['storage']}/content", params or None)
+ST = "/nodes/{node}/storage/{storage}"
 
-    elif name == "get_storage_volume_info":
-        from urllib.parse import quote
-        vol = quote(args["volume"], safe="")
-        return await client.get(f"/nodes/{args['node']}/storage/{args['storage']}/content/{vol}")
-
-    elif name == "delete_storage_volume":
-        from urllib.parse import quote
-        vol = quote(args["volume"], safe="")
-        params = {}
-        if "delay" in args:
-            params["delay"] = args["delay"]
-        return await client.delete(f"/nodes/{args['node']}/storage/{args['storage']}/content/{vol}", params or None)
-
-    elif name == "copy_storage_volume":
-        data = {"target": args["target"]}
-        if "target_node" in args:
-            data["target_node"] = args["target_node"]
-        from urllib.parse import quote
-        vol = quote(args["volume"], safe="")
-        return await client.post(f"/nodes/{args['node']}/storage/{args['storage']}/content/{vol}", data)
-
-    elif name == "download_url_to_storage":
-        data = {k: v for k, v in args.items() if k not in ("node", "storage")}
-        return await client.post(f"/nodes/{args['node']}/storage/{args['storage']}/download-url", data)
-
-    elif name == "backup_vm":
-        node = args["node"]
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/vzdump", data)
-
-    elif name == "restore_vm_backup":
-        node = args["node"]
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/qemu", data)
-
-    elif name == "restore_container_backup":
-        node = args["node"]
-        data = {k: v for k, v in args.items() if k != "node"}
-        return await client.post(f"/nodes/{node}/lxc", data)
-
-    raise ValueError(f"Unknown tool: {name}")
+ROUTES = {
+    "list_storage": list_storage,
+    "get_storage_config": Route("GET", "/storage/{storage}"),
+    "create_storage": Route("POST", "/storage", ALL),
+    "update_storage": Route("PUT", "/storage/{storage}", ALL),
+    "delete_storage": Route("DELETE", "/storage/{storage}"),
+    "get_node_storage_status": Route("GET", f"{ST}/status"),
+    "list_storage_content": Route("GET", f"{ST}/content", ("content", "vmid"), stream=True),
+    "get_storage_volume_info": Route("GET", f"{ST}/content/{{volume}}", quoted=("volume",)),
+    "delete_storage_volume": Route(
+        "DELETE", f"{ST}/content/{{volume}}", ("delay",), quoted=("volume",)
+    ),
+    "copy_storage_volume": Route(
+        "POST", f"{ST}/content/{{volume}}", ("target", "target_node"), quoted=("volume",)
+    ),
+    "download_url_to_storage": Route("POST", f"{ST}/download-url", ALL),
+    "backup_vm": Route("POST", "/nodes/{node}/vzdump", ALL),
+    "restore_vm_backup": Route("POST", "/nodes/{node}/qemu", ALL),
+    "restore_container_backup": Route("POST", "/nodes/{node}/lxc", ALL),
+}
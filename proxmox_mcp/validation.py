@@ -0,0 +1,132 @@
+"""Tool argument validation, compiled once per inputSchema into plain Python.
+
+Like fastjsonschema, each schema becomes the source of a dedicated function
+that is ``exec``-ed once; a call then costs a handful of key lookups and
+class checks instead of a walk over the schema. The subset covered is what
+the tool schemas use: a flat object of string, integer, number and boolean
+properties plus ``required``. Values that are unambiguously convertible are
+coerced (``"101"`` to ``101`` for an integer, ``"true"`` or ``1`` for a
+boolean); anything else is rejected before the tool touches the network.
+Properties outside the schema pass through unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+Validator = Callable[[dict[str, Any]], dict[str, Any]]
+
+_INTEGER = re.compile(r"[+-]?\d+\Z")
+_TRUE = frozenset(("1", "true", "yes", "on"))
+_FALSE = frozenset(("0", "false", "no", "off"))
+
+
+def _invalid(name: str, expected: str, value: Any) -> ValueError:
+    return ValueError(
+        f"Invalid argument {name}: expected {expected}, got {type(value).__name__} {value!r}"
+    )
+
+
+def _to_integer(name: str, value: Any) -> int:
+    if value.__class__ is str and _INTEGER.match(value.strip()):
+        return int(value)
+    if value.__class__ is float and value.is_integer():
+        return int(value)
+    raise _invalid(name, "integer", value)
+
+
+def _to_number(name: str, value: Any) -> Any:
+    if value.__class__ is int:
+        return value
+    if value.__class__ is str:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise _invalid(name, "number", value)
+
+
+def _to_boolean(name: str, value: Any) -> bool:
+    if value.__class__ is int and value in (0, 1):
+        return bool(value)
+    if value.__class__ is str:
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise _invalid(name, "boolean", value)
+
+
+def _to_string(name: str, value: Any) -> str:
+    if value.__class__ in (int, float):
+        return str(value)
+    raise _invalid(name, "string", value)
+
+
+# JSON Schema type -> (test for a value that needs coercing, coercion helper)
+_TYPES: dict[str, tuple[str, str]] = {
+    "integer": ("v.__class__ is not int", "_to_integer"),
+    "number": ("v.__class__ is not float", "_to_number"),
+    "boolean": ("v.__class__ is not bool", "_to_boolean"),
+    "string": ("v.__class__ is not str", "_to_string"),
+}
+
+_NAMESPACE = {
+    "_to_integer": _to_integer,
+    "_to_number": _to_number,
+    "_to_boolean": _to_boolean,
+    "_to_string": _to_string,
+}
+
+
+def generate(schema: dict[str, Any], name: str = "validate") -> str:
+    """Return the source of a validator function for ``schema``."""
+    if schema.get("type", "object") != "object":
+        raise ValueError(f"Unsupported schema type: {schema.get('type')}")
+    properties = schema.get("properties", {})
+    required = set(schema.get("required", ()))
+    lines = [f"def {name}(args):"]
+    for key in schema.get("required", ()):
+        if key not in properties:
+            lines.append(f"    if {key!r} not in args:")
+            lines.append(f"        raise ValueError({'Missing required argument: ' + key!r})")
+    for key, spec in properties.items():
+        lines.append(f"    v = args.get({key!r})")
+        lines.append("    if v is None:")
+        if key in required:
+            lines.append(f"        raise ValueError({'Missing required argument: ' + key!r})")
+        else:
+            lines.append(f"        args.pop({key!r}, None)")
+        check = _TYPES.get(spec.get("type"))
+        if check is not None:
+            condition, coerce = check
+            lines.append(f"    elif {condition}:")
+            lines.append(f"        args[{key!r}] = {coerce}({key!r}, v)")
+    lines.append("    return args")
+    return "\n".join(lines) + "\n"
+
+
+def compile_validator(schema: dict[str, Any]) -> Validator:
+    """Compile ``schema`` into a function that checks and coerces an argument dict in place."""
+    namespace = dict(_NAMESPACE)
+    exec(compile(generate(schema), "<inputSchema>", "exec"), namespace)  # noqa: S102
+    return namespace["validate"]
+
+
+class Validators(dict[str, Validator]):
+    """Tool name -> validator, each compiled on the tool's first call.
+
+    Compiling all ~300 tools up front costs ~100 ms of startup (nearly all of
+    it in ``compile()``); one tool takes well under a millisecond.
+    """
+
+    def __init__(self, schemas: dict[str, dict[str, Any]]) -> None:
+        super().__init__()
+        self.schemas = schemas
+
+    def __missing__(self, name: str) -> Validator:
+        validator = self[name] = compile_validator(self.schemas[name])
+        return validator
@@ -40,6 +40,7 @@ PROXMOX_TOKEN_NAME = os.getenv("PROXMOX_TOKEN_NAME")
 PROXMOX_TOKEN_VALUE = os.getenv("PROXMOX_TOKEN_VALUE")
 PROXMOX_PASSWORD = os.getenv("PROXMOX_PASSWORD")
 PROXMOX_VERIFY_SSL = os.getenv("PROXMOX_VERIFY_SSL", "false").lower() == "true"
+PROXMOX_MAX_PARALLEL = int(os.getenv("PROXMOX_MAX_PARALLEL", "8"))
 
 # Validate required configuration
 if not PROXMOX_HOST or not PROXMOX_USER:
@@ -163,6 +164,41 @@ class ProxmoxClient:
         """Make a DELETE request."""
         return await self.request("DELETE", path)
 
+    async def get_all_nodes(self, subpath: str) -> dict:
+        """
+        Query ``/nodes/{node}{subpath}`` on every node concurrently.
+
+        Args:
+            subpath: Path below the node, e.g. ``/qemu``
+
+        Returns:
+            Merged ``data`` list with each row tagged by ``node``, plus an
+            ``errors`` list for nodes that could not be queried
+        """
+        nodes_result = await self.get("/nodes")
+        names = [n["node"] for n in nodes_result["data"]]
+        semaphore = asyncio.Semaphore(max(1, PROXMOX_MAX_PARALLEL))
+
+        async def fetch(node: str) -> dict:
+            async with semaphore:
+                return await self.get(f"/nodes/{node}{subpath}")
+
+        results = await asyncio.gather(*(fetch(n) for n in names), return_exceptions=True)
+        merged = []
+        errors = []
+        for node, result in zip(names, results):
+            if isinstance(result, BaseException):
+                errors.append({"node": node, "error": str(result)})
+                continue
+            for row in result["data"]:
+                row["node"] = node
+                merged.append(row)
+
+        out: dict = {"data": merged}
+        if errors:
+            out["errors"] = errors
+        return out
+
     async def close(self):
         """Close the HTTP client connection."""
         await self.client.aclose()
@@ -466,15 +502,8 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             if "node" in arguments and arguments["node"]:
                 result = await proxmox.get(f"/nodes/{arguments['node']}/qemu")
             else:
-                # Get all nodes and collect VMs from each
-                nodes_result = await proxmox.get("/nodes")
-                all_vms = []
-                for node in nodes_result["data"]:
-                    vms = await proxmox.get(f"/nodes/{node['node']}/qemu")
-                    for vm in vms["data"]:
-                        vm["node"] = node["node"]
-                        all_vms.append(vm)
-                result = {"data": all_vms}
+                # Query every node concurrently and merge the VM lists
+                result = await proxmox.get_all_nodes("/qemu")
 
         elif name == "get_vm_config":
             result = await proxmox.get(
@@ -820,15 +849,8 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             if "node" in arguments and arguments["node"]:
                 result = await proxmox.get(f"/nodes/{arguments['node']}/qemu")
             else:
-                # Get all nodes and collect VMs from each
-                nodes_result = await proxmox.get("/nodes")
-                all_vms = []
-                for node in nodes_result["data"]:
-                    vms = await proxmox.get(f"/nodes/{node['node']}/qemu")
-                    for vm in vms["data"]:
-                        vm["node"] = node["node"]
-                        all_vms.append(vm)
-                result = {"data": all_vms}
+                # Query every node concurrently and merge the VM lists
+                result = await proxmox.get_all_nodes("/qemu")
 
         elif name == "get_vm_config":
             result = await proxmox.get(
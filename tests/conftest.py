@@ -0,0 +1,26 @@
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+
+from proxmox_mcp import client as client_module
+from proxmox_mcp.client import ProxmoxClient
+
+Responder = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Build a token-authenticated ProxmoxClient whose requests go to ``responder``."""
+    monkeypatch.setattr(client_module, "PROXMOX_RETRY_BACKOFF", 0.0)
+
+    def make(responder: Responder, hosts: str = "pve1", **settings) -> ProxmoxClient:
+        monkeypatch.setattr(client_module, "PROXMOX_HOST", hosts)
+        for name, value in settings.items():
+            monkeypatch.setattr(client_module, name, value)
+        proxmox = ProxmoxClient()
+        proxmox.token = "PVEAPIToken=root@pam!test=secret"
+        proxmox.client = httpx.AsyncClient(transport=httpx.MockTransport(responder))
+        return proxmox
+
+    return make
@@ -0,0 +1,107 @@
+"""Response cache: TTL rules, eviction on mutations and the generation guard."""
+
+import asyncio
+
+import httpx
+
+from proxmox_mcp.cache import DEFAULT_TTLS, ResponseCache
+
+EVERYTHING = [(r".*", 60)]
+
+
+def cached(cache: ResponseCache) -> list[str]:
+    return sorted(key for key in cache._entries)
+
+
+def fill(cache: ResponseCache, *paths: str) -> None:
+    for path in paths:
+        cache.put(path, None, b'{"data": 1}', cache.generation)
+
+
+class TestRules:
+    def test_first_matching_rule_wins(self):
+        cache = ResponseCache(1024, [(r"^/version$", 0), *DEFAULT_TTLS])
+        assert cache.ttl_for("/version") == 0
+        assert cache.ttl_for("/access/roles") == 300
+        assert cache.ttl_for("/cluster/resources") == 0
+
+    def test_guest_paths_are_not_cached_by_default(self):
+        cache = ResponseCache(1024, DEFAULT_TTLS)
+        for path in ("/nodes/n/qemu/100/config", "/nodes/n/lxc/200/pending", "/nodes/n/qemu"):
+            assert cache.ttl_for(path) == 0
+
+    def test_disabled_when_size_is_zero(self):
+        assert ResponseCache(0, EVERYTHING).ttl_for("/version") == 0
+
+    def test_least_recently_used_goes_first(self):
+        cache = ResponseCache(30, EVERYTHING)
+        fill(cache, "/a", "/b")
+        cache.get("/a", None)
+        fill(cache, "/c")
+        assert cached(cache) == ["/a", "/c"]
+        assert cache.size == 22
+
+
+class TestInvalidate:
+    def test_drops_siblings_and_ancestor_listings(self):
+        cache = ResponseCache(1 << 20, EVERYTHING)
+        fill(cache, "/access/users", "/access/users/a@pve", "/access/users/b@pve", "/access/acl")
+        cache.invalidate("/access/users/a@pve")
+        assert cached(cache) == ["/access/acl"]
+
+    def test_guest_mutation_drops_the_whole_guest(self):
+        cache = ResponseCache(1 << 20, EVERYTHING)
+        fill(
+            cache,
+            "/nodes/n/qemu/100/config",
+            "/nodes/n/qemu/100/snapshot",
+            "/nodes/n/qemu/100/firewall/rules",
+            "/nodes/n/qemu/1000/config",
+            "/nodes/n/qemu",
+            "/nodes/n/lxc/100/config",
+            "/cluster/resources",
+        )
+        cache.invalidate("/nodes/n/qemu/100/snapshot/s1/rollback")
+        assert cached(cache) == [
+            "/cluster/resources",
+            "/nodes/n/lxc/100/config",
+            "/nodes/n/qemu/1000/config",
+        ]
+
+    def test_queries_of_a_path_are_dropped_with_it(self):
+        cache = ResponseCache(1 << 20, EVERYTHING)
+        cache.put("/pools", {"type": "qemu"}, b"{}", cache.generation)
+        cache.invalidate("/pools/dev")
+        assert cached(cache) == []
+        assert cache.size == 0
+
+
+class TestGeneration:
+    def test_body_fetched_across_a_mutation_is_not_stored(self):
+        cache = ResponseCache(1 << 20, EVERYTHING)
+        generation = cache.generation
+        cache.invalidate("/access/users/a@pve")
+        cache.put("/access/users", None, b"stale", generation)
+        assert cache.get("/access/users", None) is None
+
+    async def test_get_racing_a_mutation_is_not_cached(self, make_client):
+        release = asyncio.Event()
+        requests = []
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.url.path))
+            if request.method == "GET":
+                await release.wait()
+            return httpx.Response(200, json={"data": request.method})
+
+        proxmox = make_client(responder)
+        read = asyncio.create_task(proxmox.get("/access/users"))
+        await asyncio.sleep(0.01)
+        await proxmox.put("/access/users/a@pve", {"comment": "x"})
+        release.set()
+        assert await read == {"data": "GET"}
+        assert proxmox.cache.get("/access/users", None) is None
+
+        await proxmox.get("/access/users")
+        assert proxmox.cache.get("/access/users", None) is not None
+        assert [m for m, _ in requests] == ["GET", "PUT", "GET"]
@@ -0,0 +1,173 @@
+"""ProxmoxClient: blame for node-scoped failures, and streamed listings."""
+
+import httpx
+import pytest
+
+from proxmox_mcp import client as client_module
+from proxmox_mcp.client import NodeHangError
+
+
+class TestNodeHangs:
+    async def test_hung_entry_endpoint_fails_over(self, make_client):
+        seen = []
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.host)
+            if request.url.host == "pve1":
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={"data": [{"vmid": 100}]})
+
+        proxmox = make_client(responder, hosts="pve1,pve2")
+        assert await proxmox.get("/nodes/n1/qemu") == {"data": [{"vmid": 100}]}
+        assert seen == ["pve1", "pve2"]
+        pve1, pve2 = proxmox.endpoints.endpoints
+        assert pve1.breaker.failures == 1
+        assert pve2.breaker.failures == 0
+        assert proxmox._node_breakers["n1"].failures == 0
+
+    async def test_node_is_blamed_while_its_endpoint_answers_others(self, make_client):
+        seen = []
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            if "/nodes/n1/" in request.url.path:
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={"data": []})
+
+        proxmox = make_client(responder)
+        await proxmox.get("/nodes/n2/qemu")
+        with pytest.raises(NodeHangError):
+            await proxmox.get("/nodes/n1/qemu")
+        # Not retried and not charged to the endpoint.
+        assert [p for p in seen if "/nodes/n1/" in p] == ["/api2/json/nodes/n1/qemu"]
+        assert proxmox.endpoints.endpoints[0].breaker.failures == 0
+        assert proxmox._node_breakers["n1"].failures == 1
+
+    async def test_answers_from_the_same_node_are_no_evidence(self, make_client):
+        hung = False
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            if hung:
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={"data": []})
+
+        proxmox = make_client(responder, PROXMOX_RETRIES=0)
+        await proxmox.get("/nodes/n1/status")
+        hung = True
+        with pytest.raises(httpx.ReadTimeout) as raised:
+            await proxmox.get("/nodes/n1/qemu")
+        assert not isinstance(raised.value, NodeHangError)
+        assert proxmox.endpoints.endpoints[0].breaker.failures == 1
+        assert proxmox._node_breakers["n1"].failures == 0
+
+    async def test_unreachable_node_is_blamed_on_the_node(self, make_client):
+        async def responder(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(595, text="no route to host")
+
+        proxmox = make_client(responder, PROXMOX_RETRIES=0)
+        response = await proxmox._send("GET", "/nodes/n1/qemu", None)
+        assert response.status_code == 595
+        assert proxmox._node_breakers["n1"].failures == 1
+        endpoint = proxmox.endpoints.endpoints[0]
+        assert endpoint.breaker.failures == 0
+        assert endpoint.limiter.limit == client_module.PROXMOX_CONCURRENCY_INITIAL
+
+
+class TestOverloadSignal:
+    async def test_timeouts_without_evidence_cut_the_limit(self, make_client):
+        async def responder(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        proxmox = make_client(responder, PROXMOX_RETRIES=0)
+        limiter = proxmox.endpoints.endpoints[0].limiter
+        before = limiter.limit
+        with pytest.raises(httpx.ReadTimeout):
+            await proxmox.get("/nodes/n1/qemu")
+        assert limiter.limit < before
+
+    async def test_timeouts_pinned_on_the_node_leave_the_limit(self, make_client):
+        async def responder(request: httpx.Request) -> httpx.Response:
+            if "/nodes/n1/" in request.url.path:
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={"data": []})
+
+        proxmox = make_client(responder)
+        limiter = proxmox.endpoints.endpoints[0].limiter
+        await proxmox.get("/cluster/resources")
+        before = limiter.limit
+        with pytest.raises(NodeHangError):
+            await proxmox.get("/nodes/n1/qemu")
+        assert limiter.limit == before
+
+
+async def collect(proxmox, path: str) -> list:
+    return [item async for item in proxmox.stream(path)]
+
+
+class TestStream:
+    ROWS = [{"roleid": f"role{i}", "privs": "VM.Audit"} for i in range(50)]
+
+    async def test_small_body_is_decoded_whole_and_cached(self, make_client):
+        seen = []
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"data": self.ROWS})
+
+        proxmox = make_client(responder)
+        assert await collect(proxmox, "/access/roles") == self.ROWS
+        # Replayed from the cache through the incremental parser.
+        assert await collect(proxmox, "/access/roles") == self.ROWS
+        assert len(seen) == 1
+
+    async def test_large_body_is_streamed_and_not_cached(self, make_client):
+        seen = []
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"data": self.ROWS})
+
+        proxmox = make_client(responder, PROXMOX_STREAM_BYTES=0)
+        assert await collect(proxmox, "/access/roles") == self.ROWS
+        assert await collect(proxmox, "/access/roles") == self.ROWS
+        assert len(seen) == 2
+        assert proxmox.cache.get("/access/roles", None) is None
+
+    async def test_error_status_is_raised(self, make_client):
+        async def responder(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(403, json={"data": None})
+
+        proxmox = make_client(responder)
+        with pytest.raises(httpx.HTTPStatusError):
+            await collect(proxmox, "/access/roles")
+        assert proxmox.cache.get("/access/roles", None) is None
+
+    async def test_retries_transient_status(self, make_client):
+        statuses = [503, 200]
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), json={"data": self.ROWS})
+
+        proxmox = make_client(responder, PROXMOX_STREAM_BYTES=0)
+        assert await collect(proxmox, "/access/roles") == self.ROWS
+        assert statuses == []
+        assert proxmox.retry.stats()["retries"] == 1
+
+    async def test_expired_ticket_logs_in_again(self, make_client):
+        seen = []
+
+        async def responder(request: httpx.Request) -> httpx.Response:
+            seen.append((request.method, request.url.path))
+            if request.url.path.endswith("/access/ticket"):
+                data = {"ticket": "new", "CSRFPreventionToken": "csrf"}
+                return httpx.Response(200, json={"data": data})
+            if request.headers.get("cookie") != "PVEAuthCookie=new":
+                return httpx.Response(401)
+            return httpx.Response(200, json={"data": self.ROWS})
+
+        proxmox = make_client(responder, PROXMOX_STREAM_BYTES=0)
+        proxmox.token = None
+        proxmox.ticket = "old"
+        assert await collect(proxmox, "/access/roles") == self.ROWS
+        assert [m for m, _ in seen] == ["GET", "POST", "GET"]
+        assert "retries" not in proxmox.retry.stats()  # a re-login is not a retry
@@ -0,0 +1,121 @@
+"""jsonlib: incremental parsing of a response's ``data`` array across chunk boundaries."""
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from proxmox_mcp import jsonlib
+
+DOCUMENTS = [
+    {"data": [{"vmid": 100, "name": "web", "maxmem": 2147483648, "cpu": 0.0312}]},
+    {"data": [1, -2, 3.5, 1e-07, 12345678901234567890, True, False, None]},
+    {"data": ['a"b\\c', "tab\there", "line\nbreak", "été", "snow ☃", "\U0001f600"]},
+    {"data": [{"nested": {"deep": [1, [2, [3, {}]], []]}}, [], {}]},
+    {"success": 1, "data": [{"id": "qemu/100"}], "total": 1, "message": "ok"},
+    {"data": []},
+    {"data": {"version": "8.2.4", "release": "8.2"}},
+    {"data": "UPID:pve1:0001:task"},
+    {"data": 42},
+    {"data": None},
+    {"errors": {"vmid": "invalid"}},
+    {},
+]
+
+EXPECTED = [
+    (
+        doc["data"]
+        if isinstance(doc.get("data"), list)
+        else [] if doc.get("data") is None else [doc["data"]]
+    )
+    for doc in DOCUMENTS
+]
+
+
+async def chunked(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def split_at(body: bytes, *cuts: int) -> AsyncIterator[bytes]:
+    bounds = [0, *cuts, len(body)]
+    for start, end in zip(bounds, bounds[1:], strict=False):
+        yield body[start:end]
+
+
+async def collect(chunks: AsyncIterator[bytes]) -> list:
+    return [item async for item in jsonlib.iter_data(chunks)]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize(("document", "expected"), list(zip(DOCUMENTS, EXPECTED, strict=True)))
+async def test_every_split_point(document, expected, indent):
+    body = json.dumps(document, indent=indent, ensure_ascii=False).encode()
+    for cut in range(1, len(body)):
+        assert await collect(split_at(body, cut)) == expected, f"split at {cut}"
+
+
+@pytest.mark.parametrize(("document", "expected"), list(zip(DOCUMENTS, EXPECTED, strict=True)))
+async def test_byte_at_a_time(document, expected):
+    body = json.dumps(document, ensure_ascii=False).encode()
+    assert await collect(chunked(body, 1)) == expected
+
+
+async def test_number_cut_before_its_end_is_not_taken_as_complete():
+    body = b'{"data": [12.5, 1000, -7e3]}'
+    for cut in (len(b'{"data": [1'), len(b'{"data": [12'), len(b'{"data": [12.5, 10')):
+        assert await collect(split_at(body, cut)) == [12.5, 1000, -7e3]
+
+
+async def test_multibyte_character_split_across_chunks():
+    body = json.dumps({"data": ["é☃\U0001f600"]}, ensure_ascii=False).encode()
+    start = body.index("☃".encode())
+    assert await collect(split_at(body, start + 1, start + 2)) == ["é☃\U0001f600"]
+
+
+async def test_large_listing_in_network_sized_chunks():
+    rows = [{"vmid": i, "name": f"guest-{i}", "tags": "a;b", "mem": i * 1024} for i in range(5000)]
+    body = json.dumps({"data": rows}).encode()
+    assert await collect(chunked(body, 16384)) == rows
+    assert await collect(chunked(body, 7)) == rows
+
+
+async def test_items_are_yielded_before_the_body_ends():
+    seen = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'{"data": [{"a": 1}, {"a": 2}, '
+        seen.append("second chunk requested")
+        yield b'{"a": 3}]}'
+
+    items = []
+    async for item in jsonlib.iter_data(chunks()):
+        items.append((item, list(seen)))
+    assert items[0] == ({"a": 1}, [])
+    assert items[1] == ({"a": 2}, [])
+    assert items[2] == ({"a": 3}, ["second chunk requested"])
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b'{"data": [1, 2',
+        b'{"data": [1, 2]',
+        b'{"data": [1 2]}',
+        b'["data"]',
+        b'{"data" [1]}',
+        b'{"data": ["\xc3"]}',
+    ],
+)
+async def test_malformed_or_truncated_body(body):
+    with pytest.raises(ValueError):
+        await collect(chunked(body, 3))
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+async def test_dumps_async_matches_dumps(monkeypatch, pretty):
+    monkeypatch.setattr(jsonlib, "PROXMOX_OFFLOAD_BYTES", 0)
+    monkeypatch.setattr(jsonlib, "SLICE_ITEMS", 7)
+    result = {"data": [{"vmid": i, "name": f"vm{i}"} for i in range(30)], "total": 30}
+    assert await jsonlib.dumps_async(result, pretty) == jsonlib.dumps(result, pretty)
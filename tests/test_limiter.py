@@ -0,0 +1,194 @@
+"""AIMD limiter: admission, cancellation, weighted-fair scheduling and limit adaptation."""
+
+import asyncio
+
+import pytest
+
+from proxmox_mcp.limiter import (
+    BACKGROUND,
+    BULK,
+    ERROR_DECREASE,
+    INTERACTIVE,
+    PRIORITY_WEIGHTS,
+    AIMDLimiter,
+)
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def start(limiter: AIMDLimiter, priority: str, admitted: list[str]) -> asyncio.Task[None]:
+    async def request() -> None:
+        await limiter.acquire(priority)
+        admitted.append(priority)
+
+    return asyncio.create_task(request())
+
+
+class TestAdmission:
+    async def test_admits_up_to_the_limit(self):
+        limiter = AIMDLimiter(4, 1, 8)
+        for _ in range(4):
+            await limiter.acquire(INTERACTIVE)
+        admitted: list[str] = []
+        task = start(limiter, INTERACTIVE, admitted)
+        await settle()
+        assert limiter.in_flight == 4
+        assert admitted == []
+
+        limiter.release(0.01, overloaded=False)
+        await task
+        assert admitted == [INTERACTIVE]
+        assert limiter.in_flight == 4
+
+    async def test_last_slot_is_reserved_for_interactive(self):
+        limiter = AIMDLimiter(3, 1, 8)
+        await limiter.acquire(BULK)
+        await limiter.acquire(BACKGROUND)
+        admitted: list[str] = []
+        bulk = start(limiter, BULK, admitted)
+        await settle()
+        assert admitted == []
+
+        await asyncio.wait_for(limiter.acquire(INTERACTIVE), 1)
+        assert limiter.in_flight == 3
+        bulk.cancel()
+
+    async def test_no_reserve_below_two_slots(self):
+        limiter = AIMDLimiter(1, 1, 8)
+        await asyncio.wait_for(limiter.acquire(BULK), 1)
+        assert limiter.in_flight == 1
+
+    async def test_queued_requests_are_not_overtaken(self):
+        limiter = AIMDLimiter(1, 1, 8)
+        await limiter.acquire(INTERACTIVE)
+        admitted: list[str] = []
+        first = start(limiter, BULK, admitted)
+        await settle()
+        limiter.release(None, overloaded=False)
+        # The freed slot went to the waiter, not to a newcomer.
+        second = start(limiter, INTERACTIVE, admitted)
+        await first
+        await settle()
+        assert admitted == [BULK]
+        second.cancel()
+
+    async def test_unknown_priority(self):
+        with pytest.raises(ValueError, match="Unknown priority"):
+            await AIMDLimiter(1, 1, 1).acquire("urgent")
+
+
+class TestCancellation:
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        limiter = AIMDLimiter(1, 1, 8)
+        await limiter.acquire(INTERACTIVE)
+        admitted: list[str] = []
+        cancelled = start(limiter, INTERACTIVE, admitted)
+        waiting = start(limiter, INTERACTIVE, admitted)
+        await settle()
+        cancelled.cancel()
+        await settle()
+
+        limiter.release(0.01, overloaded=False)
+        await waiting
+        assert cancelled.cancelled()
+        assert admitted == [INTERACTIVE]
+        assert limiter.in_flight == 1
+
+    async def test_slot_handed_over_to_a_cancelled_waiter_is_returned(self):
+        limiter = AIMDLimiter(1, 1, 8)
+        await limiter.acquire(INTERACTIVE)
+        admitted: list[str] = []
+        task = start(limiter, INTERACTIVE, admitted)
+        await settle()
+
+        limiter.release(0.01, overloaded=False)  # hands the slot over...
+        task.cancel()  # ...before the waiter gets to run
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert admitted == []
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(INTERACTIVE), 1)
+
+
+class TestFairness:
+    async def test_classes_share_freed_slots_by_weight(self):
+        # A single slot: no interactive reserve, every release admits exactly one.
+        limiter = AIMDLimiter(1, 1, 1)
+        await limiter.acquire(INTERACTIVE)
+        admitted: list[str] = []
+        per_class = 2 * sum(PRIORITY_WEIGHTS.values())
+        tasks = [start(limiter, c, admitted) for c in PRIORITY_WEIGHTS for _ in range(per_class)]
+        await settle()
+
+        rounds = sum(PRIORITY_WEIGHTS.values())
+        for _ in range(rounds):
+            limiter.release(None, overloaded=False)
+            await settle()
+        counts = {c: admitted.count(c) for c in PRIORITY_WEIGHTS}
+        assert counts == PRIORITY_WEIGHTS
+
+        for task in tasks:
+            task.cancel()
+
+    async def test_returning_class_gets_no_credit_for_idle_time(self):
+        limiter = AIMDLimiter(1, 1, 1)
+        await limiter.acquire(INTERACTIVE)
+        admitted: list[str] = []
+        tasks = [start(limiter, INTERACTIVE, admitted) for _ in range(20)]
+        await settle()
+        for _ in range(10):
+            limiter.release(None, overloaded=False)
+            await settle()
+        # Bulk joins late: it is interleaved at its weight, not handed a backlog of turns.
+        tasks += [start(limiter, BULK, admitted) for _ in range(5)]
+        await settle()
+        admitted.clear()
+        for _ in range(PRIORITY_WEIGHTS[INTERACTIVE] + PRIORITY_WEIGHTS[BULK]):
+            limiter.release(None, overloaded=False)
+            await settle()
+        assert admitted.count(BULK) == PRIORITY_WEIGHTS[BULK]
+
+        for task in tasks:
+            task.cancel()
+
+
+class TestAdaptation:
+    def test_overload_cuts_once_per_episode(self):
+        limiter = AIMDLimiter(8, 1, 16)
+        limiter.short = 60.0  # a long round trip keeps the episode open
+        limiter.in_flight = 2
+        limiter.release(None, overloaded=True)
+        assert limiter.limit == 8 * ERROR_DECREASE
+        limiter.release(None, overloaded=True)
+        assert limiter.limit == 8 * ERROR_DECREASE
+
+    def test_limit_never_drops_below_minimum(self):
+        limiter = AIMDLimiter(4, 3, 16)
+        limiter.in_flight = 1
+        limiter.release(None, overloaded=True)
+        assert limiter.limit == 3
+
+    def test_grows_additively_while_saturated(self):
+        limiter = AIMDLimiter(4, 1, 16)
+        for _ in range(4):
+            limiter.in_flight = 4
+            limiter.release(0.01, overloaded=False)
+        assert 4.9 < limiter.limit < 5.1
+
+    def test_does_not_grow_unless_saturated(self):
+        limiter = AIMDLimiter(4, 1, 16)
+        limiter.in_flight = 1
+        limiter.release(0.01, overloaded=False)
+        assert limiter.limit == 4
+
+    def test_rising_latency_cuts(self):
+        limiter = AIMDLimiter(10, 1, 16)
+        for _ in range(20):
+            limiter.in_flight = 1
+            limiter.release(0.01, overloaded=False)
+        limiter.in_flight = 1
+        limiter.release(1.0, overloaded=False)
+        assert limiter.limit < 10
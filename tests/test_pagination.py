@@ -0,0 +1,29 @@
+"""Snapshot pagination: first page, cursors and the reported total."""
+
+from proxmox_mcp import shaping
+from proxmox_mcp.pagination import SnapshotStore
+
+ROWS = [{"vmid": i} for i in range(10)]
+
+
+def test_pages_through_a_snapshot():
+    store = SnapshotStore(1 << 20, 60)
+    page = store.paginate("list_vms", {"data": ROWS}, 4)
+    assert page["data"] == ROWS[:4]
+    assert page["total"] == 10
+    seen = list(page["data"])
+    while "next_cursor" in page:
+        page = store.resume("list_vms", page["next_cursor"])
+        assert page["total"] == 10
+        seen += page["data"]
+    assert seen == ROWS
+
+
+def test_keeps_the_total_reported_by_a_query():
+    _, options = shaping.split_args({"query": {"offset": 0, "limit": 6}})
+    result = shaping.apply({"data": ROWS}, options)
+    store = SnapshotStore(1 << 20, 60)
+    page = store.paginate("list_vms", result, 4)
+    assert page["data"] == ROWS[:4]
+    assert page["total"] == 10
+    assert store.resume("list_vms", page["next_cursor"]) == {"data": ROWS[4:6], "total": 10}
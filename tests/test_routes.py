@@ -0,0 +1,59 @@
+"""Streaming routes: per-row shaping matches shaping the whole result afterwards."""
+
+import httpx
+import pytest
+
+from proxmox_mcp import shaping
+from proxmox_mcp.routes import Route
+
+ROWS = [
+    {"vmid": 100 + i, "name": f"vm{i}", "status": "running" if i % 3 else "stopped", "mem": i}
+    for i in range(30)
+]
+
+CALLS = [
+    {"fields": ["vmid", "name"]},
+    {"query": {"where": [{"field": "status", "value": "running"}]}},
+    {"fields": ["vmid"], "query": {"where": [{"field": "mem", "op": "ge", "value": 10}]}},
+    {"fields": ["vmid"], "query": {"order_by": ["-mem"], "limit": 5}},
+    {"fields": ["status", "count"], "query": {"group_by": ["status"]}},
+    {"query": {"where": [{"field": "status", "value": "stopped"}], "offset": 2, "limit": 3}},
+]
+
+
+@pytest.mark.parametrize("arguments", CALLS)
+async def test_streamed_shaping_matches_whole_result(make_client, arguments):
+    async def responder(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": ROWS})
+
+    proxmox = make_client(responder, PROXMOX_STREAM_BYTES=0)
+    handler = Route("GET", "/cluster/resources", stream=True).compile()
+    _, expected_options = shaping.split_args(arguments)
+    expected = shaping.apply({"data": ROWS}, expected_options)
+
+    _, options = shaping.split_args(arguments)
+    with shaping.for_call(options):
+        result = await handler({}, proxmox)
+    assert shaping.apply(result, options) == expected
+
+
+async def test_rows_are_reduced_as_they_arrive(make_client):
+    async def responder(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": ROWS})
+
+    proxmox = make_client(responder, PROXMOX_STREAM_BYTES=0)
+    handler = Route("GET", "/cluster/resources", stream=True).compile()
+    arguments = {"fields": ["vmid"], "query": {"where": [{"field": "status", "value": "stopped"}]}}
+    _, options = shaping.split_args(arguments)
+    with shaping.for_call(options):
+        result = await handler({}, proxmox)
+    assert result == {"data": [{"vmid": row["vmid"]} for row in ROWS if row["status"] == "stopped"]}
+
+
+async def test_without_a_call_every_row_is_kept(make_client):
+    async def responder(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": ROWS})
+
+    proxmox = make_client(responder)
+    handler = Route("GET", "/cluster/resources", stream=True).compile()
+    assert await handler({}, proxmox) == {"data": ROWS}
@@ -0,0 +1,87 @@
+"""Ticket cache: round trips, encryption and files that must be ignored."""
+
+import json
+import time
+
+import pytest
+
+from proxmox_mcp.ticket_cache import SALT_BYTES, TICKET_LIFETIME, TicketCache
+
+IDENTITY = "root@pam@pve1"
+
+
+def cache(tmp_path, passphrase: str = "") -> TicketCache:
+    return TicketCache(str(tmp_path / "cache" / "ticket"), IDENTITY, passphrase)
+
+
+def write(tmp_path, raw: bytes) -> None:
+    (tmp_path / "cache").mkdir(exist_ok=True)
+    (tmp_path / "cache" / "ticket").write_bytes(raw)
+
+
+class TestRoundTrip:
+    def test_plain(self, tmp_path):
+        cache(tmp_path).save("PVE:ticket", "csrf")
+        ticket, csrf_token, age = cache(tmp_path).load()
+        assert (ticket, csrf_token) == ("PVE:ticket", "csrf")
+        assert 0 <= age < 5
+
+    def test_encrypted(self, tmp_path):
+        pytest.importorskip("cryptography")
+        cache(tmp_path, "secret").save("PVE:ticket", "csrf")
+        raw = (tmp_path / "cache" / "ticket").read_bytes()
+        assert b"PVE:ticket" not in raw
+        assert cache(tmp_path, "secret").load()[:2] == ("PVE:ticket", "csrf")
+
+    def test_salt_is_random_per_file(self, tmp_path):
+        pytest.importorskip("cryptography")
+        cache(tmp_path / "a", "secret").save("t", "c")
+        cache(tmp_path / "b", "secret").save("t", "c")
+        a = (tmp_path / "a" / "cache" / "ticket").read_bytes()
+        b = (tmp_path / "b" / "cache" / "ticket").read_bytes()
+        assert a[:SALT_BYTES] != b[:SALT_BYTES]
+
+    def test_missing_file(self, tmp_path):
+        assert cache(tmp_path).load() is None
+
+    def test_other_identity(self, tmp_path):
+        cache(tmp_path).save("t", "c")
+        other = TicketCache(str(tmp_path / "cache" / "ticket"), "admin@pve@pve1")
+        assert other.load() is None
+
+    def test_expiring_ticket(self, tmp_path):
+        entry = {"identity": IDENTITY, "ticket": "t", "csrf_token": "c"}
+        write(tmp_path, json.dumps({**entry, "issued": time.time() - TICKET_LIFETIME}).encode())
+        assert cache(tmp_path).load() is None
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"",
+        b"\x00garbage",
+        b"[]",
+        b'"issued"',
+        b"null",
+        b'{"identity": "root@pam@pve1", "issued": 1}',
+        b'{"identity": "root@pam@pve1", "issued": "now", "ticket": "t", "csrf_token": "c"}',
+        b'{"identity": "root@pam@pve1", "issued": true, "ticket": "t", "csrf_token": "c"}',
+        b'{"identity": "root@pam@pve1", "issued": 1, "ticket": 7, "csrf_token": "c"}',
+    ],
+)
+def test_corrupt_file_counts_as_no_cache(tmp_path, raw):
+    write(tmp_path, raw)
+    assert cache(tmp_path).load() is None
+
+
+def test_wrong_passphrase_counts_as_no_cache(tmp_path):
+    pytest.importorskip("cryptography")
+    cache(tmp_path, "secret").save("t", "c")
+    assert cache(tmp_path, "other").load() is None
+    assert cache(tmp_path).load() is None
+
+
+def test_unsalted_file_from_older_versions_is_ignored(tmp_path):
+    pytest.importorskip("cryptography")
+    write(tmp_path, b"gAAAAAB-short")
+    assert cache(tmp_path, "secret").load() is None